@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+"""
+Fingerprinted, precompressed static assets.
+
+Stylesheets and scripts live in static/ (page styles and scripts in
+static/css/pages and static/js/pages, shared ones beside them). build()
+copies each one to static/dist under a name that carries a hash of its
+content, e.g. css/pages/index.css -> dist/css/pages/index.1a2b3c4d5e.css.
+It writes a gzip variant next to each file, and a brotli variant when the
+optional ``brotli`` package is installed. It then records the mapping in
+static/dist/manifest.json. Unchanged files are not rewritten, so a build is
+cheap enough to run at startup.
+
+Templates link assets through ``asset_url('css/pages/index.css')``. It
+returns the hashed URL, or the plain /static URL for a file that has not
+been built. AssetFiles serves /static. Hashed files are sent with a
+one-year ``immutable`` Cache-Control, because any change produces a new
+name. They come in the brotli or gzip variant the client accepts. Everything
+else is revalidated on each use.
+
+Run after editing a stylesheet or script, or at deploy time:
+
+    python assets.py build
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+
+from starlette.datastructures import Headers
+from starlette.staticfiles import StaticFiles
+
+from compression import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # optional; gzip variants are always built
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+DIST = 'dist'
+MANIFEST = 'manifest.json'
+EXTENSIONS = ('.css', '.js', '.svg')
+# Uploaded content under static/ that is not part of the build
+SKIP_DIRS = (DIST, 'gallery')
+HASH_LENGTH = 10
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, no-cache'
+# Accept-Encoding token -> suffix of the precompressed variant, best first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+_lock = threading.Lock()
+_manifest = None  # source path -> hashed path, relative to static/
+
+
+def sources(static_dir=STATIC_DIR):
+    """Asset paths relative to ``static_dir``, with forward slashes."""
+    found = []
+    for root, dirs, files in os.walk(static_dir):
+        if root == static_dir:
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if name.endswith(EXTENSIONS):
+                found.append(os.path.relpath(os.path.join(root, name), static_dir).replace(os.sep, '/'))
+    return sorted(found)
+
+
+def _write(path, make_data):
+    # Hashed names never change content, so an existing file is left alone.
+    # New ones are written under a temporary name first so a concurrent
+    # reader (another worker building at startup) never sees a partial file
+    if os.path.exists(path):
+        return
+    data = make_data()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f"{path}.{os.getpid()}.part"
+    with open(partial, 'wb') as f:
+        f.write(data)
+    os.replace(partial, path)
+
+
+def build(static_dir=STATIC_DIR):
+    """Fingerprint and precompress every asset; returns the manifest."""
+    global _manifest
+    manifest = {}
+    for source in sources(static_dir):
+        with open(os.path.join(static_dir, source), 'rb') as f:
+            data = f.read()
+        stem, extension = os.path.splitext(source)
+        hashed = f"{DIST}/{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{extension}"
+        target = os.path.join(static_dir, hashed)
+        _write(target, lambda: data)
+        _write(target + '.gz', lambda: gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write(target + '.br', lambda: brotli.compress(data))
+        manifest[source] = hashed
+    _write_manifest(static_dir, manifest)
+    with _lock:
+        _manifest = manifest
+    return manifest
+
+
+def _write_manifest(static_dir, manifest):
+    path = os.path.join(static_dir, DIST, MANIFEST)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f"{path}.{os.getpid()}.part"
+    with open(partial, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(partial, path)
+
+
+def manifest(static_dir=STATIC_DIR):
+    global _manifest
+    with _lock:
+        if _manifest is not None:
+            return _manifest
+    try:
+        with open(os.path.join(static_dir, DIST, MANIFEST)) as f:
+            loaded = json.load(f)
+    except FileNotFoundError:
+        loaded = {}
+    with _lock:
+        _manifest = loaded
+    return loaded
+
+
+def asset_url(path):
+    """URL of a static asset, fingerprinted once built."""
+    return '/static/' + manifest().get(path, path)
+
+
+class AssetFiles(StaticFiles):
+    """StaticFiles that serves built assets immutable and precompressed."""
+
+    async def get_response(self, path, scope):
+        if not path.startswith(DIST + '/') or path.endswith(('.gz', '.br')):
+            response = await super().get_response(path, scope)
+            response.headers.setdefault('cache-control', REVALIDATE)
+            return response
+
+        accepted = accepted_encodings(Headers(scope=scope).get('accept-encoding', ''))
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted and os.path.isfile(os.path.join(self.directory, path + suffix)):
+                response = await super().get_response(path + suffix, scope)
+                response.headers['content-encoding'] = encoding
+                media_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+                if media_type.startswith('text/') or media_type.endswith(('javascript', '+xml')):
+                    media_type += '; charset=utf-8'
+                response.headers['content-type'] = media_type
+                break
+        else:
+            response = await super().get_response(path, scope)
+        response.headers['cache-control'] = IMMUTABLE
+        response.headers['vary'] = 'Accept-Encoding'
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["build"])
+    parser.parse_args()
+
+    built = build()
+    total = raw = 0
+    for source, hashed in built.items():
+        size = os.path.getsize(os.path.join(STATIC_DIR, hashed))
+        best = min(os.path.getsize(os.path.join(STATIC_DIR, hashed + suffix))
+                   for _, suffix in ENCODINGS if os.path.exists(os.path.join(STATIC_DIR, hashed + suffix)))
+        raw, total = raw + size, total + best
+        print(f"{source:<45} -> {hashed:<60} {size:>7} B, {best:>6} B compressed")
+    print(f"{len(built)} assets, {raw} B, {total} B compressed{'' if brotli else ' (gzip only; install brotli for .br)'}")
+
+
+if __name__ == "__main__":
+    main()
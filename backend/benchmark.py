@@ -0,0 +1,981 @@
+#!/usr/bin/env python
+"""
+Performance benchmarks for the Society Bank backend.
+
+Each benchmark runs against a throwaway database in a temp directory, never
+against instance/society_bank.db. Run from the backend folder:
+
+    python benchmark.py engine --seconds 10 --threads 16
+    python benchmark.py concurrency --requests 2000 --concurrency 200
+    python benchmark.py query-plans
+    python benchmark.py startup --runs 5
+    python benchmark.py contention --threads 16 --operations 200
+    python benchmark.py bulk-transfer --rows 10000
+    python benchmark.py export --rows 1000000
+    python benchmark.py query-counts --members 50 500 5000
+    python benchmark.py search --members 1000000
+    python benchmark.py fd-quotes --quotes 100000
+    python benchmark.py templates --announcements 200
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import httpx
+from fastapi import FastAPI, Form
+from sqlalchemy import event, func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+import bulk_transfer
+import compression
+import dashboard
+import db
+import exports
+import ledger
+import member_list
+import models
+import page_cache
+import pagination
+import rates
+import search
+import templating
+
+
+def temp_database_url(workdir, name="bench.db"):
+    return f"sqlite:///{os.path.join(workdir, name)}"
+
+
+def seed_members(session_factory, members=200, transactions_per_account=20):
+    session = session_factory()
+    try:
+        for i in range(members):
+            member = models.Member(
+                name=f"Bench Member {i}",
+                username=f"bench{i}",
+                is_approved=True,
+                account_no=f"ACC-BENCH-{i:05d}",
+            )
+            member.accounts.append(models.Account(type='Savings', balance=Decimal('10000.00'), status='Active'))
+            session.add(member)
+        session.flush()
+        for account in session.query(models.Account).all():
+            for _ in range(transactions_per_account):
+                session.add(models.Transaction(account_id=account.id, type='Credit', amount=Decimal('100.00'), description='Seed'))
+        session.commit()
+    finally:
+        session.close()
+
+
+def run_mixed_workload(session_factory, seconds, threads, write_ratio):
+    """Deposits (balance update + transaction insert) mixed with admin list reads."""
+    session = session_factory()
+    account_ids = [row[0] for row in session.query(models.Account.id).all()]
+    session.close()
+
+    counters = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def worker(seed):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            session = session_factory()
+            try:
+                if rng.random() < write_ratio:
+                    account = session.get(models.Account, rng.choice(account_ids))
+                    account.balance += Decimal('100.00')
+                    session.add(models.Transaction(account_id=account.id, type='Credit', amount=Decimal('100.00'), description='Bench deposit'))
+                    session.commit()
+                    kind = "writes"
+                else:
+                    session.query(models.Transaction).order_by(models.Transaction.created_at.desc()).limit(100).all()
+                    session.query(models.Member).filter_by(is_approved=True).count()
+                    kind = "reads"
+            except Exception:
+                session.rollback()
+                kind = "errors"
+            finally:
+                session.close()
+            with lock:
+                counters[kind] += 1
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return counters
+
+
+def bench_engine(args):
+    print(f"Mixed workload: {args.threads} threads, {args.seconds}s, {args.write_ratio:.0%} writes")
+    print(f"{'profile':<12}{'reads/s':>10}{'writes/s':>10}{'errors':>8}")
+    for profile in args.profiles:
+        workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+        try:
+            engine = db.build_engine(temp_database_url(workdir), profile=profile)
+            db.Base.metadata.create_all(bind=engine)
+            session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            seed_members(session_factory, members=args.members)
+            counters = run_mixed_workload(session_factory, args.seconds, args.threads, args.write_ratio)
+            engine.dispose()
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        print(f"{profile:<12}{counters['reads'] / args.seconds:>10.0f}"
+              f"{counters['writes'] / args.seconds:>10.0f}{counters['errors']:>8}")
+
+
+def build_deposit_app(session_factory, async_session_factory, latency):
+    """The same deposit round trip served by a sync and an async handler.
+
+    ``latency`` models the network round trip to a remote database server:
+    the sync handler blocks its threadpool worker for it, the async handler
+    yields to the event loop.
+    """
+    app = FastAPI()
+
+    @app.post("/sync/deposit")
+    def sync_deposit(account_id: int = Form(...), amount: Decimal = Form(...)):
+        db = session_factory()
+        try:
+            account = db.get(models.Account, account_id)
+            if latency:
+                time.sleep(latency)
+            account.balance += amount
+            db.add(models.Transaction(account_id=account.id, type='Credit', amount=amount, description='Bench deposit'))
+            db.commit()
+            return {'ok': True, 'new_balance': account.balance}
+        finally:
+            db.close()
+
+    @app.post("/async/deposit")
+    async def async_deposit(account_id: int = Form(...), amount: Decimal = Form(...)):
+        async with async_session_factory() as db:
+            account = (await db.execute(select(models.Account).filter_by(id=account_id))).scalars().first()
+            if latency:
+                await asyncio.sleep(latency)
+            account.balance += amount
+            db.add(models.Transaction(account_id=account.id, type='Credit', amount=amount, description='Bench deposit'))
+            await db.commit()
+            return {'ok': True, 'new_balance': account.balance}
+
+    return app
+
+
+async def drive_requests(app, path, account_ids, total, concurrency):
+    latencies = []
+    failures = 0
+    queue = asyncio.Queue()
+    for n in range(total):
+        queue.put_nowait(account_ids[n % len(account_ids)])
+
+    async def client_loop(client):
+        nonlocal failures
+        while not queue.empty():
+            account_id = queue.get_nowait()
+            started = time.perf_counter()
+            response = await client.post(path, data={'account_id': account_id, 'amount': 100})
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                failures += 1
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "failures": failures,
+    }
+
+
+def bench_concurrency(args):
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    try:
+        url = temp_database_url(workdir)
+        # Size both pools to the client concurrency so the comparison measures
+        # the handlers rather than waiting for a free connection.
+        pool = {"pool_size": args.concurrency, "max_overflow": 0}
+        engine = db.build_engine(url, profile=args.profile, **pool)
+        async_engine = db.build_async_engine(url, profile=args.profile, **pool)
+        db.Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+        seed_members(session_factory, members=args.members, transactions_per_account=0)
+        session = session_factory()
+        account_ids = [row[0] for row in session.query(models.Account.id).all()]
+        session.close()
+
+        app = build_deposit_app(session_factory, async_session_factory, args.latency_ms / 1000)
+        print(f"{args.requests} deposits at concurrency {args.concurrency}, "
+              f"{args.latency_ms}ms simulated DB latency, profile={args.profile}")
+        print(f"{'handler':<10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'failed':>8}")
+        for mode in ("sync", "async"):
+            result = asyncio.run(drive_requests(app, f"/{mode}/deposit", account_ids, args.requests, args.concurrency))
+            print(f"{mode:<10}{result['rps']:>10.0f}{result['p50']:>10.1f}{result['p99']:>10.1f}{result['failures']:>8}")
+        engine.dispose()
+        asyncio.run(async_engine.dispose())
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# Hot queries from main.py and the index each one should be served by
+HOT_QUERIES = [
+    ("dashboard transactions", "ix_transaction_account_id_created_at",
+     select(models.Transaction).filter_by(account_id=1).order_by(models.Transaction.created_at.desc())),
+    ("dashboard freshness check", "ix_transaction_account_id_created_at", dashboard.freshness_query(1)),
+    ("member account lookup", "ix_account_member_id",
+     select(models.Account).filter_by(member_id=1).limit(1)),
+    ("member loans", "ix_loan_member_id", select(models.Loan).filter_by(member_id=1)),
+    ("member deposits", "ix_deposit_member_id", select(models.Deposit).filter_by(member_id=1)),
+    ("member shares", "ix_share_member_id", select(models.Share).filter_by(member_id=1)),
+    ("pending loans", "ix_loan_status_created_at", select(models.Loan).filter_by(status='Pending')),
+    ("pending deposits", "ix_deposit_status_created_at", select(models.Deposit).filter_by(status='Pending')),
+    ("pending shares", "ix_share_status_created_at", select(models.Share).filter_by(status='Pending')),
+    ("approved member count", "ix_member_is_approved",
+     select(func.count()).select_from(models.Member).filter_by(is_approved=True)),
+    ("recent transactions", "ix_transaction_created_at",
+     select(models.Transaction).order_by(models.Transaction.created_at.desc()).limit(100)),
+    ("loan management list", "ix_loan_created_at", select(models.Loan).order_by(models.Loan.created_at.desc())),
+    ("fd applications list", "ix_deposit_created_at", select(models.Deposit).order_by(models.Deposit.created_at.desc())),
+    ("share applications list", "ix_share_created_at", select(models.Share).order_by(models.Share.created_at.desc())),
+    ("loan repayments", "ix_loan_repayment_loan_id", select(models.LoanRepayment).filter_by(loan_id=1)),
+    ("homepage announcements", "ix_announcement_created_at",
+     select(models.Announcement).order_by(models.Announcement.created_at.desc())),
+    # Admin counters (see stats.py)
+    ("member approval counts", "ix_member_is_approved",
+     select(models.Member.is_approved, func.count()).group_by(models.Member.is_approved)),
+    ("loan status counts", "ix_loan_status_created_at",
+     select(models.Loan.status, func.count()).group_by(models.Loan.status)),
+    ("deposit status counts", "ix_deposit_status_created_at",
+     select(models.Deposit.status, func.count()).group_by(models.Deposit.status)),
+    ("share status counts", "ix_share_status_created_at",
+     select(models.Share.status, func.count()).group_by(models.Share.status)),
+    # Keyset pages deep into each list (see pagination.py)
+    ("transactions page", "ix_transaction_created_at",
+     pagination.keyset(select(models.Transaction), models.Transaction, pagination.encode_cursor([datetime(2026, 1, 1), 500]))),
+    ("member transactions page", "ix_transaction_account_id_created_at",
+     pagination.keyset(select(models.Transaction).filter_by(account_id=1), models.Transaction,
+                       pagination.encode_cursor([datetime(2026, 1, 1), 500]))),
+    ("loans page", "ix_loan_created_at",
+     pagination.keyset(select(models.Loan), models.Loan, pagination.encode_cursor([datetime(2026, 1, 1), 500]))),
+    ("pending loans page", "ix_loan_status_created_at",
+     pagination.keyset(select(models.Loan).filter_by(status='Pending'), models.Loan,
+                       pagination.encode_cursor([datetime(2026, 1, 1), 500]))),
+    ("accounts page", "ix_account_created_at",
+     pagination.keyset(select(models.Account), models.Account, pagination.encode_cursor([datetime(2026, 1, 1), 500]))),
+]
+
+
+def check_query_plans(args):
+    """Fail unless every hot query is planned against its index on a migrated schema."""
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    failures = 0
+    try:
+        url = temp_database_url(workdir)
+        db.upgrade_database(url)
+        engine = db.build_engine(url, profile="default")
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        seed_members(session_factory, members=args.members, transactions_per_account=5)
+        with engine.connect() as connection:
+            connection.execute(text("ANALYZE"))
+            for label, index_name, query in HOT_QUERIES:
+                sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+                plan = " | ".join(row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+                ok = index_name in plan
+                failures += not ok
+                print(f"{'ok  ' if ok else 'FAIL'} {label:<26} {plan}")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if failures:
+        print(f"{failures} hot queries are not using their index")
+        sys.exit(1)
+
+
+STARTUP_PROBE = """
+import json
+from fastapi.testclient import TestClient
+import main
+with TestClient(main.app):
+    print(json.dumps(main.app.state.startup_timings))
+"""
+
+
+def bench_startup(args):
+    """Cold-start a fresh interpreter per run, like an autoscaled worker."""
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    try:
+        url = temp_database_url(workdir)
+        db.upgrade_database(url)
+        scenarios = [
+            ("migrate + seed", {"AUTO_MIGRATE": "true", "SEED_INTEREST_RATES": "true"}),
+            ("seed only", {"AUTO_MIGRATE": "false", "SEED_INTEREST_RATES": "true"}),
+            ("skip both", {"AUTO_MIGRATE": "false", "SEED_INTEREST_RATES": "false"}),
+        ]
+        print(f"Median of {args.runs} cold starts against an up-to-date database")
+        print(f"{'scenario':<16}{'import':>10}{'migrate':>10}{'seed':>10}{'startup':>10}  (ms)")
+        for label, overrides in scenarios:
+            env = dict(os.environ, DATABASE_URL=url, **overrides)
+            runs = []
+            for _ in range(args.runs):
+                output = subprocess.run(
+                    [sys.executable, "-c", STARTUP_PROBE], env=env, check=True,
+                    capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                ).stdout
+                runs.append(json.loads(output.strip().splitlines()[-1]))
+            medians = {key: statistics.median(run.get(key, 0) for run in runs)
+                       for key in ("import_ms", "migrate_ms", "seed_ms", "startup_ms")}
+            print(f"{label:<16}{medians['import_ms']:>10.1f}{medians['migrate_ms']:>10.1f}"
+                  f"{medians['seed_ms']:>10.1f}{medians['startup_ms']:>10.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def hammer_accounts(session_factory, threads, operations, operation):
+    """Run ``operation(session, rng)`` from many threads, retrying when the database is busy."""
+    counters = {"ok": 0, "insufficient": 0, "retries": 0}
+    lock = threading.Lock()
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(operations):
+            while True:
+                session = session_factory()
+                try:
+                    operation(session, rng)
+                    session.commit()
+                    outcome = "ok"
+                except ledger.InsufficientFundsError:
+                    session.rollback()
+                    outcome = "insufficient"
+                except OperationalError:
+                    # SQLite reports "database is locked" when a writer gives up waiting
+                    session.rollback()
+                    with lock:
+                        counters["retries"] += 1
+                    continue
+                finally:
+                    session.close()
+                with lock:
+                    counters[outcome] += 1
+                break
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    counters["seconds"] = time.perf_counter() - started
+    return counters
+
+
+def naive_withdrawal(session, account_id, amount):
+    """The read-check-write withdrawal the endpoints used before atomic updates."""
+    account = session.get(models.Account, account_id)
+    if account.balance < amount:
+        raise ledger.InsufficientFundsError()
+    account.balance -= amount
+    session.add(models.Transaction(account_id=account.id, type='Debit', amount=amount, description='Bench withdrawal'))
+
+
+def bench_contention(args):
+    """Hammer one account from many threads and check nothing was lost or overdrawn."""
+    amount = Decimal('100.00')
+    attempts = args.threads * args.operations
+    # Enough for half the withdrawals, so the balance check is contended too
+    opening = amount * (attempts // 2)
+    failures = 0
+    print(f"{args.threads} threads x {args.operations} operations, profile={args.profile}")
+    print(f"{'scenario':<20}{'ops/s':>10}{'ok':>8}{'refused':>9}{'retries':>9}{'final':>14}{'expected':>14}  result")
+
+    scenarios = [
+        ("naive withdraw", lambda session, rng, ids: naive_withdrawal(session, ids[0], amount)),
+        ("atomic withdraw", lambda session, rng, ids: ledger.post_withdrawal(
+            session, session.get(models.Account, ids[0]), amount, 'Bench withdrawal')),
+        ("atomic transfer", lambda session, rng, ids: ledger.post_transfer(
+            session, *(session.get(models.Account, account_id) for account_id in rng.sample(ids, 2)),
+            amount, 'Bench transfer out', 'Bench transfer in')),
+    ]
+    for label, operation in scenarios:
+        workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+        try:
+            engine = db.build_engine(temp_database_url(workdir), profile=args.profile,
+                                     pool_size=args.threads, max_overflow=0)
+            db.Base.metadata.create_all(bind=engine)
+            session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            session = session_factory()
+            member = models.Member(name="Contended Member", username="contended", is_approved=True)
+            accounts = [models.Account(type='Savings', balance=Decimal('0.00'), status='Active') for _ in range(2)]
+            member.accounts.extend(accounts)
+            session.add(member)
+            session.flush()
+            # Open through the journal so the ledger check below starts clean
+            for account in accounts:
+                ledger.post_deposit(session, account, opening, 'Opening balance')
+            session.commit()
+            account_ids = [account.id for account in accounts]
+            session.close()
+
+            counters = hammer_accounts(session_factory, args.threads, args.operations,
+                                       lambda session, rng: operation(session, rng, account_ids))
+
+            session = session_factory()
+            balances = [session.get(models.Account, account_id).balance for account_id in account_ids]
+            problems = ledger.verify(session) if label.startswith("atomic") else []
+            session.close()
+            engine.dispose()
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        if label.endswith("transfer"):
+            # Transfers move money between the two accounts; the total is conserved
+            final, expected = sum(balances), opening * 2
+        else:
+            final, expected = balances[0], opening - amount * counters["ok"]
+        ok = final == expected and min(balances) >= 0 and not problems
+        failures += label.startswith("atomic") and not ok
+        print(f"{label:<20}{attempts / counters['seconds']:>10.0f}{counters['ok']:>8}{counters['insufficient']:>9}"
+              f"{counters['retries']:>9}{final:>14}{expected:>14}  {'ok' if ok else 'LOST UPDATES'}")
+        for problem in problems[:5]:
+            print(f"    {problem}")
+    if failures:
+        sys.exit(1)
+
+
+def bench_bulk_transfer(args):
+    """A payroll batch through bulk_transfer against the same credits posted one request at a time."""
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    try:
+        engine = db.build_engine(temp_database_url(workdir), profile=args.profile)
+        db.Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        seed_members(session_factory, members=args.members, transactions_per_account=0)
+        rows = [{'account_no': f"ACC-BENCH-{i % args.members:05d}", 'amount': '1500.00'} for i in range(args.rows)]
+        print(f"Crediting {args.rows} rows across {args.members} members, profile={args.profile}")
+        print(f"{'method':<28}{'rows':>8}{'seconds':>10}{'rows/s':>10}")
+
+        started = time.perf_counter()
+        report = bulk_transfer.run_bulk_transfer(session_factory, rows, 'salary', chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - started
+        print(f"{f'bulk (chunks of {args.chunk_size})':<28}{report['credited']:>8}{elapsed:>10.2f}{report['credited'] / elapsed:>10.0f}")
+
+        # The per-request path: look up member and account, post, commit
+        baseline_rows = rows[:args.baseline_rows]
+        started = time.perf_counter()
+        for row in baseline_rows:
+            session = session_factory()
+            try:
+                member = session.query(models.Member).filter_by(account_no=row['account_no']).first()
+                account = session.query(models.Account).filter_by(member_id=member.id).first()
+                ledger.post_deposit(session, account, Decimal(row['amount']), 'Salary credit')
+                session.commit()
+            finally:
+                session.close()
+        elapsed = time.perf_counter() - started
+        print(f"{'one request per row':<28}{len(baseline_rows):>8}{elapsed:>10.2f}{len(baseline_rows) / elapsed:>10.0f}")
+
+        # Seeded balances predate the journal, so compare totals rather than ledger.verify()
+        session = session_factory()
+        expected = Decimal('10000.00') * args.members + Decimal('1500.00') * (report['credited'] + len(baseline_rows))
+        total = session.scalar(select(func.sum(models.Account.balance)))
+        credited = session.scalar(select(func.sum(models.Posting.amount)).where(models.Posting.account_id.isnot(None)))
+        session.close()
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    ok = total == expected and credited == Decimal('1500.00') * (report['credited'] + len(baseline_rows))
+    print(f"Balances {'match' if ok else 'DO NOT match'} the credits posted ({total} vs {expected})")
+    if not ok:
+        sys.exit(1)
+
+
+def buffered_transactions_csv(session_factory):
+    """The export as it was: every ORM object loaded, the whole CSV built in one buffer."""
+    session = session_factory()
+    try:
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['ID', 'Account ID', 'Type', 'Amount', 'Description', 'Created At'])
+        for txn in session.query(models.Transaction).all():
+            writer.writerow([txn.id, txn.account_id, txn.type, f"{txn.amount:.2f}", txn.description or '',
+                             txn.created_at.strftime('%Y-%m-%d %H:%M:%S') if txn.created_at else ''])
+        yield output.getvalue()
+    finally:
+        session.close()
+
+
+def bench_export(args):
+    """Time-to-first-byte, total time and peak Python memory of the transactions CSV export."""
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    try:
+        engine = db.build_engine(temp_database_url(workdir), profile="default")
+        db.Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        seed_members(session_factory, members=100, transactions_per_account=0)
+        now = datetime.utcnow()
+        with engine.begin() as connection:
+            for start in range(0, args.rows, 50000):
+                connection.execute(models.Transaction.__table__.insert(), [
+                    {'account_id': i % 100 + 1, 'type': 'Credit' if i % 3 else 'Debit', 'amount': Decimal('125.50'),
+                     'description': f'Bench transaction {i}', 'created_at': now - timedelta(seconds=i)}
+                    for i in range(start, min(start + 50000, args.rows))
+                ])
+        print(f"Transactions export of {args.rows} rows")
+        print(f"{'method':<12}{'first rows ms':>15}{'total s':>10}{'peak MB':>10}{'output MB':>11}")
+        for label, chunks in (
+            ("streaming", lambda: exports.stream_csv(exports.transactions_export(), bind=engine,
+                                                      chunk_rows=args.chunk_rows)),
+            ("buffered", lambda: buffered_transactions_csv(session_factory)),
+        ) + tuple(
+            (fmt, lambda fmt=fmt: exports.stream_columnar(exports.transactions_export(), fmt, bind=engine))
+            for fmt in ("parquet", "arrow") if exports.columnar_available()
+        ):
+            started = time.perf_counter()
+            first_rows, size = None, 0
+            for chunk in chunks():
+                if first_rows is None:
+                    first_rows = time.perf_counter() - started
+                size += len(chunk)
+            elapsed = time.perf_counter() - started
+            # Second pass under tracemalloc, which would skew the timings above
+            tracemalloc.start()
+            for chunk in chunks():
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label:<12}{first_rows * 1000:>15.1f}{elapsed:>10.2f}{peak / 2**20:>10.1f}{size / 2**20:>11.1f}")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+class QueryCounter:
+    """Counts the statements an engine executes inside a ``with`` block."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _count(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+
+def check_query_counts(args):
+    """Fail if a listing page issues more queries as the member table grows."""
+    from fastapi.testclient import TestClient
+    import main as app_main
+
+    print(f"{'members':>9}{'page':>6}{'queries':>9}{'ms':>9}")
+    counts, dashboard_counts, cached_dashboard_counts, cached_counts = set(), set(), set(), set()
+    for size in args.members:
+        workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+        try:
+            engine = db.build_engine(temp_database_url(workdir), profile="default")
+            db.Base.metadata.create_all(bind=engine)
+            session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            seed_members(session_factory, members=size, transactions_per_account=5)
+            session = session_factory()
+            for member_id in session.scalars(select(models.Member.id)):
+                session.add(models.Loan(member_id=member_id, amount=Decimal('50000.00'), interest_rate=9.0, tenure_months=24))
+                session.add(models.Deposit(member_id=member_id, amount=Decimal('10000.00'), type='Fixed'))
+            session.commit()
+            session.close()
+
+            def scratch_db():
+                session = session_factory()
+                try:
+                    yield session
+                finally:
+                    session.close()
+
+            app_main.app.dependency_overrides[app_main.get_db] = scratch_db
+            client = TestClient(app_main.app)
+            client.cookies.set("is_admin", "true")
+            last_page = max(1, -(-size // member_list.MEMBERS_PER_PAGE))
+            for page in (1, last_page):
+                with QueryCounter(engine) as counter:
+                    started = time.perf_counter()
+                    response = client.get("/members", params={"page": page})
+                    elapsed = (time.perf_counter() - started) * 1000
+                response.raise_for_status()
+                counts.add(counter.count)
+                print(f"{size:>9}{page:>6}{counter.count:>9}{elapsed:>9.1f}")
+
+            # Member dashboard: a cold load, then one served from the cache
+            # after its one freshness check
+            dashboard.clear()
+            client.cookies.set("member_id", "1")
+            for label, expected in (("dash", dashboard_counts), ("dash*", cached_dashboard_counts)):
+                with QueryCounter(engine) as counter:
+                    started = time.perf_counter()
+                    response = client.get("/member-dashboard")
+                    elapsed = (time.perf_counter() - started) * 1000
+                response.raise_for_status()
+                expected.add(counter.count)
+                print(f"{size:>9}{label:>6}{counter.count:>9}{elapsed:>9.1f}")
+
+            # FD rates once the rate book is loaded, and the cached home page:
+            # no queries at all
+            rates.clear()
+            page_cache.clear()
+            for label, path in (("rate*", "/api/fd-rates"), ("home*", "/")):
+                client.get(path).raise_for_status()
+                with QueryCounter(engine) as counter:
+                    started = time.perf_counter()
+                    response = client.get(path)
+                    elapsed = (time.perf_counter() - started) * 1000
+                response.raise_for_status()
+                cached_counts.add(counter.count)
+                print(f"{size:>9}{label:>6}{counter.count:>9}{elapsed:>9.1f}")
+            engine.dispose()
+        finally:
+            app_main.app.dependency_overrides.clear()
+            shutil.rmtree(workdir, ignore_errors=True)
+    if len(counts) > 1 or len(dashboard_counts) > 1:
+        print(f"Query count varies with member count: /members {sorted(counts)}, dashboard {sorted(dashboard_counts)}")
+        sys.exit(1)
+    if cached_dashboard_counts != {1}:
+        print(f"A cached dashboard should cost one freshness check, not {sorted(cached_dashboard_counts)} queries")
+        sys.exit(1)
+    if cached_counts != {0}:
+        print(f"/api/fd-rates or / queried the database when served from memory: {sorted(cached_counts)}")
+        sys.exit(1)
+    print(f"Query count is constant: {counts.pop()} per /members page, {dashboard_counts.pop()} per uncached dashboard"
+          " (dash* = served from cache after one freshness check, rate* = /api/fd-rates from the rate book, home* = / from the page cache)")
+
+
+FIRST_NAMES = ["Harshan", "Ananya", "Ravi", "Lakshmi", "Suresh", "Deepa", "Kiran", "Meena", "Arjun", "Priya",
+               "Mahesh", "Kavya", "Vinay", "Shruti", "Naveen", "Divya", "Prakash", "Asha", "Girish", "Pooja"]
+LAST_NAMES = ["Gowda", "Rao", "Shetty", "Nayak", "Hegde", "Kumar", "Reddy", "Iyer", "Bhat", "Naik"]
+
+
+def seed_search_members(engine, members, batch=50000):
+    """Insert members with varied names, usernames, account numbers, mobiles and PANs through Core."""
+    rng = random.Random(7)
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    table = models.Member.__table__
+    with engine.begin() as connection:
+        for start in range(0, members, batch):
+            rows = []
+            for i in range(start, min(start + batch, members)):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                rows.append({
+                    "name": f"{first} {last}",
+                    "username": f"{first.lower()}.{last.lower()}{i}",
+                    "account_no": f"ACC-{i:07d}",
+                    "mobile": f"9{rng.randrange(10 ** 9):09d}",
+                    "pan": "".join(rng.choice(letters) for _ in range(5)) + f"{rng.randrange(10000):04d}" + rng.choice(letters),
+                    "is_approved": True,
+                })
+            connection.execute(table.insert(), rows)
+
+
+def bench_search(args):
+    """Typeahead latency on a large member table, per kind of query."""
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    try:
+        url = temp_database_url(workdir)
+        db.upgrade_database(url)
+        engine = db.build_engine(url, profile="production")
+        started = time.perf_counter()
+        seed_search_members(engine, args.members)
+        print(f"Seeded and indexed {args.members} members in {time.perf_counter() - started:.1f}s")
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        sample = session.execute(
+            select(models.Member.name, models.Member.username, models.Member.account_no, models.Member.mobile, models.Member.pan)
+            .where(models.Member.id.in_(random.Random(3).sample(range(1, args.members + 1), min(args.queries, args.members))))
+        ).all()
+        kinds = {
+            "name prefix (2 chars)": lambda m: m.name[:2],
+            "first + last prefix": lambda m: f"{m.name.split()[0][:3]} {m.name.split()[1][:3]}",
+            "full name": lambda m: m.name,
+            "exact username": lambda m: m.username,
+            "account no prefix": lambda m: m.account_no[:9],
+            "exact account no": lambda m: m.account_no,
+            "mobile substring": lambda m: m.mobile[3:8],
+            "PAN": lambda m: m.pan,
+        }
+        print(f"{'query':<24}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}{'hits':>7}")
+        worst = 0
+        for label, make_query in kinds.items():
+            timings, hits = [], 0
+            for member in sample:
+                started = time.perf_counter()
+                results = search.search(session, make_query(member))
+                timings.append((time.perf_counter() - started) * 1000)
+                hits += bool(results)
+            timings.sort()
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            worst = max(worst, p95)
+            print(f"{label:<24}{statistics.median(timings):>9.2f}{p95:>9.2f}{timings[-1]:>9.2f}{hits:>7}")
+        session.close()
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if worst > args.budget_ms:
+        print(f"p95 {worst:.2f} ms is over the {args.budget_ms} ms budget")
+        sys.exit(1)
+
+
+def bench_fd_quotes(args):
+    """FD rate quotes per second: the rate book's bisect lookup against a query per quote."""
+    import main as app_main
+
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    try:
+        url = temp_database_url(workdir)
+        db.upgrade_database(url)
+        engine = db.build_engine(url, profile="production")
+        rows = [
+            {'fd_type': fd_type, 'tenure_months': tenure_months, 'tenure_years': tenure_years, 'interest_rate': rate}
+            for fd_type, tenure_months, tenure_years, rate in app_main.DEFAULT_FD_RATES
+        ]
+        # Extra monthly slabs per type, to show the lookup does not grow with the slab count
+        fd_types = sorted({row['fd_type'] for row in rows})
+        rows += [
+            {'fd_type': fd_type, 'tenure_months': 12 * 10 + month, 'tenure_years': None, 'interest_rate': 8.0}
+            for fd_type in fd_types for month in range(1, args.extra_slabs + 1)
+        ]
+        with engine.begin() as connection:
+            connection.execute(models.FDInterestRate.__table__.insert(), rows)
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        rng = random.Random(11)
+        quotes = [(rng.choice(fd_types), rng.randrange(3, 12 * 10 + args.extra_slabs + 12)) for _ in range(args.quotes)]
+
+        rates.clear()
+        book = rates.book(session)
+        started = time.perf_counter()
+        quoted = [rates.fd_rate(book, fd_type, months) for fd_type, months in quotes]
+        matrix_seconds = time.perf_counter() - started
+
+        # The old way: fetch the type's slabs and scan them for the tenure, per quote
+        sample = quotes[:min(len(quotes), args.query_quotes)]
+        started = time.perf_counter()
+        for (fd_type, months), expected in zip(sample, quoted):
+            slabs = session.execute(
+                select(models.FDInterestRate.tenure_months, models.FDInterestRate.tenure_years, models.FDInterestRate.interest_rate)
+                .where(models.FDInterestRate.fd_type == fd_type)
+            ).all()
+            best = None
+            for tenure_months, tenure_years, rate in slabs:
+                tenure = tenure_months or tenure_years * 12
+                if tenure <= months and (best is None or tenure >= best[0]):
+                    best = (tenure, rate)
+            assert (best[1] if best else None) == expected, (fd_type, months, best, expected)
+        query_seconds = time.perf_counter() - started
+        session.close()
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    slab_count = len(rows) // len(fd_types)
+    matrix_rate = len(quotes) / matrix_seconds
+    print(f"{len(fd_types)} FD types, ~{slab_count} slabs each")
+    print(f"{'lookup':<22}{'quotes':>9}{'quotes/s':>12}{'us/quote':>10}")
+    print(f"{'rate book bisect':<22}{len(quotes):>9}{matrix_rate:>12,.0f}{matrix_seconds / len(quotes) * 1e6:>10.2f}")
+    print(f"{'query + scan':<22}{len(sample):>9}{len(sample) / query_seconds:>12,.0f}{query_seconds / len(sample) * 1e6:>10.2f}")
+    if matrix_rate < args.min_quotes_per_second:
+        print(f"{matrix_rate:,.0f} quotes/s is under the {args.min_quotes_per_second:,} quotes/s floor")
+        sys.exit(1)
+
+
+def bench_templates(args):
+    """Per-template compile, bytecode-load and render times, and public page sizes and times with each encoding."""
+    from fastapi.testclient import TestClient
+    import main as app_main
+
+    def load_ms(make_env, name):
+        times = []
+        for _ in range(args.runs):
+            env = make_env()
+            started = time.perf_counter()
+            env.get_template(name)
+            times.append((time.perf_counter() - started) * 1000)
+        return statistics.median(times)
+
+    workdir = tempfile.mkdtemp(prefix="society_bank_bench_")
+    try:
+        cache_dir = os.path.join(workdir, "template_cache")
+        templating.precompile(templating.build_environment(cache_dir=cache_dir))
+        warm = templating.build_environment(cache_dir=None, auto_reload=False)
+        templating.precompile(warm)
+
+        # A template's first request pays its load (compile or bytecode) plus
+        # the render; later ones only the in-memory lookup plus the render.
+        # Render is timed with an empty context, "-" where the template needs
+        # request data
+        print(f"{'template':<36}{'compile ms':>12}{'bytecode ms':>13}{'memory us':>11}{'render ms':>11}")
+        totals = [0.0, 0.0]
+        for name in warm.list_templates(extensions=['html']):
+            compiled = load_ms(lambda: templating.build_environment(cache_dir=None), name)
+            cached = load_ms(lambda: templating.build_environment(cache_dir=cache_dir), name)
+            started = time.perf_counter()
+            for _ in range(args.runs):
+                template = warm.get_template(name)
+            memory_us = (time.perf_counter() - started) / args.runs * 1e6
+            try:
+                started = time.perf_counter()
+                for _ in range(args.runs):
+                    template.render()
+                render = f"{(time.perf_counter() - started) / args.runs * 1000:.2f}"
+            except Exception:
+                render = "-"
+            totals[0] += compiled
+            totals[1] += cached
+            print(f"{name:<36}{compiled:>12.2f}{cached:>13.2f}{memory_us:>11.1f}{render:>11}")
+        print(f"{'all templates':<36}{totals[0]:>12.1f}{totals[1]:>13.1f}")
+
+        engine = db.build_engine(temp_database_url(workdir), profile="default")
+        db.Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        session = session_factory()
+        session.execute(models.FDInterestRate.__table__.insert(), [
+            {'fd_type': fd_type, 'tenure_months': tenure_months, 'tenure_years': tenure_years, 'interest_rate': rate}
+            for fd_type, tenure_months, tenure_years, rate in app_main.DEFAULT_FD_RATES
+        ])
+        session.add_all(
+            models.Announcement(message=f"Annual general meeting notice number {i}. " * 4)
+            for i in range(args.announcements)
+        )
+        session.commit()
+        session.close()
+
+        def scratch_db():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app_main.app.dependency_overrides[app_main.get_db] = scratch_db
+        client = TestClient(app_main.app)
+        page_cache.clear()
+        rates.clear()
+        print()
+        print(f"{'page':<14}{'encoding':<10}{'bytes':>9}{'ms':>8}")
+        for path in ("/", "/api/fd-rates"):
+            for encoding in ("identity", "gzip", "br"):
+                if encoding == "br" and compression.brotli is None:
+                    continue
+                headers = {"Accept-Encoding": encoding}
+                client.get(path, headers=headers).raise_for_status()
+                times = []
+                for _ in range(args.runs):
+                    started = time.perf_counter()
+                    response = client.get(path, headers=headers)
+                    times.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+                # httpx decodes the body; the header says how many bytes were sent
+                sent = int(response.headers.get("content-length", len(response.content)))
+                print(f"{path:<14}{response.headers.get('content-encoding', 'identity'):<10}{sent:>9}{statistics.median(times):>8.2f}")
+        engine.dispose()
+    finally:
+        app_main.app.dependency_overrides.clear()
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(f"Responses under {compression.COMPRESS_MIN_BYTES} B go out uncompressed; / is compressed once per page cache entry")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    engine_parser = subparsers.add_parser("engine", help="compare DB engine profiles under a mixed read/write load")
+    engine_parser.add_argument("--profiles", nargs="+", default=sorted(db.ENGINE_PROFILES))
+    engine_parser.add_argument("--seconds", type=float, default=5)
+    engine_parser.add_argument("--threads", type=int, default=8)
+    engine_parser.add_argument("--members", type=int, default=200)
+    engine_parser.add_argument("--write-ratio", type=float, default=0.2)
+    engine_parser.set_defaults(func=bench_engine)
+
+    concurrency_parser = subparsers.add_parser("concurrency", help="compare sync and async deposit handlers under concurrent requests")
+    concurrency_parser.add_argument("--requests", type=int, default=1000)
+    concurrency_parser.add_argument("--concurrency", type=int, default=100)
+    concurrency_parser.add_argument("--members", type=int, default=200)
+    concurrency_parser.add_argument("--latency-ms", type=float, default=20)
+    concurrency_parser.add_argument("--profile", default="production", choices=sorted(db.ENGINE_PROFILES))
+    concurrency_parser.set_defaults(func=bench_concurrency)
+
+    plans_parser = subparsers.add_parser("query-plans", help="check EXPLAIN QUERY PLAN uses an index for each hot query")
+    plans_parser.add_argument("--members", type=int, default=200)
+    plans_parser.set_defaults(func=check_query_plans)
+
+    startup_parser = subparsers.add_parser("startup", help="measure worker cold-start time")
+    startup_parser.add_argument("--runs", type=int, default=5)
+    startup_parser.set_defaults(func=bench_startup)
+
+    contention_parser = subparsers.add_parser("contention", help="stress concurrent withdrawals and transfers on the same accounts")
+    contention_parser.add_argument("--threads", type=int, default=16)
+    contention_parser.add_argument("--operations", type=int, default=100, help="operations per thread")
+    contention_parser.add_argument("--profile", default="production", choices=sorted(db.ENGINE_PROFILES))
+    contention_parser.set_defaults(func=bench_contention)
+
+    bulk_parser = subparsers.add_parser("bulk-transfer", help="time a payroll batch against per-row transfers")
+    bulk_parser.add_argument("--rows", type=int, default=10000)
+    bulk_parser.add_argument("--members", type=int, default=2000)
+    bulk_parser.add_argument("--chunk-size", type=int, default=bulk_transfer.CHUNK_SIZE)
+    bulk_parser.add_argument("--baseline-rows", type=int, default=1000, help="rows to post one at a time for comparison")
+    bulk_parser.add_argument("--profile", default="production", choices=sorted(db.ENGINE_PROFILES))
+    bulk_parser.set_defaults(func=bench_bulk_transfer)
+
+    export_parser = subparsers.add_parser("export", help="compare streaming, buffered and columnar exports")
+    export_parser.add_argument("--rows", type=int, default=200000)
+    export_parser.add_argument("--chunk-rows", type=int, default=exports.EXPORT_CHUNK_ROWS)
+    export_parser.set_defaults(func=bench_export)
+
+    counts_parser = subparsers.add_parser("query-counts", help="check listing pages issue a fixed number of queries")
+    counts_parser.add_argument("--members", type=int, nargs="+", default=[50, 500, 5000])
+    counts_parser.set_defaults(func=check_query_counts)
+
+    search_parser = subparsers.add_parser("search", help="time member typeahead searches on a large member table")
+    search_parser.add_argument("--members", type=int, default=100000)
+    search_parser.add_argument("--queries", type=int, default=200, help="queries of each kind")
+    search_parser.add_argument("--budget-ms", type=float, default=10, help="fail if any kind's p95 exceeds this")
+    search_parser.set_defaults(func=bench_search)
+
+    quotes_parser = subparsers.add_parser("fd-quotes", help="time FD rate lookups from the rate book against per-quote queries")
+    quotes_parser.add_argument("--quotes", type=int, default=100000)
+    quotes_parser.add_argument("--query-quotes", type=int, default=2000, help="quotes to time the per-quote query with")
+    quotes_parser.add_argument("--extra-slabs", type=int, default=0, help="monthly slabs to add per FD type")
+    quotes_parser.add_argument("--min-quotes-per-second", type=int, default=10000)
+    quotes_parser.set_defaults(func=bench_fd_quotes)
+
+    templates_parser = subparsers.add_parser("templates", help="time template loads with and without the bytecode cache, and page compression")
+    templates_parser.add_argument("--runs", type=int, default=20)
+    templates_parser.add_argument("--announcements", type=int, default=200)
+    templates_parser.set_defaults(func=bench_templates)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
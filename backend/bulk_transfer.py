@@ -0,0 +1,125 @@
+"""
+Bulk credits (salary, dividends) from the society to many member accounts.
+
+A batch is a list of rows with account_no, amount and an optional
+description, uploaded as CSV or posted as JSON. Every recipient is resolved
+in one query. Valid rows are then posted in chunks, each chunk in its own
+transaction as one journal entry (see ledger.post_bulk_credits). A failed
+chunk rolls back only its own rows.
+"""
+import csv
+import io
+import os
+import uuid
+from decimal import Decimal, InvalidOperation
+
+from sqlalchemy import func, select
+
+import ledger
+import models
+from money import to_money
+
+CHUNK_SIZE = int(os.getenv('BULK_TRANSFER_CHUNK_SIZE', 500))
+MAX_ROWS = int(os.getenv('BULK_TRANSFER_MAX_ROWS', 20000))
+
+# Internal ledger each kind of batch is paid from
+SOURCES = {
+    'salary': ledger.SALARY_EXPENSE,
+    'dividend': ledger.DIVIDENDS_PAYABLE,
+    'other': ledger.CASH,
+}
+
+
+def rows_from_csv(content):
+    """Rows from CSV text with an account_no,amount[,description] header."""
+    reader = csv.DictReader(io.StringIO(content))
+    return [{key.strip().lower(): (value or '').strip() for key, value in row.items() if key} for row in reader]
+
+
+def _validate(rows):
+    """Split rows into results (one per row) and the (index, account_no, amount, description) to post."""
+    results, valid = [], []
+    for index, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            results.append({'row': index, 'account_no': '', 'amount': None, 'status': 'rejected',
+                            'error': 'Row must be an object with account_no and amount'})
+            continue
+        account_no = str(row.get('account_no') or '').strip()
+        result = {'row': index, 'account_no': account_no, 'amount': None, 'status': 'rejected'}
+        results.append(result)
+        # to_money rejects NaN, infinities and amounts too large to store
+        try:
+            amount = to_money(Decimal(str(row.get('amount'))))
+        except (InvalidOperation, ValueError):
+            result['error'] = 'Invalid amount'
+            continue
+        result['amount'] = float(amount)
+        if not account_no:
+            result['error'] = 'Missing account_no'
+        elif amount <= 0:
+            result['error'] = 'Amount must be positive'
+        else:
+            valid.append((index, account_no, amount, str(row.get('description') or '').strip()))
+    return results, valid
+
+
+def resolve_accounts(db, account_numbers):
+    """Map member account_no to the member's primary account id, in one query."""
+    if not account_numbers:
+        return {}
+    return dict(db.execute(
+        select(models.Member.account_no, func.min(models.Account.id))
+        .join(models.Account, models.Account.member_id == models.Member.id)
+        .where(models.Member.account_no.in_(account_numbers))
+        .group_by(models.Member.account_no)
+    ).all())
+
+
+def run_bulk_transfer(session_factory, rows, source='salary', description=None, chunk_size=CHUNK_SIZE):
+    """Post a batch and return a report with a result for every input row."""
+    gl_code = SOURCES[source]
+    reference = f"bulk:{uuid.uuid4().hex[:12]}"
+    description = description or f"{source.capitalize()} credit"
+    results, valid = _validate(rows)
+
+    total_credited = ledger.ZERO
+    db = session_factory()
+    try:
+        account_ids = resolve_accounts(db, sorted({account_no for _, account_no, _, _ in valid}))
+        credits = []
+        for index, account_no, amount, text in valid:
+            if account_no not in account_ids:
+                results[index - 1]['error'] = 'Unknown account_no'
+                continue
+            credits.append((index, account_ids[account_no], amount, text or description))
+
+        for start in range(0, len(credits), chunk_size):
+            chunk = credits[start:start + chunk_size]
+            try:
+                ledger.post_bulk_credits(
+                    db, [(account_id, amount, text) for _, account_id, amount, text in chunk],
+                    gl_code, description, reference,
+                )
+                db.commit()
+                total_credited += sum(amount for _, _, amount, _ in chunk)
+                status, error = 'credited', None
+            except Exception as e:
+                db.rollback()
+                status, error = 'failed', str(e)
+            for index, _, _, _ in chunk:
+                results[index - 1]['status'] = status
+                if error:
+                    results[index - 1]['error'] = error
+    finally:
+        db.close()
+
+    return {
+        'ok': True,
+        'reference': reference,
+        'rows': len(results),
+        'credited': sum(result['status'] == 'credited' for result in results),
+        'rejected': sum(result['status'] == 'rejected' for result in results),
+        'failed': sum(result['status'] == 'failed' for result in results),
+        'total_credited': float(total_credited),
+        'results': results,
+    }
@@ -0,0 +1,161 @@
+"""
+Response compression middleware.
+
+CompressionMiddleware compresses a response when all of these hold:
+
+- its Content-Type is in COMPRESS_TYPES (HTML, JSON, plain text, CSS,
+  JavaScript, SVG);
+- it is at least COMPRESS_MIN_BYTES long;
+- it is not already encoded;
+- the client accepts gzip or brotli.
+
+Brotli is preferred when the optional ``brotli`` package is installed. Report
+downloads (CSV, Parquet, Arrow) and the precompressed static assets are left
+alone. Small responses go out as they are; compressing them costs more time
+than it saves.
+
+A response sent in one piece is compressed in one go and gets an exact
+Content-Length. A streamed response is compressed chunk by chunk and sent
+without one. A compressed response's strong ETag becomes weak (W/"..."),
+since the bytes differ from the identity encoding. page_cache and rates
+accept the weak form in If-None-Match.
+"""
+import gzip
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+COMPRESS_MIN_BYTES = int(os.getenv('COMPRESS_MIN_BYTES', 1024))
+GZIP_LEVEL = int(os.getenv('COMPRESS_GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.getenv('COMPRESS_BROTLI_QUALITY', 5))
+COMPRESS_TYPES = frozenset({
+    'text/html',
+    'application/json',
+    'text/plain',
+    'text/css',
+    'application/javascript',
+    'text/javascript',
+    'image/svg+xml',
+})
+
+
+def accepted_encodings(accept_encoding):
+    """Content codings an Accept-Encoding header value allows (q=0 excluded)."""
+    accepted = set()
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token.strip().lower())
+    return accepted
+
+
+def choose_encoding(accept_encoding):
+    """'br', 'gzip' or None for an Accept-Encoding header value."""
+    accepted = accepted_encodings(accept_encoding or '')
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    def __init__(self, encoding):
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+            self._process = self._compressor.process
+        else:
+            # wbits 31: gzip header and trailer
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+            self._process = self._compressor.compress
+
+    def chunk(self, data, more_body):
+        # Flushed per chunk so a streamed response still reaches the client
+        # as it is produced
+        return self._process(data) + (self._flush() if more_body else self._finish())
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size=None, types=COMPRESS_TYPES):
+        self.app = app
+        self.minimum_size = COMPRESS_MIN_BYTES if minimum_size is None else minimum_size
+        self.types = types
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get('accept-encoding'))
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if message['type'] == 'http.response.start':
+                headers = Headers(raw=message['headers'])
+                media_type = headers.get('content-type', '').split(';')[0].strip().lower()
+                if media_type not in self.types or 'content-encoding' in headers or message['status'] in (204, 304):
+                    passthrough = True
+                    await send(message)
+                    return
+                if 'accept-encoding' not in headers.get('vary', '').lower():
+                    MutableHeaders(raw=message['headers']).add_vary_header('Accept-Encoding')
+                if encoding is None:
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message  # held until the first body chunk shows the size
+                return
+            if passthrough or message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            body, more_body = message.get('body', b''), message.get('more_body', False)
+            if start is not None:
+                headers = MutableHeaders(raw=start['headers'])
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                headers['content-encoding'] = encoding
+                etag = headers.get('etag')
+                if etag and not etag.startswith('W/'):
+                    headers['etag'] = 'W/' + etag
+                if more_body:
+                    del headers['content-length']
+                    compressor = _StreamCompressor(encoding)
+                    body = compressor.chunk(body, more_body)
+                else:
+                    body = compress(body, encoding)
+                    headers['content-length'] = str(len(body))
+                await send(start)
+                start = None
+                await send({'type': 'http.response.body', 'body': body, 'more_body': more_body})
+                return
+            await send({'type': 'http.response.body', 'body': compressor.chunk(body, more_body), 'more_body': more_body})
+
+        await self.app(scope, receive, send_compressed)
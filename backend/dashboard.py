@@ -0,0 +1,163 @@
+"""
+Data for the member dashboard, with a per-member cache.
+
+load() reads the member together with their first account in one query. It
+then fetches loans, deposits and shares in batched selectin queries, and the
+latest DASHBOARD_RECENT_TRANSACTIONS transactions plus the total count in one
+windowed query. The result is cached per member as plain dicts. A
+before_flush hook notes which members a session is changing, through their
+account, loans, deposits, shares, transactions or the member row itself.
+Their entries are dropped once that session commits.
+
+Other workers cannot see that hook, so a cached entry is only served after
+one cheap check: the account's balance and latest transaction id, read by
+primary key and index, must still match the entry. A deposit, withdrawal or
+transfer made through any worker (or raw SQL) changes both, so the balance
+and history are never stale. Loans, deposits and shares changed elsewhere
+show up when the entry expires after DASHBOARD_CACHE_SECONDS.
+"""
+import os
+import time
+
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import aliased, selectinload
+
+import invalidation
+import models
+
+DASHBOARD_CACHE_SECONDS = float(os.getenv('DASHBOARD_CACHE_SECONDS', 60))
+DASHBOARD_CACHE_SIZE = int(os.getenv('DASHBOARD_CACHE_SIZE', 10000))
+DASHBOARD_RECENT_TRANSACTIONS = 10
+
+_account_members = {}  # account_id -> member_id, for cached dashboards
+
+
+def _forget_account(member_id, entry):
+    expires_at, data = entry
+    if data['account'] is not None:
+        _account_members.pop(data['account']['id'], None)
+
+
+# member_id -> (expires_at, data). Its lock also guards _account_members
+_cache = invalidation.GenerationCache(max_size=DASHBOARD_CACHE_SIZE, on_evict=_forget_account)
+
+
+def _row(obj):
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+def _query(db, member_id):
+    member_account = aliased(models.Account)
+    first_account_id = (
+        select(func.min(member_account.id))
+        .where(member_account.member_id == models.Member.id)
+        .correlate(models.Member)
+        .scalar_subquery()
+    )
+    found = db.execute(
+        select(models.Member, models.Account)
+        .outerjoin(models.Account, models.Account.id == first_account_id)
+        .where(models.Member.id == member_id)
+        .options(selectinload(models.Member.loans), selectinload(models.Member.deposits),
+                 selectinload(models.Member.shares))
+    ).first()
+    if found is None:
+        return None
+    member, account = found
+
+    transactions, transaction_count = [], 0
+    if account is not None:
+        rows = db.execute(
+            select(models.Transaction, func.count().over())
+            .where(models.Transaction.account_id == account.id)
+            .order_by(models.Transaction.created_at.desc(), models.Transaction.id.desc())
+            .limit(DASHBOARD_RECENT_TRANSACTIONS)
+        ).all()
+        transactions = [_row(txn) for txn, _ in rows]
+        transaction_count = rows[0][1] if rows else 0
+
+    return {
+        'member': _row(member),
+        'account': _row(account) if account is not None else None,
+        'transactions': transactions,
+        'transaction_count': transaction_count,
+        'loans': [_row(loan) for loan in member.loans],
+        'deposits': [_row(deposit) for deposit in member.deposits],
+        'shares': [_row(share) for share in member.shares],
+    }
+
+
+def freshness_query(account_id):
+    """The account's balance and latest transaction id, which every money movement changes."""
+    latest = (
+        select(models.Transaction.id)
+        .where(models.Transaction.account_id == account_id)
+        .order_by(models.Transaction.created_at.desc(), models.Transaction.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return select(models.Account.balance, latest).where(models.Account.id == account_id)
+
+
+def _stamp(data):
+    transactions = data['transactions']
+    return (data['account']['balance'], transactions[0]['id'] if transactions else None)
+
+
+def _is_fresh(db, data):
+    if data['account'] is None:
+        return True
+    return tuple(db.execute(freshness_query(data['account']['id'])).one_or_none() or ()) == _stamp(data)
+
+
+def load(db, member_id):
+    """Dashboard data for ``member_id`` as plain dicts, or None if there is no such member."""
+    now = time.monotonic()
+    cached = _cache.get(member_id)
+    if cached is not None and cached[0] > now and _is_fresh(db, cached[1]):
+        return cached[1]
+    generation = _cache.generation(member_id)
+
+    data = _query(db, member_id)
+    if data is None:
+        return None
+    with _cache.lock:
+        if _cache.put(member_id, (now + DASHBOARD_CACHE_SECONDS, data), generation) and data['account'] is not None:
+            _account_members[data['account']['id']] = member_id
+    return data
+
+
+def invalidate(member_ids=(), account_ids=()):
+    with _cache.lock:
+        member_ids = set(member_ids)
+        member_ids.update(_account_members[account_id] for account_id in account_ids if account_id in _account_members)
+        _cache.invalidate(*member_ids)
+
+
+def clear():
+    with _cache.lock:
+        _cache.clear()
+        _account_members.clear()
+
+
+def mark_changed(db, member_ids):
+    """Record members whose data ``db`` changed outside the ORM (Core statements), to invalidate on commit."""
+    invalidation.mark(db, 'dashboard_members', member_ids)
+
+
+# Models whose rows belong to a member through member_id
+_MEMBER_OWNED = (models.Account, models.Loan, models.Deposit, models.Share)
+
+
+def _changed_members(session, objects):
+    members = {obj.id for obj in objects if isinstance(obj, models.Member)}
+    members.update(obj.member_id for obj in objects if isinstance(obj, _MEMBER_OWNED))
+    return members - {None}
+
+
+def _changed_accounts(session, objects):
+    return {obj.account_id for obj in objects if isinstance(obj, models.Transaction)} - {None}
+
+
+invalidation.track('dashboard_members', _changed_members, lambda members: invalidate(member_ids=members))
+invalidation.track('dashboard_accounts', _changed_accounts, lambda accounts: invalidate(account_ids=accounts))
@@ -1,15 +1,218 @@
-from sqlalchemy import create_engine
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool, QueuePool
+from config import Config
+from contextlib import contextmanager
 import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 BASE_DIR = os.path.dirname(__file__)
 DB_FOLDER = os.path.join(BASE_DIR, "instance")
 os.makedirs(DB_FOLDER, exist_ok=True)
 
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(DB_FOLDER, 'society_bank.db')}"
+# Defaults to instance/society_bank.db; set DATABASE_URL to use PostgreSQL.
+SQLALCHEMY_DATABASE_URL = Config.SQLALCHEMY_DATABASE_URI
+
+# Engine profiles select the pool sizing and, for SQLite, the pragmas applied
+# to every new connection. Pick one with DB_ENGINE_PROFILE.
+ENGINE_PROFILES = {
+    # SQLite defaults: rollback journal, synchronous=FULL, 2 MB page cache
+    "default": {
+        "pragmas": {},
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": False,
+        "pool_recycle": -1,
+    },
+    # WAL lets readers run while a writer commits; synchronous=NORMAL is
+    # durable across application crashes and only fsyncs at checkpoints.
+    # Pre-ping and recycling drop connections a server-side pooler or
+    # failover has closed underneath us.
+    "production": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -64000,  # negative = KiB, i.e. ~64 MB per connection
+            "mmap_size": 268435456,  # 256 MB
+            "busy_timeout": 5000,  # ms to wait on a locked database
+            "temp_store": "MEMORY",
+        },
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    },
+}
+
+DB_ENGINE_PROFILE = os.getenv('DB_ENGINE_PROFILE', 'default').lower()
+
+
+def _set_sqlite_pragmas(pragmas):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+    return on_connect
+
+
+def is_sqlite(url):
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+# Async driver used for each backend by the async engine
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def async_database_url(url):
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"No async driver configured for {backend!r} databases; deposit, withdraw and transfer"
+            f" need SQLite ({ASYNC_DRIVERS['sqlite']}) or PostgreSQL ({ASYNC_DRIVERS['postgresql']})"
+        )
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+# INSERT constructs that support ON CONFLICT DO UPDATE, for counters kept
+# in summary tables
+UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _engine_options(url, profile):
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown DB_ENGINE_PROFILE {profile!r}; expected one of {sorted(ENGINE_PROFILES)}")
+    settings = ENGINE_PROFILES[profile]
+    engine_kwargs = {
+        "pool_size": int(os.getenv('DB_POOL_SIZE', settings["pool_size"])),
+        "max_overflow": int(os.getenv('DB_MAX_OVERFLOW', settings["max_overflow"])),
+        "pool_pre_ping": os.getenv('DB_POOL_PRE_PING', str(settings["pool_pre_ping"])).lower() == 'true',
+        "pool_recycle": int(os.getenv('DB_POOL_RECYCLE', settings["pool_recycle"])),
+    }
+    pragmas = settings["pragmas"] if is_sqlite(url) else {}
+    return engine_kwargs, pragmas
+
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+def build_engine(url=SQLALCHEMY_DATABASE_URL, profile=DB_ENGINE_PROFILE, **overrides):
+    engine_kwargs, pragmas = _engine_options(url, profile)
+    engine_kwargs.update(overrides)
+    if is_sqlite(url):
+        # SQLite connections are handed between FastAPI's worker threads
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    new_engine = create_engine(url, poolclass=QueuePool, **engine_kwargs)
+    if pragmas:
+        event.listen(new_engine, "connect", _set_sqlite_pragmas(pragmas))
+    return new_engine
+
+
+def build_async_engine(url=SQLALCHEMY_DATABASE_URL, profile=DB_ENGINE_PROFILE, **overrides):
+    engine_kwargs, pragmas = _engine_options(url, profile)
+    engine_kwargs.update(overrides)
+    try:
+        new_engine = create_async_engine(async_database_url(url), **engine_kwargs)
+    except ModuleNotFoundError as e:
+        raise RuntimeError(f"The async endpoints need the {e.name!r} package for this database: pip install {e.name}") from e
+    if pragmas:
+        event.listen(new_engine.sync_engine, "connect", _set_sqlite_pragmas(pragmas))
+    return new_engine
+
+
+# Revision matching the schema create_all produced before migrations existed
+BASELINE_REVISION = "0001"
+
+
+def upgrade_database(url=SQLALCHEMY_DATABASE_URL):
+    """Migrate the database at ``url`` to the latest Alembic revision."""
+    config = AlembicConfig(os.path.join(os.path.abspath(BASE_DIR), "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", str(url).replace("%", "%%"))
+    config.attributes["configure_logger"] = False
+    probe = create_engine(url, poolclass=NullPool)
+    try:
+        tables = inspect(probe).get_table_names()
+    finally:
+        probe.dispose()
+    if "member" in tables and "alembic_version" not in tables:
+        alembic_command.stamp(config, BASELINE_REVISION)
+    alembic_command.upgrade(config, "head")
+
+
+# pg_advisory_lock key for startup_lock(); any constant shared by all workers
+STARTUP_LOCK_KEY = 720_301
+
+
+@contextmanager
+def startup_lock(url=SQLALCHEMY_DATABASE_URL):
+    """Hold a lock shared by every worker, so only one migrates or seeds at a time."""
+    if make_url(url).get_backend_name() == "postgresql":
+        probe = create_engine(url, poolclass=NullPool)
+        try:
+            with probe.connect() as connection:
+                connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": STARTUP_LOCK_KEY})
+                try:
+                    yield
+                finally:
+                    connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": STARTUP_LOCK_KEY})
+        finally:
+            probe.dispose()
+        return
+    # SQLite lives on the workers' own host, so an OS file lock is enough
+    with open(os.path.join(DB_FOLDER, "startup.lock"), "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after about 10 seconds
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+engine = build_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async counterpart for the money-movement endpoints. Objects stay loaded
+# after commit so handlers can report the new balance without a refresh.
+# The engine is built on first use, so a database without an async driver
+# only fails those endpoints instead of the whole app.
+_async_sessions = None
+_async_lock = threading.Lock()
+
+
+def async_session():
+    """A new AsyncSession, building the async engine on the first call."""
+    global _async_sessions
+    if _async_sessions is None:
+        with _async_lock:
+            if _async_sessions is None:
+                _async_sessions = async_sessionmaker(build_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_sessions()
+
 Base = declarative_base()
@@ -0,0 +1,272 @@
+"""
+Streaming exports as CSV, Parquet or Arrow IPC.
+
+Each export is a Core SELECT of plain columns, not ORM objects. It runs on
+its own connection with stream_results, so PostgreSQL uses a server-side
+cursor. Rows are fetched a batch at a time, and each batch is written out
+as one CSV chunk or one Parquet row group / Arrow record batch. Memory
+stays flat however large the table is, and the first bytes go out as soon
+as the first batch is read.
+
+Parquet and Arrow keep real column types (int64, decimal(18, 2) money,
+timestamps, booleans) and are zstd-compressed. They need pyarrow.
+"""
+import csv
+import io
+import os
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from sqlalchemy import select
+
+import models
+import report_summary
+from db import engine
+
+EXPORT_CHUNK_ROWS = int(os.getenv('EXPORT_CHUNK_ROWS', 1000))
+# Parquet row groups and Arrow batches want far more rows than a CSV chunk
+COLUMNAR_BATCH_ROWS = int(os.getenv('EXPORT_COLUMNAR_BATCH_ROWS', 50000))
+
+FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrows'),
+}
+
+# ``columns`` is a list of (name, type) for the columnar formats, in the
+# order of the SELECT; type is one of ARROW_TYPES below.
+Export = namedtuple('Export', ['name', 'header', 'stmt', 'format_row', 'columns'])
+
+
+def _money(value):
+    return f"{value:.2f}" if value is not None else ''
+
+
+def _filter(stmt, model, date_from=None, date_to=None, since_id=None, since=None):
+    """Whole days from ``date_from`` through ``date_to``; rows after ``since_id`` / ``since`` for incremental pulls."""
+    if date_from:
+        stmt = stmt.where(model.created_at >= datetime.combine(date_from, time.min))
+    if date_to:
+        stmt = stmt.where(model.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+    if since_id is not None:
+        stmt = stmt.where(model.id > since_id)
+    if since is not None:
+        stmt = stmt.where(model.created_at > since)
+    return stmt
+
+
+def members_export(status=None, since_id=None):
+    header = ['ID', 'Name', 'Username', 'Account No', 'Phone', 'DOB', 'Is Approved']
+    stmt = select(models.Member.id, models.Member.name, models.Member.username, models.Member.account_no,
+                  models.Member.mobile, models.Member.dob, models.Member.is_approved).order_by(models.Member.id)
+    if status:
+        stmt = stmt.where(models.Member.is_approved == (status.lower() == 'approved'))
+    if since_id is not None:
+        stmt = stmt.where(models.Member.id > since_id)
+
+    def format_row(row):
+        return [row.id, row.name, row.username, row.account_no or '', row.mobile or '', row.dob or '',
+                'Yes' if row.is_approved else 'No']
+    columns = [('id', 'int'), ('name', 'string'), ('username', 'string'), ('account_no', 'string'),
+               ('mobile', 'string'), ('dob', 'string'), ('is_approved', 'bool')]
+    return Export('members', header, stmt, format_row, columns)
+
+
+def loans_export(date_from=None, date_to=None, status=None, since_id=None, since=None):
+    header = ['ID', 'Member ID', 'Amount', 'Interest Rate (%)', 'Tenure (Months)', 'Status', 'Repayment Status', 'Created At']
+    stmt = select(models.Loan.id, models.Loan.member_id, models.Loan.amount, models.Loan.interest_rate,
+                  models.Loan.tenure_months, models.Loan.status, models.Loan.repayment_status,
+                  models.Loan.created_at).order_by(models.Loan.id)
+    stmt = _filter(stmt, models.Loan, date_from, date_to, since_id, since)
+    if status:
+        stmt = stmt.where(models.Loan.status == status)
+
+    def format_row(row):
+        return [row.id, row.member_id, _money(row.amount), row.interest_rate, row.tenure_months, row.status,
+                row.repayment_status, row.created_at.strftime('%Y-%m-%d') if row.created_at else '']
+    columns = [('id', 'int'), ('member_id', 'int'), ('amount', 'money'), ('interest_rate', 'float'),
+               ('tenure_months', 'int'), ('status', 'string'), ('repayment_status', 'string'),
+               ('created_at', 'timestamp')]
+    return Export('loans', header, stmt, format_row, columns)
+
+
+def deposits_export(date_from=None, date_to=None, status=None, since_id=None, since=None):
+    header = ['ID', 'Member ID', 'Amount', 'Type', 'Maturity Date', 'Status', 'Created At']
+    stmt = select(models.Deposit.id, models.Deposit.member_id, models.Deposit.amount, models.Deposit.type,
+                  models.Deposit.maturity_date, models.Deposit.status,
+                  models.Deposit.created_at).order_by(models.Deposit.id)
+    stmt = _filter(stmt, models.Deposit, date_from, date_to, since_id, since)
+    if status:
+        stmt = stmt.where(models.Deposit.status == status)
+
+    def format_row(row):
+        return [row.id, row.member_id, _money(row.amount), row.type, row.maturity_date or '', row.status,
+                row.created_at.strftime('%Y-%m-%d') if row.created_at else '']
+    columns = [('id', 'int'), ('member_id', 'int'), ('amount', 'money'), ('type', 'string'),
+               ('maturity_date', 'date'), ('status', 'string'), ('created_at', 'timestamp')]
+    return Export('deposits', header, stmt, format_row, columns)
+
+
+def transactions_export(date_from=None, date_to=None, txn_type=None, since_id=None, since=None):
+    header = ['ID', 'Account ID', 'Type', 'Amount', 'Description', 'Created At']
+    stmt = select(models.Transaction.id, models.Transaction.account_id, models.Transaction.type,
+                  models.Transaction.amount, models.Transaction.description,
+                  models.Transaction.created_at).order_by(models.Transaction.id)
+    stmt = _filter(stmt, models.Transaction, date_from, date_to, since_id, since)
+    if txn_type:
+        stmt = stmt.where(models.Transaction.type == txn_type)
+
+    def format_row(row):
+        return [row.id, row.account_id, row.type, _money(row.amount), row.description or '',
+                row.created_at.strftime('%Y-%m-%d %H:%M:%S') if row.created_at else '']
+    columns = [('id', 'int'), ('account_id', 'int'), ('type', 'string'), ('amount', 'money'),
+               ('description', 'string'), ('created_at', 'timestamp')]
+    return Export('transactions', header, stmt, format_row, columns)
+
+
+def bank_report_csv(db):
+    """The bank report summary with the latest 100 transactions, as CSV text."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+
+    # Summary section
+    writer.writerow(['SOCIETY BANK - REPORT'])
+    writer.writerow(['Generated on', datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')])
+    writer.writerow([])
+
+    # Statistics
+    writer.writerow(['STATISTICS'])
+    figures = report_summary.bank_report_figures(db)
+    total_members, total_loans, total_fds, total_shares = (
+        figures['total_members'], figures['total_loans'], figures['total_fds'], figures['total_shares'])
+    total_loan_amount, total_fd_amount, total_share_amount = (
+        figures['total_loan_amount'], figures['total_fd_amount'], figures['total_share_amount'])
+
+    writer.writerow(['Total Members', total_members])
+    writer.writerow(['Total Approved Loans', total_loans])
+    writer.writerow(['Total Loan Amount', f"{total_loan_amount:.2f}"])
+    writer.writerow(['Total FDs', total_fds])
+    writer.writerow(['Total FD Amount', f"{total_fd_amount:.2f}"])
+    writer.writerow(['Total Shares', total_shares])
+    writer.writerow(['Total Share Amount', f"{total_share_amount:.2f}"])
+    writer.writerow([])
+
+    # P&L
+    writer.writerow(['PROFIT & LOSS'])
+    writer.writerow(['Total Deposits (FD)', f"{total_fd_amount:.2f}"])
+    writer.writerow(['Total Loans Disbursed', f"{total_loan_amount:.2f}"])
+    net_position = total_fd_amount - total_loan_amount
+    writer.writerow(['Net Position', f"{net_position:.2f}"])
+    writer.writerow([])
+
+    # Transactions
+    writer.writerow(['RECENT TRANSACTIONS (Last 100)'])
+    writer.writerow(['ID', 'Type', 'Amount', 'Created At'])
+    all_transactions = db.query(models.Transaction).order_by(models.Transaction.created_at.desc()).limit(100).all()
+    for txn in all_transactions:
+        writer.writerow([
+            txn.id,
+            txn.type,
+            f"{txn.amount:.2f}",
+            txn.created_at.strftime('%Y-%m-%d %H:%M') if txn.created_at else ''
+        ])
+
+    return output.getvalue()
+
+
+def _partitions(stmt, bind, batch_rows):
+    with bind.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=batch_rows).execute(stmt)
+        yield from result.partitions()
+
+
+def stream_csv(export, bind=engine, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield the CSV for ``export`` one chunk of rows at a time."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(export.header)
+    for rows in _partitions(export.stmt, bind, chunk_rows):
+        writer.writerows(export.format_row(row) for row in rows)
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+    if output.tell():
+        yield output.getvalue()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain.
+
+    It reports the running byte offset from tell(), which the Parquet
+    footer relies on, even after the bytes have been handed back.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def arrow_schema(export):
+    import pyarrow as pa
+
+    arrow_types = {
+        'int': pa.int64(),
+        'float': pa.float64(),
+        'string': pa.string(),
+        'bool': pa.bool_(),
+        'money': pa.decimal128(18, 2),
+        'date': pa.date32(),
+        'timestamp': pa.timestamp('us'),
+    }
+    return pa.schema([(name, arrow_types[kind]) for name, kind in export.columns])
+
+
+def stream_columnar(export, fmt, bind=engine, batch_rows=COLUMNAR_BATCH_ROWS):
+    """Yield ``export`` as Parquet (one row group per batch) or an Arrow IPC stream."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema(export)
+    sink = _ChunkSink()
+    if fmt == 'parquet':
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode='w'), schema, compression='zstd')
+    else:
+        writer = pa.ipc.new_stream(pa.PythonFile(sink, mode='w'), schema,
+                                   options=pa.ipc.IpcWriteOptions(compression='zstd'))
+    for rows in _partitions(export.stmt, bind, batch_rows):
+        columns = list(zip(*rows))
+        writer.write_batch(pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema))
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def stream_export(export, fmt='csv', bind=engine):
+    if fmt == 'csv':
+        return stream_csv(export, bind=bind)
+    return stream_columnar(export, fmt, bind=bind)
+
+
+def columnar_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
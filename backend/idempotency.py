@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Idempotency-Key support for the member money-movement endpoints.
+
+A handler claims the key before it writes anything. The key row commits in
+the same transaction as the balance change and holds the JSON response. A
+retry with the same key then gets the stored response back without running
+the handler again. Keys expire after IDEMPOTENCY_TTL_HOURS. Expired rows
+are replaced when their key is reused. Remove them in bulk with:
+
+    python idempotency.py purge
+"""
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+import models
+from db import SessionLocal
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 100
+IDEMPOTENCY_TTL = timedelta(hours=int(os.getenv('IDEMPOTENCY_TTL_HOURS', 24)))
+
+
+def request_hash(endpoint, **fields):
+    payload = json.dumps({'endpoint': endpoint, 'fields': fields}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def replay(record):
+    response = JSONResponse(json.loads(record.response_body), status_code=record.status_code)
+    response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def _find(db, member_id, key):
+    return db.scalars(
+        select(models.IdempotencyKey).filter_by(member_id=member_id, key=key).limit(1)
+    ).first()
+
+
+def claim(db, member_id, key, fingerprint):
+    """Claim ``key`` for a new request; returns ``(record, response)``.
+
+    ``response`` is set when the request must not run: the stored result of
+    an earlier request, or an error if the key is reused for a different
+    request. Call this first in the transaction, because a clash with a
+    concurrent request rolls the session back.
+    """
+    if not key:
+        return None, None
+    if len(key) > MAX_KEY_LENGTH:
+        return None, JSONResponse({'ok': False, 'error': f'{HEADER} must be at most {MAX_KEY_LENGTH} characters'}, status_code=400)
+    now = datetime.utcnow()
+    for _ in range(2):
+        existing = _find(db, member_id, key)
+        if existing is not None and existing.expires_at <= now:
+            db.delete(existing)
+            db.flush()
+            existing = None
+        if existing is not None:
+            if existing.request_hash != fingerprint:
+                return None, JSONResponse({'ok': False, 'error': f'{HEADER} was already used for a different request'}, status_code=422)
+            if existing.response_body is None:
+                break
+            return None, replay(existing)
+        record = models.IdempotencyKey(member_id=member_id, key=key, request_hash=fingerprint,
+                                       created_at=now, expires_at=now + IDEMPOTENCY_TTL)
+        db.add(record)
+        try:
+            db.flush()
+            return record, None
+        except IntegrityError:
+            # A concurrent request with the same key committed first; read its result
+            db.rollback()
+    return None, JSONResponse({'ok': False, 'error': 'A request with this key is still in progress'}, status_code=409)
+
+
+def complete(record, body, status_code=200):
+    """Store the response on a claimed key; it commits with the handler's writes."""
+    if record is not None:
+        record.status_code = status_code
+        record.response_body = json.dumps(body)
+    return JSONResponse(body, status_code=status_code)
+
+
+def purge_expired(db):
+    return db.execute(
+        delete(models.IdempotencyKey).where(models.IdempotencyKey.expires_at <= datetime.utcnow())
+    ).rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["purge"])
+    parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        removed = purge_expired(db)
+        db.commit()
+        print(f"Removed {removed} expired idempotency keys")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Commit-time invalidation for the in-process caches.
+
+stats, dashboard, page_cache and rates each cache data derived from a few
+models. They all drop it the same way, through track():
+
+    invalidation.track('stats_changed', collect, on_commit)
+
+Before each flush, ``collect(session, objects)`` gets the session's new,
+dirty and deleted objects and returns the cache keys they touch (an empty
+iterable for none). The keys gathered over a transaction go to
+``on_commit(keys)`` once it commits, and are dropped if it rolls back.
+Writes made through Core statements bypass the flush, so their callers
+record keys with mark().
+
+GenerationCache holds the cached values. A load reads generation(key)
+before it queries and hands it to put(). invalidate() bumps the generation,
+so a value loaded from rows that a concurrent commit has since changed is
+not stored.
+"""
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+def track(name, collect, on_commit):
+    """Call ``on_commit(keys)`` after each commit whose flushes ``collect`` found keys in."""
+
+    @event.listens_for(Session, 'before_flush')
+    def _collect(session, flush_context, instances):
+        keys = collect(session, (*session.new, *session.dirty, *session.deleted))
+        if keys:
+            mark(session, name, keys)
+
+    @event.listens_for(Session, 'after_commit')
+    def _commit(session):
+        keys = session.info.pop(name, None)
+        if keys:
+            on_commit(keys)
+
+    @event.listens_for(Session, 'after_rollback')
+    def _rollback(session):
+        session.info.pop(name, None)
+
+
+def mark(session, name, keys):
+    """Record keys changed outside the ORM, to hand to ``name``'s on_commit."""
+    session.info.setdefault(name, set()).update(keys)
+
+
+def pending(session, name):
+    """Keys recorded for ``name`` in the session's open transaction."""
+    return session.info.get(name, set())
+
+
+class GenerationCache:
+    """Thread-safe key -> value cache that refuses loads which raced an invalidation.
+
+    With ``max_size`` the least recently read entry is evicted first, and
+    ``on_evict(key, value)`` is called for it. ``lock`` is reentrant, so a
+    caller can hold it across several calls.
+    """
+
+    def __init__(self, max_size=None, on_evict=None):
+        self.lock = threading.RLock()
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self._entries = OrderedDict()
+        self._generations = {}
+
+    def get(self, key):
+        with self.lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def generation(self, key):
+        with self.lock:
+            return self._generations.get(key, 0)
+
+    def put(self, key, value, generation):
+        """Store ``value`` unless ``key`` was invalidated since ``generation`` was read; returns whether it was."""
+        with self.lock:
+            if self._generations.get(key, 0) != generation:
+                return False
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                self._evict(next(iter(self._entries)))
+            return True
+
+    def _evict(self, key):
+        value = self._entries.pop(key, None)
+        if value is not None and self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def invalidate(self, *keys):
+        with self.lock:
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+                self._evict(key)
+
+    def clear(self):
+        with self.lock:
+            self.invalidate(*list(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,266 @@
+"""
+Background jobs for long-running admin reports.
+
+A job is a row in report_job. Submitting one commits the row and hands its
+id to an in-process thread pool of REPORT_JOB_WORKERS threads (default 2).
+Each thread streams one export to a file under REPORT_JOB_DIR. The pool
+size caps how many reports run, and how many database connections they
+hold, however many are queued. REPORT_JOB_MAX_PENDING caps the backlog.
+A worker claims a job with a conditional UPDATE, so each job runs exactly
+once even when several app processes share the table. Running jobs
+heartbeat, and that is also when they notice a cancel request. A job
+whose heartbeat stops, because its process died, is marked failed. Result
+files are removed after REPORT_JOB_RETENTION_HOURS.
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, select, update
+
+import exports
+import models
+from db import DB_FOLDER, SessionLocal
+
+REPORT_JOB_WORKERS = int(os.getenv('REPORT_JOB_WORKERS', 2))
+REPORT_JOB_MAX_PENDING = int(os.getenv('REPORT_JOB_MAX_PENDING', 20))
+REPORT_JOB_DIR = os.getenv('REPORT_JOB_DIR', os.path.join(DB_FOLDER, 'reports'))
+REPORT_JOB_RETENTION = timedelta(hours=int(os.getenv('REPORT_JOB_RETENTION_HOURS', 24)))
+REPORT_JOB_STALE_AFTER = timedelta(seconds=int(os.getenv('REPORT_JOB_STALE_SECONDS', 300)))
+HEARTBEAT_SECONDS = 2
+
+PENDING = ('queued', 'running')
+
+
+class JobLimitError(ValueError):
+    pass
+
+
+class JobCancelled(Exception):
+    pass
+
+
+# Job kind -> (export builder, {request param: (builder keyword, parser)}).
+# Params mirror the query string of the matching /export endpoint.
+_DATE_RANGE = {'date_from': ('date_from', date.fromisoformat), 'date_to': ('date_to', date.fromisoformat)}
+_INCREMENTAL = {'since_id': ('since_id', int), 'since': ('since', datetime.fromisoformat)}
+JOB_KINDS = {
+    'members': (exports.members_export, {'status': ('status', str), 'since_id': ('since_id', int)}),
+    'loans': (exports.loans_export, {**_DATE_RANGE, 'status': ('status', str), **_INCREMENTAL}),
+    'deposits': (exports.deposits_export, {**_DATE_RANGE, 'status': ('status', str), **_INCREMENTAL}),
+    'transactions': (exports.transactions_export, {**_DATE_RANGE, 'type': ('txn_type', str), **_INCREMENTAL}),
+    'bank_report': (None, {}),
+}
+
+_executor = None
+
+
+def _builder_kwargs(kind, params):
+    builder, accepted = JOB_KINDS[kind]
+    unknown = set(params) - set(accepted)
+    if unknown:
+        raise ValueError(f"Unknown parameters for {kind}: {sorted(unknown)}")
+    kwargs = {}
+    for name, value in params.items():
+        keyword, parse = accepted[name]
+        try:
+            kwargs[keyword] = parse(value) if value not in (None, '') else None
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for {name}: {value!r}")
+    return kwargs
+
+
+def describe(job):
+    return {
+        'id': job.id,
+        'kind': job.kind,
+        'format': job.format,
+        'params': json.loads(job.params or '{}'),
+        'status': job.status,
+        'cancel_requested': job.cancel_requested,
+        'error': job.error,
+        'result_bytes': job.result_bytes,
+        'download_ready': job.status == 'succeeded' and bool(job.result_path),
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def submit(db, kind, fmt='csv', params=None):
+    """Queue a report job; raises ValueError for a bad request and JobLimitError when the backlog is full."""
+    params = params or {}
+    if not isinstance(kind, str) or kind not in JOB_KINDS:
+        raise ValueError(f"kind must be one of {sorted(JOB_KINDS)}")
+    if not isinstance(fmt, str) or fmt not in exports.FORMATS or (kind == 'bank_report' and fmt != 'csv'):
+        raise ValueError(f"format {fmt!r} is not available for {kind}")
+    if fmt != 'csv' and not exports.columnar_available():
+        raise ValueError(f"{fmt} export needs pyarrow installed on the server")
+    _builder_kwargs(kind, params)
+
+    pending = db.scalar(select(func.count()).select_from(models.ReportJob).where(models.ReportJob.status.in_(PENDING)))
+    if pending >= REPORT_JOB_MAX_PENDING:
+        raise JobLimitError(f"{pending} report jobs are already queued or running; try again later")
+    job = models.ReportJob(kind=kind, format=fmt, params=json.dumps(params), status='queued', created_at=datetime.utcnow())
+    db.add(job)
+    db.commit()
+    _enqueue(job.id)
+    return job
+
+
+def cancel(db, job):
+    """Cancel a queued job at once; ask a running one to stop at its next heartbeat."""
+    now = datetime.utcnow()
+    cancelled = db.execute(
+        update(models.ReportJob)
+        .where(models.ReportJob.id == job.id, models.ReportJob.status == 'queued')
+        .values(status='cancelled', cancel_requested=True, finished_at=now)
+    ).rowcount
+    if not cancelled:
+        db.execute(
+            update(models.ReportJob)
+            .where(models.ReportJob.id == job.id, models.ReportJob.status == 'running')
+            .values(cancel_requested=True)
+        )
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _enqueue(job_id):
+    if _executor is not None:
+        _executor.submit(_run, job_id)
+
+
+def _update(job_id, *conditions, **values):
+    db = SessionLocal()
+    try:
+        changed = db.execute(
+            update(models.ReportJob).where(models.ReportJob.id == job_id, *conditions).values(**values)
+        ).rowcount
+        db.commit()
+        return changed
+    finally:
+        db.close()
+
+
+def _chunks(db, job):
+    if job.kind == 'bank_report':
+        yield exports.bank_report_csv(db)
+        return
+    builder, _ = JOB_KINDS[job.kind]
+    export = builder(**_builder_kwargs(job.kind, json.loads(job.params or '{}')))
+    yield from exports.stream_export(export, job.format)
+
+
+def _run(job_id):
+    now = datetime.utcnow()
+    running = models.ReportJob.status == 'running'
+    if not _update(job_id, models.ReportJob.status == 'queued', status='running', started_at=now, heartbeat_at=now):
+        return  # cancelled, or claimed by another process
+
+    db = SessionLocal()
+    job = db.get(models.ReportJob, job_id)
+    _, extension = exports.FORMATS[job.format]
+    path = os.path.join(REPORT_JOB_DIR, f"job-{job.id}-{job.kind}.{extension}")
+    partial = path + '.part'
+    try:
+        os.makedirs(REPORT_JOB_DIR, exist_ok=True)
+        size = 0
+        next_heartbeat = time.monotonic() + HEARTBEAT_SECONDS
+        with open(partial, 'wb') as output:
+            for chunk in _chunks(db, job):
+                data = chunk.encode() if isinstance(chunk, str) else chunk
+                output.write(data)
+                size += len(data)
+                if time.monotonic() >= next_heartbeat:
+                    _heartbeat(job_id)
+                    next_heartbeat = time.monotonic() + HEARTBEAT_SECONDS
+        os.replace(partial, path)
+        # Only a job still running and not asked to stop succeeds. A cancel
+        # that arrived during the last chunk still wins, and a job that
+        # fail_stale_jobs() already failed stays failed
+        if not _update(job_id, running, models.ReportJob.cancel_requested.isnot(True),
+                       status='succeeded', result_path=path, result_bytes=size, finished_at=datetime.utcnow()):
+            os.remove(path)
+            _update(job_id, running, status='cancelled', finished_at=datetime.utcnow())
+    except JobCancelled:
+        _update(job_id, running, status='cancelled', finished_at=datetime.utcnow())
+    except Exception as e:
+        print(f"Report job {job_id} failed: {e}")
+        _update(job_id, running, status='failed', error=str(e), finished_at=datetime.utcnow())
+    finally:
+        db.close()
+        if os.path.exists(partial):
+            os.remove(partial)
+        purge_expired()
+
+
+def _heartbeat(job_id):
+    db = SessionLocal()
+    try:
+        db.execute(update(models.ReportJob).where(models.ReportJob.id == job_id)
+                   .values(heartbeat_at=datetime.utcnow()))
+        db.commit()
+        if db.scalar(select(models.ReportJob.cancel_requested).where(models.ReportJob.id == job_id)):
+            raise JobCancelled()
+    finally:
+        db.close()
+
+
+def fail_stale_jobs(db):
+    """Mark running jobs whose worker stopped heartbeating as failed."""
+    cutoff = datetime.utcnow() - REPORT_JOB_STALE_AFTER
+    failed = db.execute(
+        update(models.ReportJob)
+        .where(models.ReportJob.status == 'running', models.ReportJob.heartbeat_at < cutoff)
+        .values(status='failed', error='Worker stopped before the report finished', finished_at=datetime.utcnow())
+    ).rowcount
+    db.commit()
+    return failed
+
+
+def purge_expired():
+    """Delete result files older than the retention period."""
+    db = SessionLocal()
+    try:
+        cutoff = datetime.utcnow() - REPORT_JOB_RETENTION
+        expired = db.scalars(
+            select(models.ReportJob)
+            .where(models.ReportJob.result_path.isnot(None), models.ReportJob.finished_at < cutoff)
+        ).all()
+        for job in expired:
+            if os.path.exists(job.result_path):
+                os.remove(job.result_path)
+            job.result_path = None
+        db.commit()
+    finally:
+        db.close()
+
+
+def start():
+    """Start the worker pool and pick up jobs left queued by a previous run."""
+    global _executor
+    if REPORT_JOB_WORKERS <= 0 or _executor is not None:
+        return
+    _executor = ThreadPoolExecutor(max_workers=REPORT_JOB_WORKERS, thread_name_prefix='report-job')
+    db = SessionLocal()
+    try:
+        fail_stale_jobs(db)
+        queued = db.scalars(
+            select(models.ReportJob.id).where(models.ReportJob.status == 'queued').order_by(models.ReportJob.id)
+        ).all()
+    finally:
+        db.close()
+    for job_id in queued:
+        _enqueue(job_id)
+
+
+def shutdown():
+    """Stop taking jobs; queued ones stay queued for the next start."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+"""
+Double-entry journal for member money movements.
+
+Every deposit, withdrawal, transfer and loan repayment is written as one
+JournalEntry whose Postings sum to zero. Journal rows are only ever
+inserted. Account.balance is kept in step as the balance the pages read.
+It is always changed by a single conditional UPDATE, so concurrent debits
+can never overdraw an account or overwrite each other. derived_balance()
+rebuilds any balance from the latest BalanceSnapshot plus the postings
+after it.
+
+Run from the backend folder:
+
+    python ledger.py snapshot   # write balance snapshots (schedule periodically)
+    python ledger.py verify     # check Account.balance and entries against the journal
+"""
+import argparse
+import sys
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.orm.attributes import set_committed_value
+
+import dashboard
+import models
+import rollups
+from db import SessionLocal
+from money import Money, to_money
+
+# Internal ledgers on the bank's side of each entry
+CASH = 'cash'
+LOANS_RECEIVABLE = 'loans_receivable'
+INTEREST_INCOME = 'interest_income'
+OPENING_BALANCES = 'opening_balances'
+SALARY_EXPENSE = 'salary_expense'
+DIVIDENDS_PAYABLE = 'dividends_payable'
+
+# Postings newer than this are left for the next snapshot run, so a
+# transaction that committed late with a lower id is never skipped.
+SNAPSHOT_LAG = timedelta(seconds=60)
+
+ZERO = Decimal('0.00')
+
+
+class UnbalancedEntryError(ValueError):
+    pass
+
+
+class InsufficientFundsError(ValueError):
+    pass
+
+
+def post_entry(db, entry_type, postings, description=None, reference=None):
+    """Add a journal entry; ``postings`` is a list of (account_id, gl_code, signed amount)."""
+    postings = [(account_id, gl_code, to_money(amount)) for account_id, gl_code, amount in postings]
+    if sum(amount for _, _, amount in postings) != 0:
+        raise UnbalancedEntryError(f"{entry_type} entry does not balance: {postings}")
+    now = datetime.utcnow()
+    entry = models.JournalEntry(entry_type=entry_type, description=description, reference=reference, created_at=now)
+    db.add(entry)
+    db.flush()
+    db.add_all([
+        models.Posting(entry_id=entry.id, account_id=account_id, gl_code=gl_code, amount=amount, created_at=now)
+        for account_id, gl_code, amount in postings
+    ])
+    return entry
+
+
+def _apply_balance_changes(db, changes):
+    """Apply ``{account: delta}`` with one atomic UPDATE per account.
+
+    Debits only match while the balance covers them, so the check and the
+    write happen in the database rather than on a value read earlier. Rows
+    are updated in account id order so two opposite transfers always take
+    their row locks in the same order and cannot deadlock.
+    """
+    dashboard.mark_changed(db, [account.member_id for account in changes])
+    for account in sorted(changes, key=lambda a: a.id):
+        delta = to_money(changes[account])
+        stmt = (
+            update(models.Account)
+            .where(models.Account.id == account.id)
+            .values(balance=models.Account.balance + delta)
+            .returning(models.Account.balance)
+            .execution_options(synchronize_session=False)
+        )
+        if delta < 0:
+            stmt = stmt.where(models.Account.balance >= -delta)
+        new_balance = db.execute(stmt).scalar()
+        if new_balance is None:
+            raise InsufficientFundsError(f"account {account.id} cannot cover {-delta}")
+        # Reflect the stored value without marking the attribute dirty
+        set_committed_value(account, 'balance', new_balance)
+
+
+def _record_transaction(db, account, entry, txn_type, amount, description):
+    db.add(models.Transaction(account_id=account.id, type=txn_type, amount=amount, description=description,
+                              created_at=entry.created_at, journal_entry_id=entry.id))
+    rollups.add(db, [(entry.created_at, account.type, txn_type, amount)])
+
+
+def post_deposit(db, account, amount, description):
+    _apply_balance_changes(db, {account: amount})
+    entry = post_entry(db, 'deposit', [(account.id, None, amount), (None, CASH, -amount)], description)
+    _record_transaction(db, account, entry, 'Credit', amount, description)
+    return entry
+
+
+def post_withdrawal(db, account, amount, description):
+    _apply_balance_changes(db, {account: -amount})
+    entry = post_entry(db, 'withdrawal', [(account.id, None, -amount), (None, CASH, amount)], description)
+    _record_transaction(db, account, entry, 'Debit', amount, description)
+    return entry
+
+
+def post_transfer(db, sender_account, recipient_account, amount, debit_description, credit_description):
+    if sender_account.id == recipient_account.id:
+        raise ValueError("cannot transfer to the same account")
+    _apply_balance_changes(db, {sender_account: -amount, recipient_account: amount})
+    entry = post_entry(
+        db, 'transfer',
+        [(sender_account.id, None, -amount), (recipient_account.id, None, amount)],
+        debit_description,
+    )
+    _record_transaction(db, sender_account, entry, 'Debit', amount, debit_description)
+    _record_transaction(db, recipient_account, entry, 'Credit', amount, credit_description)
+    return entry
+
+
+def post_loan_repayment(db, loan, principal, interest, payment_method):
+    """Repayments arrive from outside the member's savings account (cash, UPI, ...)."""
+    # A negative part would post the entry in reverse, paying cash out of the loan book
+    if principal < 0 or interest < 0 or principal + interest == 0:
+        raise ValueError("repayment principal and interest must not be negative, and not both zero")
+    entry = post_entry(
+        db, 'loan_repayment',
+        [(None, CASH, -(principal + interest)), (None, LOANS_RECEIVABLE, principal), (None, INTEREST_INCOME, interest)],
+        f"Loan {loan.id} repayment via {payment_method}",
+        reference=f"loan:{loan.id}",
+    )
+    db.add(models.LoanRepayment(loan_id=loan.id, principal_paid=principal, interest_paid=interest,
+                                payment_method=payment_method))
+    return entry
+
+
+def post_bulk_credits(db, credits, gl_code, description, reference=None):
+    """Credit many accounts from one internal ledger as a single journal entry.
+
+    ``credits`` is a list of (account_id, amount, description). Postings,
+    transactions and balance updates each go out as one executemany, so
+    the cost of a batch does not grow with one round trip per row.
+    """
+    credits = [(account_id, to_money(amount), text) for account_id, amount, text in credits]
+    total = sum(amount for _, amount, _ in credits)
+    now = datetime.utcnow()
+    entry_id = db.execute(
+        insert(models.JournalEntry)
+        .values(entry_type='bulk_credit', description=description, reference=reference, created_at=now)
+        .returning(models.JournalEntry.id)
+    ).scalar_one()
+
+    postings = [{'entry_id': entry_id, 'account_id': account_id, 'gl_code': None, 'amount': amount, 'created_at': now}
+                for account_id, amount, _ in credits]
+    postings.append({'entry_id': entry_id, 'account_id': None, 'gl_code': gl_code, 'amount': -total, 'created_at': now})
+    db.execute(insert(models.Posting.__table__), postings)
+
+    db.execute(insert(models.Transaction.__table__), [
+        {'account_id': account_id, 'type': 'Credit', 'amount': amount, 'description': text,
+         'created_at': now, 'journal_entry_id': entry_id}
+        for account_id, amount, text in credits
+    ])
+
+    accounts = {account_id: (member_id, account_type) for account_id, member_id, account_type in db.execute(
+        select(models.Account.id, models.Account.member_id, models.Account.type)
+        .where(models.Account.id.in_({account_id for account_id, _, _ in credits}))
+    )}
+    rollups.add(db, [(now, accounts.get(account_id, (None, None))[1], 'Credit', amount) for account_id, amount, _ in credits])
+    dashboard.mark_changed(db, [member_id for member_id, _ in accounts.values()])
+
+    deltas = {}
+    for account_id, amount, _ in credits:
+        deltas[account_id] = deltas.get(account_id, ZERO) + amount
+    account_table = models.Account.__table__
+    db.execute(
+        account_table.update()
+        .where(account_table.c.id == bindparam('credit_account_id'))
+        .values(balance=account_table.c.balance + bindparam('credit_amount', type_=Money)),
+        [{'credit_account_id': account_id, 'credit_amount': amount} for account_id, amount in sorted(deltas.items())],
+    )
+    return entry_id
+
+
+def _key_clause(model, account_id, gl_code):
+    if account_id is not None:
+        return model.account_id == account_id
+    return model.gl_code == gl_code
+
+
+def derived_balance(db, account_id=None, gl_code=None, as_of=None):
+    """Balance of a member account or internal ledger from the journal, optionally at a point in time."""
+    snapshot_query = (
+        select(models.BalanceSnapshot)
+        .where(_key_clause(models.BalanceSnapshot, account_id, gl_code))
+        .order_by(models.BalanceSnapshot.last_posting_id.desc())
+        .limit(1)
+    )
+    if as_of is not None:
+        snapshot_query = snapshot_query.where(models.BalanceSnapshot.as_of <= as_of)
+    snapshot = db.scalars(snapshot_query).first()
+
+    postings_query = select(func.sum(models.Posting.amount)).where(_key_clause(models.Posting, account_id, gl_code))
+    if snapshot is not None:
+        postings_query = postings_query.where(models.Posting.id > snapshot.last_posting_id)
+    if as_of is not None:
+        postings_query = postings_query.where(models.Posting.created_at <= as_of)
+    since_snapshot = db.scalar(postings_query) or ZERO
+    return (snapshot.balance if snapshot is not None else ZERO) + since_snapshot
+
+
+def take_snapshots(db):
+    """Snapshot every account and ledger with postings since the previous run; returns the count written.
+
+    Runs always cover a contiguous posting id range, so each key's new
+    balance is its previous snapshot plus one grouped SUM over the range.
+    """
+    high_water = db.scalar(select(func.max(models.BalanceSnapshot.last_posting_id))) or 0
+    cutoff = datetime.utcnow() - SNAPSHOT_LAG
+    last_posting = db.execute(
+        select(models.Posting.id, models.Posting.created_at)
+        .where(models.Posting.id > high_water, models.Posting.created_at <= cutoff)
+        .order_by(models.Posting.id.desc())
+        .limit(1)
+    ).first()
+    if last_posting is None:
+        return 0
+    last_posting_id, as_of = last_posting
+
+    deltas = db.execute(
+        select(models.Posting.account_id, models.Posting.gl_code, func.sum(models.Posting.amount))
+        .where(models.Posting.id > high_water, models.Posting.id <= last_posting_id)
+        .group_by(models.Posting.account_id, models.Posting.gl_code)
+    ).all()
+
+    latest_ids = (
+        select(func.max(models.BalanceSnapshot.id).label('id'))
+        .group_by(models.BalanceSnapshot.account_id, models.BalanceSnapshot.gl_code)
+        .subquery()
+    )
+    previous = {
+        (snapshot.account_id, snapshot.gl_code): snapshot.balance
+        for snapshot in db.scalars(
+            select(models.BalanceSnapshot).join(latest_ids, models.BalanceSnapshot.id == latest_ids.c.id)
+        )
+    }
+
+    rows = [
+        {
+            'account_id': account_id,
+            'gl_code': gl_code,
+            'balance': previous.get((account_id, gl_code), ZERO) + delta,
+            'last_posting_id': last_posting_id,
+            'as_of': as_of,
+            'created_at': datetime.utcnow(),
+        }
+        for account_id, gl_code, delta in deltas
+    ]
+    if rows:
+        db.execute(models.BalanceSnapshot.__table__.insert(), rows)
+    return len(rows)
+
+
+def verify(db):
+    """Return a list of problems: unbalanced entries and accounts whose balance disagrees with the journal."""
+    problems = []
+    unbalanced = db.execute(
+        select(models.Posting.entry_id)
+        .group_by(models.Posting.entry_id)
+        .having(func.sum(models.Posting.amount) != 0)
+    ).scalars().all()
+    problems.extend(f"journal entry {entry_id} does not balance" for entry_id in unbalanced)
+
+    journal_balances = dict(db.execute(
+        select(models.Posting.account_id, func.sum(models.Posting.amount))
+        .where(models.Posting.account_id.isnot(None))
+        .group_by(models.Posting.account_id)
+    ).all())
+    for account_id, balance in db.execute(select(models.Account.id, models.Account.balance)):
+        expected = journal_balances.get(account_id, ZERO)
+        if (balance or ZERO) != expected:
+            problems.append(f"account {account_id}: balance {balance} but journal says {expected}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["snapshot", "verify"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "snapshot":
+            written = take_snapshots(db)
+            db.commit()
+            print(f"Wrote {written} balance snapshots")
+        else:
+            problems = verify(db)
+            for problem in problems:
+                print(problem)
+            print("Ledger OK" if not problems else f"{len(problems)} problems found")
+            if problems:
+                sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,114 +1,129 @@
 import os
-from fastapi import FastAPI, Request, Form, Depends, status, Cookie, UploadFile, File
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse
+import time
+
+# Cold-start clock: started before the heavy imports below
+_import_started = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Form, Depends, status, Cookie, UploadFile, File, Query
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse, FileResponse, Response
 from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from db import SessionLocal, engine, Base
+from db import SessionLocal, async_session, startup_lock, upgrade_database
 import models
+import assets
+import bulk_transfer
+import compression
+import dashboard
+import exports
+import idempotency
+import jobs
+import ledger
+import member_list
+import page_cache
+import pagination
+import rates
+import report_summary
+import rollups
+import search
+import stats
+import templating
+from money import to_money
 import requests
 import smtplib
 from email.mime.text import MIMEText
 import csv
 import io
 import random
-from datetime import datetime, timedelta
-
-app = FastAPI()
-
-# Create the database tables after models have been imported
-Base.metadata.create_all(bind=engine)
-
-# Seed initial interest rates if they don't exist
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+# Startup behaviour. Workers that boot together take turns under
+# startup_lock(): the first migrates and seeds, the rest find nothing to do.
+# Production deployments run `alembic upgrade head` once before rolling out
+# workers and set AUTO_MIGRATE=false so each worker starts without touching
+# the schema.
+AUTO_MIGRATE = os.getenv('AUTO_MIGRATE', 'true').lower() == 'true'
+SEED_INTEREST_RATES = os.getenv('SEED_INTEREST_RATES', 'true').lower() == 'true'
+# Deployments that run `python assets.py build` once can set BUILD_ASSETS=false
+BUILD_ASSETS = os.getenv('BUILD_ASSETS', 'true').lower() == 'true'
+# Compile every template at startup (bytecode cached under TEMPLATE_CACHE_DIR)
+# instead of on its first request
+PRECOMPILE_TEMPLATES = os.getenv('PRECOMPILE_TEMPLATES', 'true').lower() == 'true'
+
+# Default rate cards, inserted on startup when missing
+DEFAULT_LOAN_RATES = [
+    # (loan_type, interest_rate, min_amount, max_amount)
+    ('Personal', 12.5, 10000, 500000),
+    ('Education', 9.5, 50000, 2500000),
+    ('Home', 8.5, 500000, 50000000),
+    ('Vehicle', 10.5, 100000, 2000000),
+    ('Business', 11.5, 200000, 10000000),
+    ('Emergency', 14.5, 10000, 300000),
+]
+
+DEFAULT_FD_RATES = [
+    # (fd_type, tenure_months, tenure_years, interest_rate)
+    # Fixed Deposits
+    ('Fixed', 3, None, 3.0),
+    ('Fixed', 6, None, 3.5),
+    ('Fixed', None, 1, 4.5),
+    ('Fixed', None, 2, 5.0),
+    ('Fixed', None, 3, 5.5),
+    ('Fixed', None, 5, 6.5),
+    ('Fixed', None, 7, 7.0),
+    ('Fixed', None, 10, 7.5),
+    # Recurring Deposits
+    ('Recurring', 6, None, 2.5),
+    ('Recurring', 12, None, 3.0),
+    ('Recurring', None, 1, 3.5),
+    ('Recurring', None, 2, 4.0),
+    ('Recurring', None, 3, 4.5),
+    ('Recurring', None, 5, 5.5),
+    # Senior Citizen Fixed Deposits
+    ('Senior Citizen', 3, None, 4.0),
+    ('Senior Citizen', 6, None, 4.5),
+    ('Senior Citizen', None, 1, 5.5),
+    ('Senior Citizen', None, 2, 6.0),
+    ('Senior Citizen', None, 3, 6.5),
+    ('Senior Citizen', None, 5, 7.5),
+    ('Senior Citizen', None, 7, 8.0),
+    ('Senior Citizen', None, 10, 8.5),
+]
+
+
+# Seed initial interest rates if they don't exist: one key scan and at most
+# one bulk insert per rate table
 def seed_interest_rates():
     db = SessionLocal()
     try:
-        # Check and create default loan interest rates
-        loan_types = [
-            ('Personal', 12.5, 10000, 500000),
-            ('Education', 9.5, 50000, 2500000),
-            ('Home', 8.5, 500000, 50000000),
-            ('Vehicle', 10.5, 100000, 2000000),
-            ('Business', 11.5, 200000, 10000000),
-            ('Emergency', 14.5, 10000, 300000),
-        ]
-        
-        for loan_type, rate, min_amt, max_amt in loan_types:
-            existing = db.query(models.LoanInterestRate).filter_by(loan_type=loan_type).first()
-            if not existing:
-                db.add(models.LoanInterestRate(
-                    loan_type=loan_type,
-                    interest_rate=rate,
-                    min_amount=min_amt,
-                    max_amount=max_amt
-                ))
-        
-        # Check and create default FD interest rates based on tenure (months and years)
-        # Fixed Deposits - Monthly
-        fixed_monthly_rates = [
-            ('Fixed', 3, None, 3.0),
-            ('Fixed', 6, None, 3.5),
-        ]
-        
-        # Fixed Deposits - Yearly
-        fixed_yearly_rates = [
-            ('Fixed', None, 1, 4.5),
-            ('Fixed', None, 2, 5.0),
-            ('Fixed', None, 3, 5.5),
-            ('Fixed', None, 5, 6.5),
-            ('Fixed', None, 7, 7.0),
-            ('Fixed', None, 10, 7.5),
-        ]
-        
-        # Recurring Deposits - Monthly
-        recurring_monthly_rates = [
-            ('Recurring', 6, None, 2.5),
-            ('Recurring', 12, None, 3.0),
-        ]
-        
-        # Recurring Deposits - Yearly
-        recurring_yearly_rates = [
-            ('Recurring', None, 1, 3.5),
-            ('Recurring', None, 2, 4.0),
-            ('Recurring', None, 3, 4.5),
-            ('Recurring', None, 5, 5.5),
+        existing_loan_types = set(db.scalars(select(models.LoanInterestRate.loan_type)))
+        missing_loan_rates = [
+            {'loan_type': loan_type, 'interest_rate': rate, 'min_amount': min_amt, 'max_amount': max_amt}
+            for loan_type, rate, min_amt, max_amt in DEFAULT_LOAN_RATES
+            if loan_type not in existing_loan_types
         ]
-        
-        # Senior Citizen Fixed Deposits - Monthly
-        senior_monthly_rates = [
-            ('Senior Citizen', 3, None, 4.0),
-            ('Senior Citizen', 6, None, 4.5),
-        ]
-        
-        # Senior Citizen Fixed Deposits - Yearly
-        senior_yearly_rates = [
-            ('Senior Citizen', None, 1, 5.5),
-            ('Senior Citizen', None, 2, 6.0),
-            ('Senior Citizen', None, 3, 6.5),
-            ('Senior Citizen', None, 5, 7.5),
-            ('Senior Citizen', None, 7, 8.0),
-            ('Senior Citizen', None, 10, 8.5),
+        if missing_loan_rates:
+            db.execute(models.LoanInterestRate.__table__.insert(), missing_loan_rates)
+
+        existing_fd_slabs = set(db.execute(select(
+            models.FDInterestRate.fd_type,
+            models.FDInterestRate.tenure_months,
+            models.FDInterestRate.tenure_years,
+        )).all())
+        missing_fd_rates = [
+            {'fd_type': fd_type, 'tenure_months': tenure_months, 'tenure_years': tenure_years, 'interest_rate': rate}
+            for fd_type, tenure_months, tenure_years, rate in DEFAULT_FD_RATES
+            if (fd_type, tenure_months, tenure_years) not in existing_fd_slabs
         ]
-        
-        # Combine all FD rates
-        all_fd_rates = (fixed_monthly_rates + fixed_yearly_rates + 
-                       recurring_monthly_rates + recurring_yearly_rates + 
-                       senior_monthly_rates + senior_yearly_rates)
-        
-        for fd_type, tenure_months, tenure_years, rate in all_fd_rates:
-            existing = db.query(models.FDInterestRate).filter_by(
-                fd_type=fd_type, 
-                tenure_months=tenure_months, 
-                tenure_years=tenure_years
-            ).first()
-            if not existing:
-                db.add(models.FDInterestRate(
-                    fd_type=fd_type,
-                    tenure_months=tenure_months,
-                    tenure_years=tenure_years,
-                    interest_rate=rate
-                ))
-        
+        if missing_fd_rates:
+            db.execute(models.FDInterestRate.__table__.insert(), missing_fd_rates)
+        if missing_loan_rates or missing_fd_rates:
+            rates.mark_changed(db)
+
         db.commit()
     except Exception as e:
         print(f"Error seeding interest rates: {e}")
@@ -116,19 +131,42 @@ def seed_interest_rates():
     finally:
         db.close()
 
-seed_interest_rates()
 
-base_dir = os.path.dirname(__file__)
-app.mount("/static", StaticFiles(directory=os.path.join(base_dir, "static")), name="static")
-templates = Jinja2Templates(directory=os.path.join(base_dir, "templates"))
-
-# Add custom Jinja2 filters
-def strftime_filter(dt, format_string):
-    if dt:
-        return dt.strftime(format_string)
-    return ''
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    timings = {'import_ms': time.perf_counter() - _import_started}
+    if AUTO_MIGRATE or SEED_INTEREST_RATES:
+        with startup_lock():
+            if AUTO_MIGRATE:
+                started = time.perf_counter()
+                upgrade_database()
+                timings['migrate_ms'] = time.perf_counter() - started
+            if SEED_INTEREST_RATES:
+                started = time.perf_counter()
+                seed_interest_rates()
+                timings['seed_ms'] = time.perf_counter() - started
+    if BUILD_ASSETS:
+        started = time.perf_counter()
+        assets.build()
+        timings['assets_ms'] = time.perf_counter() - started
+    if PRECOMPILE_TEMPLATES:
+        started = time.perf_counter()
+        templating.precompile(templates.env)
+        timings['templates_ms'] = time.perf_counter() - started
+    timings['startup_ms'] = time.perf_counter() - _import_started
+    app.state.startup_timings = {name: round(seconds * 1000, 1) for name, seconds in timings.items()}
+    print(f"Startup timings (ms): {app.state.startup_timings}")
+    jobs.start()
+    yield
+    jobs.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(compression.CompressionMiddleware)
 
-templates.env.filters['strftime'] = strftime_filter
+base_dir = os.path.dirname(__file__)
+app.mount("/static", assets.AssetFiles(directory=os.path.join(base_dir, "static")), name="static")
+templates = Jinja2Templates(env=templating.build_environment())
 
 # Read sensitive config from environment variables. Use a .env or system env to set these.
 FAST2SMS_API_KEY = os.getenv('FAST2SMS_API_KEY')  # e.g. from fast2sms
@@ -192,11 +230,31 @@ def get_db():
         db.close()
 
 
-# Home page
+# Async sessions keep money-movement requests on the event loop instead of
+# holding a threadpool worker for the whole ORM round trip.
+async def get_async_db():
+    async with async_session() as db:
+        yield db
+
+
+async def get_member_account(db: AsyncSession, member_id: int):
+    result = await db.execute(select(models.Account).filter_by(member_id=member_id).limit(1))
+    return result.scalars().first()
+
+
+# Home page; cached until an announcement changes (see page_cache.py)
 @app.get("/", response_class=HTMLResponse)
 def index(request: Request, db: Session = Depends(get_db)):
-    announcements = db.query(models.Announcement).order_by(models.Announcement.created_at.desc()).all()
-    return templates.TemplateResponse("index.html", {"request": request, "announcements": announcements})
+    def render():
+        announcements = db.query(models.Announcement).order_by(models.Announcement.created_at.desc()).all()
+        return templates.TemplateResponse("index.html", {"request": request, "announcements": announcements})
+    return page_cache.serve(request, "/", render)
+
+
+# Health check; reports how long this worker took to become ready
+@app.get("/healthz")
+def healthz(request: Request):
+    return JSONResponse({'ok': True, 'startup_timings': getattr(request.app.state, 'startup_timings', None)})
 
 
 # Member login
@@ -244,19 +302,25 @@ def admin_login(request: Request, username: str = Form(...), password: str = For
     return templates.TemplateResponse("admin_login.html", {"request": request, "error": "Invalid admin credentials."})
 
 
+# Admin dashboard; counters come from stats.py, and the approval list shows
+# the oldest ADMIN_PENDING_LIMIT applications
+ADMIN_PENDING_LIMIT = 50
+
+
 @app.get("/admin", response_class=HTMLResponse, name="admin")
 def admin_dashboard(request: Request, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
-    members = db.query(models.Member).all()
-    unapproved_members = db.query(models.Member).filter_by(is_approved=False).all()
+    counts = stats.counts(db)
+    unapproved_members = (db.query(models.Member).filter_by(is_approved=False)
+                          .order_by(models.Member.id).limit(ADMIN_PENDING_LIMIT).all())
     recent_members = db.query(models.Member).order_by(models.Member.id.desc()).limit(10).all()
-    members_count = db.query(models.Member).count()
     return templates.TemplateResponse(
         "admin.html",
         {
             "request": request,
-            "members_count": members_count,
+            "members_count": counts['members']['total'],
+            "pending_count": counts['members']['pending'],
             "recent_members": recent_members,
             "unapproved_members": unapproved_members,
         },
@@ -278,21 +342,27 @@ def admin_new_members(request: Request, is_admin: str = Cookie(default=None), db
 
 
 @app.get("/admin/all-members", response_class=HTMLResponse, name="admin_all_members")
-def admin_all_members(request: Request, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+def admin_all_members(request: Request, approval: str = Query(None, alias='status'), sort: str = 'newest', cursor: str = None,
+                      per_page: int = pagination.PAGE_SIZE, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
-    members = db.query(models.Member).all()
-    approved_count = db.query(models.Member).filter_by(is_approved=True).count()
-    pending_count = db.query(models.Member).filter_by(is_approved=False).count()
-    total_members = db.query(models.Member).count()
+    stmt = select(models.Member)
+    if approval in ('approved', 'pending'):
+        stmt = stmt.where(models.Member.is_approved == (approval == 'approved'))
+    try:
+        page = pagination.paginate(db, stmt, models.Member, cursor, per_page, sort)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    member_counts = stats.counts(db)['members']
     return templates.TemplateResponse(
         "admin_all_members.html",
         {
             "request": request,
-            "members": members,
-            "total_members": total_members,
-            "approved_count": approved_count,
-            "pending_count": pending_count,
+            "members": page.items,
+            "page": page,
+            "total_members": member_counts['total'],
+            "approved_count": member_counts['approved'],
+            "pending_count": member_counts['pending'],
         },
     )
 
@@ -499,55 +569,48 @@ def admin_add_member(request: Request, name: str = Form(...), account_no: str =
     return RedirectResponse(url="/admin", status_code=status.HTTP_303_SEE_OTHER)
 
 
-# Member dashboard
+# Member dashboard, served from a per-member cache (see dashboard.py)
 @app.get("/member-dashboard", response_class=HTMLResponse, name="member_dashboard")
 def member_dashboard(request: Request, db: Session = Depends(get_db)):
     member_id = request.cookies.get("member_id")
-    if not member_id:
+    if not member_id or not member_id.isdigit():
         return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
-    member = db.query(models.Member).get(member_id)
-    if not member:
+    data = dashboard.load(db, int(member_id))
+    if data is None:
         return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
-    account = db.query(models.Account).filter_by(member_id=member_id).first() if member else None
-    transactions = db.query(models.Transaction).filter_by(account_id=account.id).all() if account else []
-    loans = db.query(models.Loan).filter_by(member_id=member_id).all() if member else []
-    deposits = db.query(models.Deposit).filter_by(member_id=member_id).all() if member else []
-    shares = db.query(models.Share).filter_by(member_id=member_id).all() if member else []
     return templates.TemplateResponse("member_dashboard.html", {
         "request": request,
-        "member": member,
-        "account": account,
-        "transactions": transactions,
-        "loans": loans,
-        "deposits": deposits,
-        "shares": shares
+        **data
     })
 
 
-# List members
+# List members, a page at a time (see member_list.py); admins only
 @app.get("/members", response_class=HTMLResponse, name="list_members")
-def list_members(request: Request, db: Session = Depends(get_db)):
-    members = db.query(models.Member).all()
-    member_details = []
-    for member in members:
-        loans = db.query(models.Loan).filter_by(member_id=member.id).all()
-        account = db.query(models.Account).filter_by(member_id=member.id).first()
-        transactions = db.query(models.Transaction).filter_by(account_id=account.id).all() if account else []
-        fixed_deposits = db.query(models.Deposit).filter_by(member_id=member.id).all()
-        member_details.append({
-            'member': member,
-            'loans': loans,
-            'transactions': transactions,
-            'fixed_deposits': fixed_deposits
-        })
-    return templates.TemplateResponse("list_members.html", {"request": request, "member_details": member_details})
+def list_members(request: Request, page: int = 1, per_page: int = member_list.MEMBERS_PER_PAGE,
+                 is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
+    return templates.TemplateResponse("list_members.html", {
+        "request": request,
+        **member_list.member_list_page(db, page, per_page)
+    })
 
 
-# Other list endpoints
+# Other list endpoints, admins only. Each page is keyset-paginated on
+# (created_at, id) (see pagination.py) and takes the shared filters,
+# ?sort=newest|oldest and ?cursor= from the previous page's "Next" link.
 @app.get("/accounts", response_class=HTMLResponse, name="list_accounts")
-def list_accounts(request: Request, db: Session = Depends(get_db)):
-    accounts = db.query(models.Account).all()
-    return templates.TemplateResponse("accounts.html", {"request": request, "accounts": accounts})
+def list_accounts(request: Request, status_filter: str = Query(None, alias='status'), type: str = None, member_id: int = None,
+                  date_from: date = None, date_to: date = None, sort: str = 'newest', cursor: str = None,
+                  per_page: int = pagination.PAGE_SIZE, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
+    stmt = pagination.filter_rows(select(models.Account), models.Account, status_filter, type, member_id, date_from, date_to)
+    try:
+        page = pagination.paginate(db, stmt, models.Account, cursor, per_page, sort)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    return templates.TemplateResponse("list_accounts.html", {"request": request, "accounts": page.items, "page": page})
 
 
 @app.get("/api/member/loans")
@@ -561,7 +624,7 @@ def get_member_loans(request: Request, db: Session = Depends(get_db)):
         {
             'id': loan.id,
             'loan_type': loan.loan_type,
-            'amount': loan.amount,
+            'amount': float(loan.amount),
             'interest_rate': loan.interest_rate,
             'tenure_months': loan.tenure_months,
             'status': loan.status,
@@ -573,21 +636,46 @@ def get_member_loans(request: Request, db: Session = Depends(get_db)):
 
 
 @app.get("/loans", response_class=HTMLResponse, name="list_loans")
-def list_loans(request: Request, db: Session = Depends(get_db)):
-    loans = db.query(models.Loan).all()
-    return templates.TemplateResponse("loans.html", {"request": request, "loans": loans})
+def list_loans(request: Request, status_filter: str = Query(None, alias='status'), type: str = None, member_id: int = None,
+               date_from: date = None, date_to: date = None, sort: str = 'newest', cursor: str = None,
+               per_page: int = pagination.PAGE_SIZE, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
+    stmt = pagination.filter_rows(select(models.Loan), models.Loan, status_filter, type, member_id, date_from, date_to)
+    try:
+        page = pagination.paginate(db, stmt, models.Loan, cursor, per_page, sort)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    return templates.TemplateResponse("list_loans.html", {"request": request, "loans": page.items, "page": page})
 
 
 @app.get("/deposits", response_class=HTMLResponse, name="list_deposits")
-def list_deposits(request: Request, db: Session = Depends(get_db)):
-    deposits = db.query(models.Deposit).all()
-    return templates.TemplateResponse("deposits.html", {"request": request, "deposits": deposits})
+def list_deposits(request: Request, status_filter: str = Query(None, alias='status'), type: str = None, member_id: int = None,
+                  date_from: date = None, date_to: date = None, sort: str = 'newest', cursor: str = None,
+                  per_page: int = pagination.PAGE_SIZE, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
+    stmt = pagination.filter_rows(select(models.Deposit), models.Deposit, status_filter, type, member_id, date_from, date_to)
+    try:
+        page = pagination.paginate(db, stmt, models.Deposit, cursor, per_page, sort)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    return templates.TemplateResponse("list_deposits.html", {"request": request, "deposits": page.items, "page": page})
 
 
+# Filter with ?type=Credit|Debit; ?member_id= covers all of a member's accounts
 @app.get("/transactions", response_class=HTMLResponse, name="list_transactions")
-def list_transactions(request: Request, db: Session = Depends(get_db)):
-    transactions = db.query(models.Transaction).all()
-    return templates.TemplateResponse("transactions.html", {"request": request, "transactions": transactions})
+def list_transactions(request: Request, type: str = None, member_id: int = None,
+                      date_from: date = None, date_to: date = None, sort: str = 'newest', cursor: str = None,
+                      per_page: int = pagination.PAGE_SIZE, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
+    stmt = pagination.filter_rows(select(models.Transaction), models.Transaction, None, type, member_id, date_from, date_to)
+    try:
+        page = pagination.paginate(db, stmt, models.Transaction, cursor, per_page, sort)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    return templates.TemplateResponse("list_transactions.html", {"request": request, "transactions": page.items, "page": page})
 
 
 # Loan application form
@@ -600,11 +688,13 @@ def loan_application_form(request: Request):
 
 
 @app.get("/fd-application", response_class=HTMLResponse)
-def fd_application_form(request: Request):
+def fd_application_form(request: Request, db: Session = Depends(get_db)):
     member_id = request.cookies.get("member_id")
     if not member_id:
         return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
-    return templates.TemplateResponse("fd_application_form.html", {"request": request})
+    # Slab tenures and rates for the calculator, the same matrix apply-fd quotes from
+    fd_matrix = {fd_type: list(zip(slabs.tenures, slabs.rates)) for fd_type, slabs in rates.book(db).fd_matrix.items()}
+    return templates.TemplateResponse("fd_application_form.html", {"request": request, "fd_matrix": fd_matrix})
 
 
 @app.get("/share-investment", response_class=HTMLResponse)
@@ -627,35 +717,30 @@ def loan_repayment_form(request: Request):
 def admin_approvals_page(request: Request, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
-    pending_loans = db.query(models.Loan).filter_by(status='Pending').all()
-    pending_fds = db.query(models.Deposit).filter_by(status='Pending').all()
-    pending_shares = db.query(models.Share).filter_by(status='Pending').all()
     return templates.TemplateResponse("admin_approvals.html", {
         "request": request,
-        "pending_loans": pending_loans,
-        "pending_fds": pending_fds,
-        "pending_shares": pending_shares
+        "counts": stats.counts(db)
     })
 
 
 @app.get("/vision", response_class=HTMLResponse, name="vision")
 def vision(request: Request):
-    return templates.TemplateResponse("vision.html", {"request": request})
+    return page_cache.serve(request, "/vision", lambda: templates.TemplateResponse("vision.html", {"request": request}))
 
 
 @app.get("/services", response_class=HTMLResponse, name="services")
 def services(request: Request):
-    return templates.TemplateResponse("services.html", {"request": request})
+    return page_cache.serve(request, "/services", lambda: templates.TemplateResponse("services.html", {"request": request}))
 
 
 @app.get("/benefits", response_class=HTMLResponse, name="benefits")
 def benefits(request: Request):
-    return templates.TemplateResponse("benefits.html", {"request": request})
+    return page_cache.serve(request, "/benefits", lambda: templates.TemplateResponse("benefits.html", {"request": request}))
 
 
 @app.get("/about", response_class=HTMLResponse)
 def about(request: Request):
-    return templates.TemplateResponse("about.html", {"request": request})
+    return page_cache.serve(request, "/about", lambda: templates.TemplateResponse("about.html", {"request": request}))
 
 
 @app.get("/contact", response_class=HTMLResponse)
@@ -665,26 +750,28 @@ def contact(request: Request):
 
 @app.get("/help", response_class=HTMLResponse)
 def help_page(request: Request):
-    return templates.TemplateResponse("help.html", {"request": request})
+    return page_cache.serve(request, "/help", lambda: templates.TemplateResponse("help.html", {"request": request}))
 
 
 @app.get("/gallery", response_class=HTMLResponse)
 def gallery(request: Request):
-    # List files from static/gallery (if present)
-    gallery_dir = os.path.join(os.path.dirname(__file__), "static", "gallery")
-    images = []
-    try:
-        for fname in sorted(os.listdir(gallery_dir)):
-            if fname.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                images.append(f"/static/gallery/{fname}")
-    except FileNotFoundError:
+    def render():
+        # List files from static/gallery (if present)
+        gallery_dir = os.path.join(os.path.dirname(__file__), "static", "gallery")
         images = []
-    return templates.TemplateResponse("gallery.html", {"request": request, "images": images})
+        try:
+            for fname in sorted(os.listdir(gallery_dir)):
+                if fname.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
+                    images.append(f"/static/gallery/{fname}")
+        except FileNotFoundError:
+            images = []
+        return templates.TemplateResponse("gallery.html", {"request": request, "images": images})
+    return page_cache.serve(request, "/gallery", render)
 
 
 # Member loan application
 @app.post("/member/apply-loan")
-def apply_loan(request: Request, loan_type: str = Form(...), amount: float = Form(...), tenure_months: int = Form(...), purpose: str = Form(default=''), db: Session = Depends(get_db)):
+def apply_loan(request: Request, loan_type: str = Form(...), amount: Decimal = Form(...), tenure_months: int = Form(...), purpose: str = Form(default=''), db: Session = Depends(get_db)):
     member_id = request.cookies.get("member_id")
     if not member_id:
         return JSONResponse({'ok': False, 'error': 'Not authenticated'}, status_code=401)
@@ -693,17 +780,21 @@ def apply_loan(request: Request, loan_type: str = Form(...), amount: float = For
     if not member:
         return JSONResponse({'ok': False, 'error': 'Member not found'}, status_code=404)
     
-    # Get interest rate from LoanInterestRate table
-    rate_config = db.query(models.LoanInterestRate).filter_by(loan_type=loan_type).first()
+    # Get interest rate from the rate book
+    rate_config = rates.book(db).loan_rates.get(loan_type)
     if not rate_config:
         return JSONResponse({'ok': False, 'error': 'Invalid loan type'}, status_code=400)
+    try:
+        amount = to_money(amount)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
     
     # Create loan with automatic interest rate
     loan = models.Loan(
         member_id=member_id,
         loan_type=loan_type,
         amount=amount,
-        interest_rate=rate_config.interest_rate,
+        interest_rate=rate_config['interest_rate'],
         tenure_months=tenure_months,
         status='Pending',
         office_note=purpose
@@ -720,7 +811,7 @@ def apply_loan(request: Request, loan_type: str = Form(...), amount: float = For
 def invest_shares(
     request: Request,
     quantity: int = Form(...),
-    amount_per_share: float = Form(...),
+    amount_per_share: Decimal = Form(...),
     notes: str = Form(default=''),
     db: Session = Depends(get_db)
 ):
@@ -736,7 +827,11 @@ def invest_shares(
         if quantity < 1:
             return JSONResponse({'ok': False, 'error': 'Minimum 1 share required'}, status_code=400)
         
-        total = quantity * amount_per_share
+        try:
+            amount_per_share = to_money(amount_per_share)
+            total = to_money(quantity * amount_per_share)
+        except ValueError as e:
+            return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
         share = models.Share(
             member_id=int(member_id),
             quantity=quantity,
@@ -822,93 +917,131 @@ def reject_share(request: Request, share_id: int = Form(...), office_note: str =
 
 # Admin loan repayment & pre-closure
 @app.post("/member/repay-loan")
-def repay_loan(request: Request, loan_id: int = Form(...), principal: float = Form(...), interest: float = Form(...), payment_method: str = Form(...), db: Session = Depends(get_db)):
+def repay_loan(request: Request, loan_id: int = Form(...), principal: Decimal = Form(...), interest: Decimal = Form(...), payment_method: str = Form(...), db: Session = Depends(get_db)):
     member_id = request.cookies.get("member_id")
     if not member_id:
         return JSONResponse({'ok': False, 'error': 'Not authenticated'}, status_code=401)
+    claim, replayed = idempotency.claim(
+        db, int(member_id), request.headers.get(idempotency.HEADER),
+        idempotency.request_hash('/member/repay-loan', loan_id=loan_id, principal=principal,
+                                 interest=interest, payment_method=payment_method),
+    )
+    if replayed is not None:
+        return replayed
     loan = db.query(models.Loan).get(loan_id)
     if not loan or loan.member_id != int(member_id):
         return JSONResponse({'ok': False, 'error': 'Loan not found or unauthorized'}, status_code=404)
-    repayment = models.LoanRepayment(loan_id=loan_id, principal_paid=principal, interest_paid=interest, payment_method=payment_method)
-    db.add(repayment)
-    if principal + interest >= (loan.amount + (loan.amount * loan.interest_rate / 100)):
+    try:
+        principal, interest = to_money(principal), to_money(interest)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    if principal < 0 or interest < 0:
+        return JSONResponse({'ok': False, 'error': 'Principal and interest cannot be negative'}, status_code=400)
+    if principal + interest == 0:
+        return JSONResponse({'ok': False, 'error': 'Repayment amount must be positive'}, status_code=400)
+    ledger.post_loan_repayment(db, loan, principal, interest, payment_method)
+    total_due = loan.amount + to_money(loan.amount * Decimal(str(loan.interest_rate)) / 100)
+    if principal + interest >= total_due:
         loan.repayment_status = 'Completed'
     else:
         loan.repayment_status = 'Active'
+    response = idempotency.complete(claim, {'ok': True, 'message': 'Repayment recorded'})
     db.commit()
-    return JSONResponse({'ok': True, 'message': 'Repayment recorded'})
+    return response
 
 
 # Member to Member Transfer
 @app.post("/member/transfer")
-def transfer_funds(request: Request, recipient_account_no: str = Form(...), amount: float = Form(...), 
-                   description: str = Form(default="Transfer"), db: Session = Depends(get_db)):
+async def transfer_funds(request: Request, recipient_account_no: str = Form(...), amount: Decimal = Form(...), 
+                   description: str = Form(default="Transfer"), db: AsyncSession = Depends(get_async_db)):
     member_id = request.cookies.get("member_id")
     if not member_id:
         return JSONResponse({'ok': False, 'error': 'Not authenticated'}, status_code=401)
     
-    member = db.query(models.Member).get(member_id)
+    claim, replayed = await db.run_sync(
+        idempotency.claim, int(member_id), request.headers.get(idempotency.HEADER),
+        idempotency.request_hash('/member/transfer', recipient_account_no=recipient_account_no,
+                                 amount=amount, description=description),
+    )
+    if replayed is not None:
+        return replayed
+    
+    member = await db.get(models.Member, int(member_id))
     if not member:
         return JSONResponse({'ok': False, 'error': 'Sender not found'}, status_code=404)
     
-    recipient = db.query(models.Member).filter_by(account_no=recipient_account_no).first()
+    result = await db.execute(select(models.Member).filter_by(account_no=recipient_account_no).limit(1))
+    recipient = result.scalars().first()
     if not recipient:
         return JSONResponse({'ok': False, 'error': 'Recipient not found'}, status_code=404)
     
+    try:
+        amount = to_money(amount)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
     if amount <= 0:
         return JSONResponse({'ok': False, 'error': 'Amount must be positive'}, status_code=400)
     
-    sender_account = db.query(models.Account).filter_by(member_id=member_id).first()
-    recipient_account = db.query(models.Account).filter_by(member_id=recipient.id).first()
+    sender_account = await get_member_account(db, member.id)
+    recipient_account = await get_member_account(db, recipient.id)
     
     if not sender_account or not recipient_account:
         return JSONResponse({'ok': False, 'error': 'Account not found'}, status_code=404)
     
+    if sender_account.id == recipient_account.id:
+        return JSONResponse({'ok': False, 'error': 'Cannot transfer to your own account'}, status_code=400)
+    
     if sender_account.balance < amount:
         return JSONResponse({'ok': False, 'error': 'Insufficient balance'}, status_code=400)
     
-    # Atomic transaction
+    # Atomic transaction: one journal entry debiting the sender and crediting the recipient
     try:
-        sender_account.balance -= amount
-        recipient_account.balance += amount
-        
-        # Create transaction records
-        debit_txn = models.Transaction(account_id=sender_account.id, type='Debit', amount=amount, 
-                                      description=f"Transfer to {recipient.account_no}")
-        credit_txn = models.Transaction(account_id=recipient_account.id, type='Credit', amount=amount,
-                                       description=f"Transfer from {member.account_no}")
-        
-        db.add(debit_txn)
-        db.add(credit_txn)
-        db.commit()
-        
-        return JSONResponse({'ok': True, 'message': f'₹{amount} transferred to {recipient.account_no}'})
+        await db.run_sync(ledger.post_transfer, sender_account, recipient_account, amount,
+                          f"Transfer to {recipient.account_no}", f"Transfer from {member.account_no}")
+        response = idempotency.complete(claim, {'ok': True, 'message': f'₹{amount} transferred to {recipient.account_no}'})
+        await db.commit()
+        return response
+    except ledger.InsufficientFundsError:
+        # Another request spent the balance after the check above
+        await db.rollback()
+        return JSONResponse({'ok': False, 'error': 'Insufficient balance'}, status_code=400)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
 
 
 # Member withdrawal
 @app.post("/member/withdraw")
-def withdraw_funds(
+async def withdraw_funds(
     request: Request,
-    amount: float = Form(...),
+    amount: Decimal = Form(...),
     description: str = Form(default="Withdrawal"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     member_id = request.cookies.get("member_id")
     if not member_id:
         return JSONResponse({'ok': False, 'error': 'Not authenticated'}, status_code=401)
     
     try:
-        member = db.query(models.Member).get(int(member_id))
+        claim, replayed = await db.run_sync(
+            idempotency.claim, int(member_id), request.headers.get(idempotency.HEADER),
+            idempotency.request_hash('/member/withdraw', amount=amount, description=description),
+        )
+        if replayed is not None:
+            return replayed
+        
+        member = await db.get(models.Member, int(member_id))
         if not member:
             return JSONResponse({'ok': False, 'error': 'Member not found'}, status_code=404)
         
-        account = db.query(models.Account).filter_by(member_id=int(member_id)).first()
+        account = await get_member_account(db, member.id)
         if not account:
             return JSONResponse({'ok': False, 'error': 'Account not found'}, status_code=404)
         
+        try:
+            amount = to_money(amount)
+        except ValueError as e:
+            return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
         if amount <= 0:
             return JSONResponse({'ok': False, 'error': 'Amount must be positive'}, status_code=400)
         
@@ -919,26 +1052,20 @@ def withdraw_funds(
             return JSONResponse({'ok': False, 'error': f'Insufficient balance. Available: ₹{account.balance:.2f}'}, status_code=400)
         
         # Process withdrawal
-        account.balance -= amount
-        
-        # Create transaction record
-        withdrawal_txn = models.Transaction(
-            account_id=account.id,
-            type='Debit',
-            amount=amount,
-            description=description or 'Withdrawal'
-        )
-        
-        db.add(withdrawal_txn)
-        db.commit()
-        
-        return JSONResponse({
+        await db.run_sync(ledger.post_withdrawal, account, amount, description or 'Withdrawal')
+        response = idempotency.complete(claim, {
             'ok': True,
             'message': f'₹{amount:.2f} withdrawn successfully',
-            'new_balance': account.balance
+            'new_balance': float(account.balance)
         })
+        await db.commit()
+        return response
+    except ledger.InsufficientFundsError:
+        # Another request spent the balance after the check above
+        await db.rollback()
+        return JSONResponse({'ok': False, 'error': 'Insufficient balance'}, status_code=400)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error processing withdrawal: {str(e)}")
         import traceback
         traceback.print_exc()
@@ -947,35 +1074,47 @@ def withdraw_funds(
 
 # Member deposit
 @app.post("/member/deposit")
-def deposit_funds(
+async def deposit_funds(
     request: Request,
-    amount: float = Form(...),
+    amount: Decimal = Form(...),
     payment_method: str = Form(...),
     description: str = Form(default=""),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     member_id = request.cookies.get("member_id")
     if not member_id:
         return JSONResponse({'ok': False, 'error': 'Not authenticated'}, status_code=401)
     
     try:
-        member = db.query(models.Member).get(int(member_id))
+        claim, replayed = await db.run_sync(
+            idempotency.claim, int(member_id), request.headers.get(idempotency.HEADER),
+            idempotency.request_hash('/member/deposit', amount=amount, payment_method=payment_method,
+                                     description=description),
+        )
+        if replayed is not None:
+            return replayed
+        
+        member = await db.get(models.Member, int(member_id))
         if not member:
             return JSONResponse({'ok': False, 'error': 'Member not found'}, status_code=404)
         
-        account = db.query(models.Account).filter_by(member_id=int(member_id)).first()
+        account = await get_member_account(db, member.id)
         
         # Create account if it doesn't exist
         if not account:
             account = models.Account(
                 member_id=int(member_id),
                 type='Savings',
-                balance=0.0,
+                balance=Decimal('0.00'),
                 status='Active'
             )
             db.add(account)
-            db.flush()  # Get the account ID
+            await db.flush()  # Get the account ID
         
+        try:
+            amount = to_money(amount)
+        except ValueError as e:
+            return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
         if amount <= 0:
             return JSONResponse({'ok': False, 'error': 'Amount must be positive'}, status_code=400)
         
@@ -985,64 +1124,131 @@ def deposit_funds(
         if not payment_method:
             return JSONResponse({'ok': False, 'error': 'Payment method is required'}, status_code=400)
         
-        # Process deposit
-        account.balance += amount
-        
-        # Create transaction record with safe description
+        # Process deposit with a safe description
         desc_text = description.strip() if description else "Deposit"
         if not desc_text:
             desc_text = "Deposit"
             
-        deposit_txn = models.Transaction(
-            account_id=account.id,
-            type='Credit',
-            amount=amount,
-            description=f'{desc_text} via {payment_method}'
-        )
-        
-        db.add(deposit_txn)
-        db.commit()
-        
-        return JSONResponse({
+        await db.run_sync(ledger.post_deposit, account, amount, f'{desc_text} via {payment_method}')
+        response = idempotency.complete(claim, {
             'ok': True,
             'message': f'₹{amount:.2f} deposited successfully',
-            'new_balance': account.balance
+            'new_balance': float(account.balance)
         })
+        await db.commit()
+        return response
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error processing deposit: {str(e)}")
         import traceback
         traceback.print_exc()
         return JSONResponse({'ok': False, 'error': f'Server error: {str(e)}'}, status_code=500)
 
 
+# Admin bulk credit: salary or dividend payouts to many members in one batch.
+# Accepts JSON {"source": "salary", "description": ..., "rows": [{"account_no", "amount", "description"}]}
+# or a multipart CSV upload (file=account_no,amount[,description]; source and description as form fields).
+@app.post("/admin/bulk-transfer")
+async def admin_bulk_transfer(request: Request, is_admin: str = Cookie(default=None)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Unauthorized'}, status_code=403)
+    
+    if request.headers.get('content-type', '').startswith('application/json'):
+        try:
+            data = await request.json()
+        except ValueError:
+            return JSONResponse({'ok': False, 'error': 'Expected a JSON body'}, status_code=400)
+        if not isinstance(data, dict) or not isinstance(data.get('rows') or [], list):
+            return JSONResponse({'ok': False, 'error': 'Post a JSON object with a rows list'}, status_code=400)
+        rows = data.get('rows') or []
+        source = data.get('source') or 'salary'
+        description = data.get('description')
+        if not isinstance(source, str) or not isinstance(description, (str, type(None))):
+            return JSONResponse({'ok': False, 'error': 'source and description must be strings'}, status_code=400)
+    else:
+        form = await request.form()
+        upload = form.get('file')
+        if not upload or isinstance(upload, str):
+            return JSONResponse({'ok': False, 'error': 'Upload a CSV file or post JSON rows'}, status_code=400)
+        try:
+            rows = bulk_transfer.rows_from_csv((await upload.read()).decode('utf-8-sig'))
+        except UnicodeDecodeError:
+            return JSONResponse({'ok': False, 'error': 'CSV file must be UTF-8 encoded'}, status_code=400)
+        except csv.Error as e:
+            return JSONResponse({'ok': False, 'error': f'Could not read the CSV file: {e}'}, status_code=400)
+        source = form.get('source') or 'salary'
+        description = form.get('description')
+    
+    if source not in bulk_transfer.SOURCES:
+        return JSONResponse({'ok': False, 'error': f'source must be one of {sorted(bulk_transfer.SOURCES)}'}, status_code=400)
+    if not rows:
+        return JSONResponse({'ok': False, 'error': 'Batch is empty'}, status_code=400)
+    if len(rows) > bulk_transfer.MAX_ROWS:
+        return JSONResponse({'ok': False, 'error': f'Batch exceeds {bulk_transfer.MAX_ROWS} rows'}, status_code=400)
+    
+    # Posting blocks on the database, so keep it off the event loop
+    report = await run_in_threadpool(bulk_transfer.run_bulk_transfer, SessionLocal, rows, source, description)
+    return JSONResponse(report)
+
+
 # Bank reports: P&L and transaction history
 @app.get("/admin/bank-reports", response_class=HTMLResponse)
 def bank_reports(request: Request, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
-    total_loans = db.query(models.Loan).filter_by(status='Approved').count()
-    total_fds = db.query(models.Deposit).filter_by(status='Approved').count()
-    total_shares = db.query(models.Share).filter_by(status='Approved').count()
-    total_members = db.query(models.Member).filter_by(is_approved=True).count()
-    total_loan_amount = sum([l.amount for l in db.query(models.Loan).filter_by(status='Approved').all()]) or 0
-    total_fd_amount = sum([d.amount for d in db.query(models.Deposit).filter_by(status='Approved').all()]) or 0
-    total_share_amount = sum([s.total_amount for s in db.query(models.Share).filter_by(status='Approved').all()]) or 0
     all_transactions = db.query(models.Transaction).order_by(models.Transaction.created_at.desc()).limit(100).all()
     
     return templates.TemplateResponse("bank_reports.html", {
         "request": request,
-        "total_members": total_members,
-        "total_loans": total_loans,
-        "total_fds": total_fds,
-        "total_shares": total_shares,
-        "total_loan_amount": total_loan_amount,
-        "total_fd_amount": total_fd_amount,
-        "total_share_amount": total_share_amount,
+        **report_summary.bank_report_figures(db),
         "transactions": all_transactions
     })
 
 
+# Daily/monthly inflow and outflow from the transaction rollups; defaults to the last 30 days
+@app.get("/api/admin/transaction-volume")
+def transaction_volume(date_from: date = None, date_to: date = None, granularity: str = 'day',
+                       account_type: str = None, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Unauthorized'}, status_code=403)
+    if granularity not in rollups.GRANULARITIES:
+        return JSONResponse({'ok': False, 'error': f'granularity must be one of {list(rollups.GRANULARITIES)}'}, status_code=400)
+    date_to = date_to or datetime.utcnow().date()
+    date_from = date_from or date_to - timedelta(days=29)
+    if date_from > date_to:
+        return JSONResponse({'ok': False, 'error': 'date_from must not be after date_to'}, status_code=400)
+    return JSONResponse({
+        'ok': True,
+        'date_from': date_from.isoformat(),
+        'date_to': date_to.isoformat(),
+        'granularity': granularity,
+        'series': rollups.volume(db, date_from, date_to, granularity, account_type),
+    })
+
+
+# Typeahead for admin member look-ups by name, username, account number, mobile or PAN
+@app.get("/api/admin/members/search")
+def admin_member_search(q: str = '', limit: int = search.SEARCH_LIMIT, is_admin: str = Cookie(default=None),
+                        db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Unauthorized'}, status_code=403)
+    members = search.search(db, q, limit)
+    return JSONResponse({
+        'ok': True,
+        'results': [
+            {
+                'id': m.id,
+                'name': m.name,
+                'username': m.username,
+                'account_no': m.account_no,
+                'mobile': m.mobile,
+                'is_approved': m.is_approved,
+            }
+            for m in members
+        ],
+    })
+
+
 # Admin image upload for gallery
 @app.post("/admin/upload-gallery-image")
 async def upload_gallery_image(file: UploadFile = None, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
@@ -1059,6 +1265,7 @@ async def upload_gallery_image(file: UploadFile = None, is_admin: str = Cookie(d
         with open(file_path, 'wb') as f:
             content = await file.read()
             f.write(content)
+        page_cache.invalidate("/gallery")
         return JSONResponse({'ok': True, 'message': f'Image {file.filename} uploaded'})
     except Exception as e:
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
@@ -1066,120 +1273,57 @@ async def upload_gallery_image(file: UploadFile = None, is_admin: str = Cookie(d
 
 # CSV Export endpoints
 
+def export_response(export, format: str):
+    """Stream an exports.Export as CSV (default), Parquet or an Arrow IPC stream."""
+    if format not in exports.FORMATS:
+        return JSONResponse({'error': f'format must be one of {sorted(exports.FORMATS)}'}, status_code=400)
+    if format != 'csv' and not exports.columnar_available():
+        return JSONResponse({'error': f'{format} export needs pyarrow installed on the server'}, status_code=501)
+    media_type, extension = exports.FORMATS[format]
+    return StreamingResponse(
+        exports.stream_export(export, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={export.name}.{extension}"}
+    )
+
+
+# All exports stream in chunks (see exports.py) and take ?format=csv|parquet|arrow.
+# since_id / since return only rows created after an id or timestamp, for
+# incremental pulls.
 @app.get("/export/members")
-def export_members_csv(is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+def export_members_csv(status: str = None, since_id: int = None, format: str = 'csv',
+                       is_admin: str = Cookie(default=None)):
     if is_admin != "true":
         return JSONResponse({'error': 'Not authorized'}, status_code=403)
-    
-    members = db.query(models.Member).all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['ID', 'Name', 'Username', 'Account No', 'Phone', 'DOB', 'Is Approved'])
-    
-    for member in members:
-        writer.writerow([
-            member.id,
-            member.name,
-            member.username,
-            member.account_no or '',
-            member.mobile or '',
-            member.dob or '',
-            'Yes' if member.is_approved else 'No'
-        ])
-    
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=members.csv"}
-    )
+    return export_response(exports.members_export(status, since_id), format)
 
 
 @app.get("/export/loans")
-def export_loans_csv(is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+def export_loans_csv(date_from: date = None, date_to: date = None, status: str = None,
+                     since_id: int = None, since: datetime = None, format: str = 'csv',
+                     is_admin: str = Cookie(default=None)):
     if is_admin != "true":
         return JSONResponse({'error': 'Not authorized'}, status_code=403)
-    
-    loans = db.query(models.Loan).all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['ID', 'Member ID', 'Amount', 'Interest Rate (%)', 'Tenure (Months)', 'Status', 'Repayment Status', 'Created At'])
-    
-    for loan in loans:
-        writer.writerow([
-            loan.id,
-            loan.member_id,
-            f"{loan.amount:.2f}",
-            loan.interest_rate,
-            loan.tenure_months,
-            loan.status,
-            loan.repayment_status,
-            loan.created_at.strftime('%Y-%m-%d') if loan.created_at else ''
-        ])
-    
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=loans.csv"}
-    )
+    return export_response(exports.loans_export(date_from, date_to, status, since_id, since), format)
 
 
 @app.get("/export/deposits")
-def export_deposits_csv(is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+def export_deposits_csv(date_from: date = None, date_to: date = None, status: str = None,
+                        since_id: int = None, since: datetime = None, format: str = 'csv',
+                        is_admin: str = Cookie(default=None)):
     if is_admin != "true":
         return JSONResponse({'error': 'Not authorized'}, status_code=403)
-    
-    deposits = db.query(models.Deposit).all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['ID', 'Member ID', 'Amount', 'Type', 'Maturity Date', 'Status', 'Created At'])
-    
-    for deposit in deposits:
-        writer.writerow([
-            deposit.id,
-            deposit.member_id,
-            f"{deposit.amount:.2f}",
-            deposit.type,
-            deposit.maturity_date if deposit.maturity_date else '',
-            deposit.status,
-            deposit.created_at.strftime('%Y-%m-%d') if deposit.created_at else ''
-        ])
-    
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=deposits.csv"}
-    )
+    return export_response(exports.deposits_export(date_from, date_to, status, since_id, since), format)
 
 
+# Filter with ?date_from=&date_to=&type=Credit|Debit
 @app.get("/export/transactions")
-def export_transactions_csv(is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+def export_transactions_csv(date_from: date = None, date_to: date = None, type: str = None,
+                            since_id: int = None, since: datetime = None, format: str = 'csv',
+                            is_admin: str = Cookie(default=None)):
     if is_admin != "true":
         return JSONResponse({'error': 'Not authorized'}, status_code=403)
-    
-    transactions = db.query(models.Transaction).all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['ID', 'Account ID', 'Type', 'Amount', 'Description', 'Created At'])
-    
-    for txn in transactions:
-        writer.writerow([
-            txn.id,
-            txn.account_id,
-            txn.type,
-            f"{txn.amount:.2f}",
-            txn.description or '',
-            txn.created_at.strftime('%Y-%m-%d %H:%M:%S') if txn.created_at else ''
-        ])
-    
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=transactions.csv"}
-    )
+    return export_response(exports.transactions_export(date_from, date_to, type, since_id, since), format)
 
 
 @app.get("/export/bank-report")
@@ -1187,68 +1331,96 @@ def export_bank_report_csv(is_admin: str = Cookie(default=None), db: Session = D
     if is_admin != "true":
         return JSONResponse({'error': 'Not authorized'}, status_code=403)
     
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Summary section
-    writer.writerow(['SOCIETY BANK - REPORT'])
-    writer.writerow(['Generated on', datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')])
-    writer.writerow([])
-    
-    # Statistics
-    writer.writerow(['STATISTICS'])
-    total_members = db.query(models.Member).filter_by(is_approved=True).count()
-    total_loans = db.query(models.Loan).filter_by(status='Approved').count()
-    total_fds = db.query(models.Deposit).filter_by(status='Approved').count()
-    total_shares = db.query(models.Share).filter_by(status='Approved').count()
-    total_loan_amount = sum([l.amount for l in db.query(models.Loan).filter_by(status='Approved').all()]) or 0
-    total_fd_amount = sum([d.amount for d in db.query(models.Deposit).filter_by(status='Approved').all()]) or 0
-    total_share_amount = sum([s.total_amount for s in db.query(models.Share).filter_by(status='Approved').all()]) or 0
-    
-    writer.writerow(['Total Members', total_members])
-    writer.writerow(['Total Approved Loans', total_loans])
-    writer.writerow(['Total Loan Amount', f"{total_loan_amount:.2f}"])
-    writer.writerow(['Total FDs', total_fds])
-    writer.writerow(['Total FD Amount', f"{total_fd_amount:.2f}"])
-    writer.writerow(['Total Shares', total_shares])
-    writer.writerow(['Total Share Amount', f"{total_share_amount:.2f}"])
-    writer.writerow([])
-    
-    # P&L
-    writer.writerow(['PROFIT & LOSS'])
-    writer.writerow(['Total Deposits (FD)', f"{total_fd_amount:.2f}"])
-    writer.writerow(['Total Loans Disbursed', f"{total_loan_amount:.2f}"])
-    net_position = total_fd_amount - total_loan_amount
-    writer.writerow(['Net Position', f"{net_position:.2f}"])
-    writer.writerow([])
-    
-    # Transactions
-    writer.writerow(['RECENT TRANSACTIONS (Last 100)'])
-    writer.writerow(['ID', 'Type', 'Amount', 'Created At'])
-    all_transactions = db.query(models.Transaction).order_by(models.Transaction.created_at.desc()).limit(100).all()
-    for txn in all_transactions:
-        writer.writerow([
-            txn.id,
-            txn.type,
-            f"{txn.amount:.2f}",
-            txn.created_at.strftime('%Y-%m-%d %H:%M') if txn.created_at else ''
-        ])
-    
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
+        iter([exports.bank_report_csv(db)]),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=bank_report.csv"}
     )
 
 
+# Background report jobs: any /export endpoint can run as a job whose
+# result is downloaded later, so large reports don't hold a request open.
+# POST {"kind": "transactions", "format": "parquet", "params": {"date_from": "2026-01-01"}}
+@app.post("/admin/jobs")
+async def submit_report_job(request: Request, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Not authorized'}, status_code=403)
+    try:
+        data = await request.json()
+    except ValueError:
+        return JSONResponse({'ok': False, 'error': 'Expected a JSON body'}, status_code=400)
+    if not isinstance(data, dict):
+        return JSONResponse({'ok': False, 'error': 'Expected a JSON object'}, status_code=400)
+    params = data.get('params') or {}
+    if not isinstance(params, dict):
+        return JSONResponse({'ok': False, 'error': 'params must be an object'}, status_code=400)
+
+    # The backlog count, insert and commit block on the database, so keep
+    # them (and reading back the committed row) off the event loop
+    def submit():
+        return jobs.describe(jobs.submit(db, data.get('kind'), data.get('format') or 'csv', params))
+
+    try:
+        job = await run_in_threadpool(submit)
+    except jobs.JobLimitError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=429)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    return JSONResponse({'ok': True, 'job': job}, status_code=202)
+
+
+@app.get("/admin/jobs")
+def list_report_jobs(limit: int = 50, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Not authorized'}, status_code=403)
+    recent = db.query(models.ReportJob).order_by(models.ReportJob.id.desc()).limit(min(max(limit, 1), 200)).all()
+    return JSONResponse({'ok': True, 'jobs': [jobs.describe(job) for job in recent]})
+
+
+@app.get("/admin/jobs/{job_id}")
+def report_job_status(job_id: int, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Not authorized'}, status_code=403)
+    job = db.get(models.ReportJob, job_id)
+    if not job:
+        return JSONResponse({'ok': False, 'error': 'Job not found'}, status_code=404)
+    return JSONResponse({'ok': True, 'job': jobs.describe(job)})
+
+
+@app.get("/admin/jobs/{job_id}/download")
+def download_report_job(job_id: int, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Not authorized'}, status_code=403)
+    job = db.get(models.ReportJob, job_id)
+    if not job:
+        return JSONResponse({'ok': False, 'error': 'Job not found'}, status_code=404)
+    if job.status != 'succeeded':
+        return JSONResponse({'ok': False, 'error': f'Job is {job.status}', 'job': jobs.describe(job)}, status_code=409)
+    if not job.result_path or not os.path.exists(job.result_path):
+        return JSONResponse({'ok': False, 'error': 'Result has expired; submit the job again'}, status_code=410)
+    media_type, extension = exports.FORMATS[job.format]
+    return FileResponse(job.result_path, media_type=media_type, filename=f"{job.kind}-{job.id}.{extension}")
+
+
+@app.post("/admin/jobs/{job_id}/cancel")
+def cancel_report_job(job_id: int, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+    if is_admin != "true":
+        return JSONResponse({'ok': False, 'error': 'Not authorized'}, status_code=403)
+    job = db.get(models.ReportJob, job_id)
+    if not job:
+        return JSONResponse({'ok': False, 'error': 'Job not found'}, status_code=404)
+    if job.status not in jobs.PENDING:
+        return JSONResponse({'ok': False, 'error': f'Job is already {job.status}'}, status_code=409)
+    return JSONResponse({'ok': True, 'job': jobs.describe(jobs.cancel(db, job))})
+
+
 # Admin Loan Management Routes
 @app.get("/admin/loan-management", response_class=HTMLResponse)
 def loan_management(request: Request, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return RedirectResponse(url="/admin-login", status_code=status.HTTP_303_SEE_OTHER)
     
-    loan_rates = db.query(models.LoanInterestRate).all()
+    loan_rates = list(rates.book(db).loan_rates.values())
     loans = db.query(models.Loan).options(joinedload(models.Loan.member)).order_by(models.Loan.created_at.desc()).all()
     
     return templates.TemplateResponse("admin_loan_management.html", {
@@ -1350,7 +1522,7 @@ def admin_loan_details(loan_id: int, is_admin: str = Cookie(default=None), db: S
         'loan': {
             'id': loan.id,
             'member_name': loan.member.name,
-            'amount': loan.amount,
+            'amount': float(loan.amount),
             'interest_rate': loan.interest_rate,
             'tenure_months': loan.tenure_months,
             'status': loan.status,
@@ -1369,29 +1541,42 @@ def fd_management(request: Request, is_admin: str = Cookie(default=None), db: Se
     return templates.TemplateResponse("admin_fd_management.html", {"request": request})
 
 
+# One page of applications (?cursor=, ?status=, ?type=, ?member_id=, ?date_from=, ?date_to=,
+# ?sort=) plus per-status counts and totals for the whole table
 @app.get("/admin/fd-applications")
-def get_fd_applications(is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+def get_fd_applications(status: str = None, type: str = None, member_id: int = None,
+                        date_from: date = None, date_to: date = None, sort: str = 'newest', cursor: str = None,
+                        per_page: int = pagination.PAGE_SIZE, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return JSONResponse({'ok': False, 'error': 'Unauthorized'}, status_code=403)
     
+    stmt = pagination.filter_rows(
+        select(models.Deposit).options(joinedload(models.Deposit.member)),
+        models.Deposit, status, type, member_id, date_from, date_to,
+    )
+    try:
+        page = pagination.paginate(db, stmt, models.Deposit, cursor, per_page, sort)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    
     try:
-        deposits = db.query(models.Deposit).options(joinedload(models.Deposit.member)).order_by(models.Deposit.created_at.desc()).all()
-        
         applications = []
-        for deposit in deposits:
+        for deposit in page.items:
             applications.append({
                 'id': deposit.id,
                 'member_id': deposit.member_id,
                 'member_name': deposit.member.name if deposit.member else 'N/A',
                 'fd_type': deposit.type,
-                'amount': deposit.amount,
+                'amount': float(deposit.amount),
                 'period': deposit.period,
                 'interest_rate': deposit.interest_rate,
                 'status': deposit.status if deposit.status in ['Pending', 'Approved', 'Rejected'] else 'Pending',
                 'created_at': deposit.created_at.strftime('%Y-%m-%d %H:%M') if deposit.created_at else ''
             })
+        summary = {status: {'count': count, 'total': float(total)}
+                   for status, (count, total) in report_summary.by_status(db, 'deposit').items()}
         
-        return JSONResponse({'ok': True, 'applications': applications})
+        return JSONResponse({'ok': True, 'applications': applications, 'next_cursor': page.next_cursor, 'summary': summary})
     except Exception as e:
         print(f"Error fetching FD applications: {e}")
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
@@ -1414,11 +1599,11 @@ def get_fd_details(fd_id: int, is_admin: str = Cookie(default=None), db: Session
                 'member_id': deposit.member_id,
                 'member_name': deposit.member.name if deposit.member else 'N/A',
                 'fd_type': deposit.type,
-                'amount': deposit.amount,
+                'amount': float(deposit.amount),
                 'period': deposit.period,
                 'interest_rate': deposit.interest_rate,
                 'interest_payment': deposit.interest_payment,
-                'maturity_amount': deposit.maturity_amount or (deposit.amount * (1 + deposit.interest_rate * deposit.period / 100)),
+                'maturity_amount': float(deposit.maturity_amount or to_money(deposit.amount * (1 + Decimal(str(deposit.interest_rate)) * deposit.period / 100))),
                 'nominee_name': deposit.nominee_name or 'N/A',
                 'nominee_relationship': deposit.nominee_relationship or 'N/A',
                 'status': deposit.status,
@@ -1473,52 +1658,51 @@ async def reject_fd(fd_id: int, request: Request, is_admin: str = Cookie(default
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
 
 
+# Served from the rate book; clients revalidate with If-None-Match and get a 304 while rates are unchanged
 @app.get("/api/fd-rates")
-def get_fd_rates_public(db: Session = Depends(get_db)):
+def get_fd_rates_public(request: Request, db: Session = Depends(get_db)):
     """Public endpoint for members to fetch FD rates"""
     try:
-        rates = db.query(models.FDInterestRate).all()
+        book = rates.book(db)
+        headers = {'ETag': book.etag, 'Cache-Control': rates.PUBLIC_CACHE_CONTROL}
+        if rates.not_modified(request.headers.get('if-none-match'), book.etag):
+            return Response(status_code=304, headers=headers)
         
         rate_list = []
-        for rate in rates:
-            rate_list.append({
-                'fd_type': rate.fd_type,
-                'interest_rate': rate.interest_rate
-            })
-        
-        return JSONResponse({'ok': True, 'rates': rate_list})
+        for slabs in book.fd_rates.values():
+            for rate in slabs:
+                rate_list.append({
+                    'fd_type': rate['fd_type'],
+                    'interest_rate': rate['interest_rate']
+                })
+        
+        return JSONResponse({'ok': True, 'rates': rate_list}, headers=headers)
     except Exception as e:
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
 
 
+def fd_rate_json(rate):
+    return {
+        'id': rate['id'],
+        'fd_type': rate['fd_type'],
+        'tenure_months': rate['tenure_months'],
+        'tenure_years': rate['tenure_years'],
+        'interest_rate': rate['interest_rate'],
+        'updated_at': rate['updated_at'].isoformat() if rate['updated_at'] else None
+    }
+
+
 @app.get("/admin/fd-rates")
 def get_fd_rates(is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return JSONResponse({'ok': False, 'error': 'Unauthorized'}, status_code=403)
     
     try:
-        # Order by fd_type, then tenure_months (nulls last), then tenure_years
-        rates = db.query(models.FDInterestRate).order_by(
-            models.FDInterestRate.fd_type,
-            models.FDInterestRate.tenure_months.is_(None),
-            models.FDInterestRate.tenure_months,
-            models.FDInterestRate.tenure_years
-        ).all()
-        
-        # Group rates by FD type
-        rate_dict = {}
-        for rate in rates:
-            if rate.fd_type not in rate_dict:
-                rate_dict[rate.fd_type] = []
-            rate_dict[rate.fd_type].append({
-                'id': rate.id,
-                'fd_type': rate.fd_type,
-                'tenure_months': rate.tenure_months,
-                'tenure_years': rate.tenure_years,
-                'interest_rate': rate.interest_rate,
-                'updated_at': rate.updated_at.isoformat() if rate.updated_at else None
-            })
-        
+        # Grouped by fd_type, each ordered by tenure_months (nulls last), then tenure_years
+        rate_dict = {
+            fd_type: [fd_rate_json(rate) for rate in slabs]
+            for fd_type, slabs in rates.book(db).fd_rates.items()
+        }
         return JSONResponse({'ok': True, 'rates': rate_dict})
     except Exception as e:
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
@@ -1530,25 +1714,11 @@ def get_fd_rate_detail(fd_type: str, is_admin: str = Cookie(default=None), db: S
         return JSONResponse({'ok': False, 'error': 'Unauthorized'}, status_code=403)
     
     try:
-        rates = db.query(models.FDInterestRate).filter_by(fd_type=fd_type).order_by(
-            models.FDInterestRate.tenure_months.is_(None),
-            models.FDInterestRate.tenure_months,
-            models.FDInterestRate.tenure_years
-        ).all()
-        if not rates:
+        slabs = rates.book(db).fd_rates.get(fd_type)
+        if not slabs:
             return JSONResponse({'ok': False, 'error': 'FD rate not found'})
         
-        return JSONResponse({
-            'ok': True,
-            'rates': [{
-                'id': rate.id,
-                'fd_type': rate.fd_type,
-                'tenure_months': rate.tenure_months,
-                'tenure_years': rate.tenure_years,
-                'interest_rate': rate.interest_rate,
-                'updated_at': rate.updated_at.isoformat() if rate.updated_at else None
-            } for rate in rates]
-        })
+        return JSONResponse({'ok': True, 'rates': [fd_rate_json(rate) for rate in slabs]})
     except Exception as e:
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
 
@@ -1585,16 +1755,26 @@ def share_management(request: Request, is_admin: str = Cookie(default=None), db:
     return templates.TemplateResponse("admin_share_management.html", {"request": request})
 
 
+# Paginated and filtered like /admin/fd-applications
 @app.get("/admin/share-applications")
-def get_share_applications(is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
+def get_share_applications(status: str = None, member_id: int = None,
+                           date_from: date = None, date_to: date = None, sort: str = 'newest', cursor: str = None,
+                           per_page: int = pagination.PAGE_SIZE, is_admin: str = Cookie(default=None), db: Session = Depends(get_db)):
     if is_admin != "true":
         return JSONResponse({'ok': False, 'error': 'Unauthorized'}, status_code=403)
     
+    stmt = pagination.filter_rows(
+        select(models.Share).options(joinedload(models.Share.member)),
+        models.Share, status, None, member_id, date_from, date_to,
+    )
+    try:
+        page = pagination.paginate(db, stmt, models.Share, cursor, per_page, sort)
+    except ValueError as e:
+        return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+    
     try:
-        shares = db.query(models.Share).order_by(models.Share.created_at.desc()).all()
-        
         share_list = []
-        for share in shares:
+        for share in page.items:
             member = share.member
             share_list.append({
                 'id': share.id,
@@ -1602,14 +1782,16 @@ def get_share_applications(is_admin: str = Cookie(default=None), db: Session = D
                 'member_name': member.name if member else 'Unknown',
                 'member_email': member.email if member else '',
                 'quantity': share.quantity,
-                'amount_per_share': share.amount_per_share,
-                'total_amount': share.total_amount,
+                'amount_per_share': float(share.amount_per_share),
+                'total_amount': float(share.total_amount),
                 'status': share.status,
                 'office_note': share.office_note,
                 'created_at': share.created_at.isoformat() if share.created_at else None
             })
+        summary = {status: {'count': count, 'total': float(total)}
+                   for status, (count, total) in report_summary.by_status(db, 'share').items()}
         
-        return JSONResponse(share_list)
+        return JSONResponse({'ok': True, 'shares': share_list, 'next_cursor': page.next_cursor, 'summary': summary})
     except Exception as e:
         return JSONResponse({'ok': False, 'error': str(e)}, status_code=500)
 
@@ -1633,8 +1815,8 @@ def get_share_details(share_id: int, is_admin: str = Cookie(default=None), db: S
             'member_name': member.name if member else 'Unknown',
             'member_email': member.email if member else '',
             'quantity': share.quantity,
-            'amount_per_share': share.amount_per_share,
-            'total_amount': share.total_amount,
+            'amount_per_share': float(share.amount_per_share),
+            'total_amount': float(share.total_amount),
             'status': share.status,
             'office_note': share.office_note,
             'office_approved': share.office_approved,
@@ -1668,7 +1850,7 @@ def update_share_price(
 @app.post("/member/apply-fd")
 def apply_fd(
     request: Request,
-    amount: float = Form(...),
+    amount: Decimal = Form(...),
     fd_type: str = Form(...),
     tenure: str = Form(...),
     maturity_date: str = Form(...),
@@ -1692,24 +1874,20 @@ def apply_fd(
         from datetime import datetime as dt
         maturity_date_obj = dt.strptime(maturity_date, '%Y-%m-%d').date()
         
-        # Calculate period from tenure
-        period = 1  # Default
-        if tenure:
-            if tenure.endswith('m'):
-                period = int(tenure[:-1]) / 12  # Convert months to years
-            elif tenure.endswith('y'):
-                period = int(tenure[:-1])
-        
-        # Get interest rate from database or use default
-        interest_rate = 6.5
+        # Rate for the slab this tenure falls in, from the rate book's FD matrix
+        try:
+            months = rates.tenure_months(tenure)
+        except ValueError as e:
+            return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
+        interest_rate = rates.fd_rate(rates.book(db), fd_type, months)
+        if interest_rate is None:
+            return JSONResponse({'ok': False, 'error': f'No {fd_type} deposit rate for a {tenure} tenure'}, status_code=400)
+        period = months / 12  # Years
         try:
-            fd_rate = db.query(models.FDInterestRate).filter(
-                models.FDInterestRate.fd_type == fd_type
-            ).first()
-            if fd_rate:
-                interest_rate = fd_rate.interest_rate
-        except Exception as rate_error:
-            print(f"Warning: Could not fetch FD rate: {rate_error}")
+            amount = to_money(amount)
+            maturity_amount = to_money(rates.maturity_amount(amount, interest_rate, months))
+        except ValueError as e:
+            return JSONResponse({'ok': False, 'error': str(e)}, status_code=400)
         
         # Create deposit record with Pending status
         deposit = models.Deposit(
@@ -1719,6 +1897,7 @@ def apply_fd(
             period=max(1, round(period)),
             interest_rate=interest_rate,
             maturity_date=maturity_date_obj,
+            maturity_amount=maturity_amount,
             status='Pending',
             nominee_name=nominee_name if nominee_name else None,
             office_note=notes if notes else None
@@ -0,0 +1,76 @@
+"""
+Member listing for GET /members.
+
+A page of members comes back with its loans and deposits from two batched
+selectin queries. Transactions are summarised per member with one grouped
+aggregate instead of loading every row. raiseload('*') turns any other
+relationship the template touches into an error rather than one more
+query per member, so a page costs the same five queries however many
+members there are.
+"""
+from math import ceil
+
+from sqlalchemy import case, func, select, type_coerce
+from sqlalchemy.orm import raiseload, selectinload
+
+import models
+from money import Money, to_money
+
+MEMBERS_PER_PAGE = 50
+MAX_MEMBERS_PER_PAGE = 200
+
+
+def _money_sum(condition):
+    return type_coerce(func.coalesce(func.sum(case((condition, models.Transaction.amount), else_=0)), 0), Money)
+
+
+def transaction_summaries(db, member_ids):
+    """{member_id: {'count', 'credits', 'debits'}} across all of each member's accounts."""
+    if not member_ids:
+        return {}
+    rows = db.execute(
+        select(
+            models.Account.member_id,
+            func.count(models.Transaction.id),
+            _money_sum(models.Transaction.type == 'Credit'),
+            _money_sum(models.Transaction.type == 'Debit'),
+        )
+        .join(models.Transaction, models.Transaction.account_id == models.Account.id)
+        .where(models.Account.member_id.in_(member_ids))
+        .group_by(models.Account.member_id)
+    ).all()
+    return {member_id: {'count': count, 'credits': credits, 'debits': debits}
+            for member_id, count, credits, debits in rows}
+
+
+def member_list_page(db, page=1, per_page=MEMBERS_PER_PAGE):
+    """One page of members in id order, with loans, deposits and a transaction summary each."""
+    per_page = min(max(per_page, 1), MAX_MEMBERS_PER_PAGE)
+    total = db.scalar(select(func.count(models.Member.id)))
+    pages = max(1, ceil(total / per_page))
+    page = min(max(page, 1), pages)
+
+    members = db.scalars(
+        select(models.Member)
+        .order_by(models.Member.id)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .options(selectinload(models.Member.loans), selectinload(models.Member.deposits), raiseload('*'))
+    ).all()
+    summaries = transaction_summaries(db, [member.id for member in members])
+    empty = {'count': 0, 'credits': to_money(0), 'debits': to_money(0)}
+    return {
+        'member_details': [
+            {
+                'member': member,
+                'loans': member.loans,
+                'fixed_deposits': member.deposits,
+                'transactions': summaries.get(member.id, empty),
+            }
+            for member in members
+        ],
+        'page': page,
+        'pages': pages,
+        'per_page': per_page,
+        'total': total,
+    }
@@ -0,0 +1,58 @@
+"""money as integer paise
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 14:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY_COLUMNS = {
+    'member': ['balance'],
+    'account': ['balance'],
+    'transaction': ['amount'],
+    'loan': ['amount'],
+    'deposit': ['amount', 'maturity_amount'],
+    'share': ['amount_per_share', 'total_amount'],
+    'loan_repayment': ['principal_paid', 'interest_paid'],
+}
+
+
+def upgrade() -> None:
+    """Convert float rupee columns to integer paise."""
+    for table, columns in MONEY_COLUMNS.items():
+        assignments = ', '.join(f'{column} = ROUND({column} * 100)' for column in columns)
+        op.execute(f'UPDATE "{table}" SET {assignments}')
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Float(),
+                    type_=sa.BigInteger(),
+                    postgresql_using=f'{column}::bigint',
+                )
+
+
+def downgrade() -> None:
+    """Convert integer paise back to float rupees."""
+    for table, columns in MONEY_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.BigInteger(),
+                    type_=sa.Float(),
+                    postgresql_using=f'{column}::double precision',
+                )
+        assignments = ', '.join(f'{column} = {column} / 100.0' for column in columns)
+        op.execute(f'UPDATE "{table}" SET {assignments}')
@@ -0,0 +1,74 @@
+"""member full-text search
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 20:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, Sequence[str], None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "name, username, account_no, mobile, pan"
+NEW_VALUES = "new.id, new.name, new.username, new.account_no, new.mobile, new.pan"
+OLD_VALUES = "old.id, old.name, old.username, old.account_no, old.mobile, old.pan"
+
+# Word/prefix index and substring (trigram) index over the same member
+# columns. Both are external-content tables: they store only the index and
+# read the text back from member. Prefixes of up to six characters are
+# indexed so typeahead terms such as "kumar" need not be expanded over every
+# username starting with them.
+SEARCH_TABLES = {
+    'member_search': "tokenize = 'unicode61 remove_diacritics 2', prefix = '1 2 3 4 5 6'",
+    'member_search_trigram': "tokenize = 'trigram'",
+}
+
+# PostgreSQL has no FTS5; search.py matches lower(column) LIKE 'prefix%'
+# there, which these indexes serve. text_pattern_ops makes them usable for
+# LIKE whatever the database collation.
+PREFIX_INDEXES = {f"member_search_{column}": column for column in COLUMNS.split(", ")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for index, column in PREFIX_INDEXES.items():
+            op.execute(f"CREATE INDEX {index} ON member (lower({column}) text_pattern_ops)")
+    # FTS5 is SQLite-only; other databases fall back to an unindexed LIKE
+    if dialect != 'sqlite':
+        return
+    for table, options in SEARCH_TABLES.items():
+        op.execute(f"CREATE VIRTUAL TABLE {table} USING fts5({COLUMNS}, content = 'member', content_rowid = 'id', {options})")
+
+    inserts = "".join(f"INSERT INTO {table}(rowid, {COLUMNS}) VALUES ({NEW_VALUES}); " for table in SEARCH_TABLES)
+    deletes = "".join(f"INSERT INTO {table}({table}, rowid, {COLUMNS}) VALUES ('delete', {OLD_VALUES}); "
+                      for table in SEARCH_TABLES)
+    op.execute(f"CREATE TRIGGER member_search_insert AFTER INSERT ON member BEGIN {inserts}END")
+    op.execute(f"CREATE TRIGGER member_search_delete AFTER DELETE ON member BEGIN {deletes}END")
+    op.execute(f"CREATE TRIGGER member_search_update AFTER UPDATE OF {COLUMNS} ON member BEGIN {deletes}{inserts}END")
+
+    # Index the members that already exist
+    for table in SEARCH_TABLES:
+        op.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for index in PREFIX_INDEXES:
+            op.execute(f"DROP INDEX IF EXISTS {index}")
+    if dialect != 'sqlite':
+        return
+    for trigger in ('member_search_insert', 'member_search_delete', 'member_search_update'):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    for table in SEARCH_TABLES:
+        op.execute(f"DROP TABLE IF EXISTS {table}")
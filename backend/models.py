@@ -1,9 +1,10 @@
 from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Boolean, Text, Float, Date, ForeignKey
+    Column, Integer, String, DateTime, Boolean, Text, Float, Date, ForeignKey, Index
 )
 from sqlalchemy.orm import relationship
 from db import Base
+from money import Money
 from werkzeug.security import generate_password_hash, check_password_hash
 
 class Member(Base):
@@ -18,12 +19,12 @@ class Member(Base):
     bank_account = Column(String)
     aadhaar = Column(String)
     pan = Column(String)
-    is_approved = Column(Boolean, default=False)
+    is_approved = Column(Boolean, default=False, index=True)
     application_date = Column(String)
     account_no = Column(String, unique=True, index=True, nullable=True)
     email = Column(String, nullable=True)
     phone = Column(String, nullable=True)
-    balance = Column(Float, default=0.0)
+    balance = Column(Money, default=0)
     address = Column(String, nullable=True)
     gender = Column(String, nullable=True)
     nominee_name = Column(String, nullable=True)
@@ -49,21 +50,24 @@ class Member(Base):
 class Account(Base):
     __tablename__ = "account"
     id = Column(Integer, primary_key=True, index=True)
-    member_id = Column(Integer, ForeignKey('member.id'), nullable=False)
+    member_id = Column(Integer, ForeignKey('member.id'), nullable=False, index=True)
     type = Column(String(50), nullable=False)  # e.g., Savings, Current
-    balance = Column(Float, default=0.0)
+    balance = Column(Money, default=0)
     status = Column(String(20), default='Active')
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     member = relationship("Member", back_populates="accounts")
     transactions = relationship("Transaction", back_populates="account", cascade="all, delete-orphan")
 
 class Loan(Base):
     __tablename__ = "loan"
+    __table_args__ = (
+        Index('ix_loan_status_created_at', 'status', 'created_at'),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    member_id = Column(Integer, ForeignKey('member.id'), nullable=False)
+    member_id = Column(Integer, ForeignKey('member.id'), nullable=False, index=True)
     loan_type = Column(String(50), default='personal')  # personal, education, home, vehicle, business, emergency
-    amount = Column(Float, nullable=False)
+    amount = Column(Money, nullable=False)
     interest_rate = Column(Float, nullable=False)
     tenure_months = Column(Integer, nullable=False)
     status = Column(String(20), default='Pending')
@@ -71,22 +75,25 @@ class Loan(Base):
     office_approved = Column(Boolean, default=False)
     approved_at = Column(DateTime, nullable=True)
     repayment_status = Column(String(20), default='Not Started')  # Not Started, Active, Completed, Defaulted
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     member = relationship("Member", back_populates="loans")
     repayments = relationship("LoanRepayment", back_populates="loan", cascade="all, delete-orphan")
 
 class Deposit(Base):
     __tablename__ = "deposit"
+    __table_args__ = (
+        Index('ix_deposit_status_created_at', 'status', 'created_at'),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    member_id = Column(Integer, ForeignKey('member.id'), nullable=False)
-    amount = Column(Float, nullable=False)
+    member_id = Column(Integer, ForeignKey('member.id'), nullable=False, index=True)
+    amount = Column(Money, nullable=False)
     type = Column(String(50), nullable=False)  # e.g., Fixed, Recurring, Senior Citizen
     period = Column(Integer, nullable=False, default=1)  # Years
     interest_rate = Column(Float, nullable=False, default=6.5)  # Interest rate in percentage
     interest_payment = Column(String(50), nullable=False, default='annual')  # monthly, quarterly, half_yearly, annual, maturity
     maturity_date = Column(Date, nullable=True)
-    maturity_amount = Column(Float, nullable=True)
+    maturity_amount = Column(Money, nullable=True)
     nominee_name = Column(String(100), nullable=True)
     nominee_relationship = Column(String(50), nullable=True)
     special_instructions = Column(Text, nullable=True)
@@ -94,18 +101,24 @@ class Deposit(Base):
     office_note = Column(Text, nullable=True)
     office_approved = Column(Boolean, default=False)
     approved_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     member = relationship("Member", back_populates="deposits")
 
 class Transaction(Base):
     __tablename__ = "transaction"
+    __table_args__ = (
+        # Per-account history (dashboard, member list) in date order
+        Index('ix_transaction_account_id_created_at', 'account_id', 'created_at'),
+    )
     id = Column(Integer, primary_key=True, index=True)
     account_id = Column(Integer, ForeignKey('account.id'), nullable=False)
     type = Column(String(20), nullable=False)  # Credit/Debit
-    amount = Column(Float, nullable=False)
+    amount = Column(Money, nullable=False)
     description = Column(String(200))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Journal entry that produced this row; both legs of a transfer share it
+    journal_entry_id = Column(Integer, ForeignKey('journal_entry.id'), nullable=True, index=True)
 
     account = relationship("Account", back_populates="transactions")
 
@@ -113,21 +126,24 @@ class Announcement(Base):
     __tablename__ = "announcement"
     id = Column(Integer, primary_key=True, index=True)
     message = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 
 class Share(Base):
     __tablename__ = "share"
+    __table_args__ = (
+        Index('ix_share_status_created_at', 'status', 'created_at'),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    member_id = Column(Integer, ForeignKey('member.id'), nullable=False)
+    member_id = Column(Integer, ForeignKey('member.id'), nullable=False, index=True)
     quantity = Column(Integer, nullable=False)
-    amount_per_share = Column(Float, nullable=False)
-    total_amount = Column(Float, nullable=False)
+    amount_per_share = Column(Money, nullable=False)
+    total_amount = Column(Money, nullable=False)
     status = Column(String(20), default='Pending')  # Pending, Approved, Active
     office_note = Column(Text, nullable=True)
     office_approved = Column(Boolean, default=False)
     approved_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     member = relationship("Member", back_populates="shares")
 
@@ -135,9 +151,9 @@ class Share(Base):
 class LoanRepayment(Base):
     __tablename__ = "loan_repayment"
     id = Column(Integer, primary_key=True, index=True)
-    loan_id = Column(Integer, ForeignKey('loan.id'), nullable=False)
-    principal_paid = Column(Float, default=0.0)
-    interest_paid = Column(Float, default=0.0)
+    loan_id = Column(Integer, ForeignKey('loan.id'), nullable=False, index=True)
+    principal_paid = Column(Money, default=0)
+    interest_paid = Column(Money, default=0)
     paid_at = Column(DateTime, default=datetime.utcnow)
     payment_method = Column(String(50), nullable=True)  # Cash, Transfer, UPI, etc.
     is_prepayment = Column(Boolean, default=False)
@@ -171,4 +187,132 @@ class LoanInterestRate(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def __repr__(self) -> str:
-        return f"<LoanInterestRate type={self.loan_type} rate={self.interest_rate}%>"
\ No newline at end of file
+        return f"<LoanInterestRate type={self.loan_type} rate={self.interest_rate}%>"
+
+
+# Single row bumped in the same transaction as any interest rate change, so
+# every worker knows to reload its in-memory rate book (see rates.py)
+class RateBookVersion(Base):
+    __tablename__ = "rate_book_version"
+    id = Column(Integer, primary_key=True, index=True)
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Double-entry journal (see ledger.py). Entries, postings and snapshots are
+# append-only; a balance is the latest snapshot plus the postings after it.
+class JournalEntry(Base):
+    __tablename__ = "journal_entry"
+    id = Column(Integer, primary_key=True, index=True)
+    entry_type = Column(String(30), nullable=False)  # opening_balance, deposit, withdrawal, transfer, loan_repayment, bulk_credit
+    description = Column(String(200), nullable=True)
+    reference = Column(String(50), nullable=True)  # e.g. loan:12
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    postings = relationship("Posting", back_populates="entry")
+
+    def __repr__(self) -> str:
+        return f"<JournalEntry id={self.id} type={self.entry_type}>"
+
+
+# One leg of a journal entry, against either a member account or an internal
+# ledger. Credits are positive, debits negative; an entry's postings sum to zero.
+class Posting(Base):
+    __tablename__ = "posting"
+    __table_args__ = (
+        # Balance lookups read the postings after a snapshot's high-water mark
+        Index('ix_posting_account_id_id', 'account_id', 'id'),
+        Index('ix_posting_gl_code_id', 'gl_code', 'id'),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    entry_id = Column(Integer, ForeignKey('journal_entry.id'), nullable=False, index=True)
+    account_id = Column(Integer, ForeignKey('account.id'), nullable=True)  # member account
+    gl_code = Column(String(30), nullable=True)  # internal ledger, e.g. cash, loans_receivable
+    amount = Column(Money, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    entry = relationship("JournalEntry", back_populates="postings")
+
+
+# Balance of one account or internal ledger as of a posting id
+class BalanceSnapshot(Base):
+    __tablename__ = "balance_snapshot"
+    __table_args__ = (
+        Index('ix_balance_snapshot_account_id_last_posting_id', 'account_id', 'last_posting_id'),
+        Index('ix_balance_snapshot_gl_code_last_posting_id', 'gl_code', 'last_posting_id'),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    account_id = Column(Integer, ForeignKey('account.id'), nullable=True)
+    gl_code = Column(String(30), nullable=True)
+    balance = Column(Money, nullable=False)
+    last_posting_id = Column(Integer, nullable=False)
+    as_of = Column(DateTime, nullable=False)  # created_at of the last posting included
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Stored outcome of a money-movement request sent with an Idempotency-Key
+# header (see idempotency.py). Keys are scoped to the member who sent them.
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_key"
+    __table_args__ = (
+        Index('ux_idempotency_key_member_id_key', 'member_id', 'key', unique=True),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    member_id = Column(Integer, ForeignKey('member.id'), nullable=False)
+    key = Column(String(100), nullable=False)
+    request_hash = Column(String(64), nullable=False)  # sha256 of endpoint + form fields
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)  # JSON
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
+# Count and total per product and status for the bank reports, kept in step
+# with loan, deposit, share and repayment writes (see report_summary.py)
+class ReportSummary(Base):
+    __tablename__ = "report_summary"
+    __table_args__ = (
+        Index('ux_report_summary_product_status', 'product', 'status', unique=True),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    product = Column(String(30), nullable=False)  # loan, deposit, share, loan_repayment, loan_interest
+    status = Column(String(20), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    total = Column(Money, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Transaction count and total per UTC day, account type and Credit/Debit,
+# maintained as transactions are posted (see rollups.py)
+class TransactionDailyRollup(Base):
+    __tablename__ = "transaction_daily_rollup"
+    __table_args__ = (
+        Index('ux_transaction_daily_rollup_day_account_type_txn_type', 'day', 'account_type', 'txn_type', unique=True),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    account_type = Column(String(50), nullable=False)
+    txn_type = Column(String(20), nullable=False)  # Credit/Debit
+    count = Column(Integer, nullable=False, default=0)
+    total = Column(Money, nullable=False, default=0)
+
+
+# Long-running admin report run by the background worker pool (see jobs.py)
+class ReportJob(Base):
+    __tablename__ = "report_job"
+    __table_args__ = (
+        Index('ix_report_job_status_created_at', 'status', 'created_at'),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(30), nullable=False)  # members, loans, deposits, transactions, bank_report
+    format = Column(String(10), nullable=False, default='csv')
+    params = Column(Text, nullable=True)  # JSON filters passed to the export
+    status = Column(String(20), nullable=False, default='queued')  # queued, running, succeeded, failed, cancelled
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    error = Column(Text, nullable=True)
+    result_path = Column(String(300), nullable=True)
+    result_bytes = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
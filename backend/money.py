@@ -0,0 +1,42 @@
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy.types import BigInteger, TypeDecorator
+
+PAISE = Decimal('0.01')
+# Largest single amount accepted, ₹10 lakh crore. A BIGINT holds about
+# 9.2e16 rupees in paise; the margin leaves room for balances and report
+# totals that add many amounts up.
+MAX_AMOUNT = Decimal('10000000000000')
+
+
+def to_money(value):
+    """Round a rupee amount (float, int, str or Decimal) to an exact Decimal with two places.
+
+    Raises ValueError for NaN, infinities and amounts beyond MAX_AMOUNT.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    if not value.is_finite() or abs(value) > MAX_AMOUNT:
+        raise ValueError(f"Amount must be a number no larger than ₹{MAX_AMOUNT:,}")
+    return value.quantize(PAISE, rounding=ROUND_HALF_UP)
+
+
+class Money(TypeDecorator):
+    """Rupee amount stored as an integer number of paise and loaded as a Decimal.
+
+    Integer storage keeps balances free of float drift and lets SUM() run
+    exactly in SQL; ``func.sum`` over a Money column comes back as Money too.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(to_money(value) * 100)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(int(value)).scaleb(-2)
@@ -0,0 +1,104 @@
+"""
+Rendered-page cache for the public, anonymous pages.
+
+serve() keeps the rendered HTML of a page (keyed by path) for
+PAGE_CACHE_SECONDS, so the home page's announcement query and the template
+render run once per entry instead of on every hit. The public templates do
+not depend on the visitor, so one copy serves everyone.
+
+Every response carries an ETag (a hash of the HTML, so all workers agree)
+and Last-Modified (when the entry was rendered) with
+``Cache-Control: public, no-cache``: browsers and proxies keep the page but
+revalidate it, and get a 304 without a body while it is unchanged.
+
+A session that adds, edits or deletes an announcement drops the home page
+when it commits; a gallery upload drops the gallery. Other workers see such
+changes when their entry expires.
+
+A page compressed for a client (see compression.py) is kept with its entry,
+so each entry is compressed at most once per encoding rather than per hit.
+"""
+import hashlib
+import os
+import time
+from collections import namedtuple
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi.responses import HTMLResponse, Response
+
+import compression
+import invalidation
+import models
+
+PAGE_CACHE_SECONDS = float(os.getenv('PAGE_CACHE_SECONDS', 300))
+PAGE_CACHE_CONTROL = 'public, no-cache'
+
+# Pages that show rows of a model, dropped when those rows change
+PAGES_BY_MODEL = {
+    models.Announcement: ('/',),
+}
+
+# encoded: {content coding: compressed body}, filled as clients ask for them
+Entry = namedtuple('Entry', ['body', 'etag', 'last_modified', 'expires_at', 'encoded'])
+
+_cache = invalidation.GenerationCache()  # key -> Entry
+
+
+def _not_modified(request, entry):
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or entry.etag in tags or f'W/{entry.etag}' in tags
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since).timestamp() >= int(entry.last_modified)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def serve(request, key, render):
+    """The page ``key`` from the cache, or from ``render()`` (a rendered HTML response) on a miss."""
+    now = time.time()
+    entry = _cache.get(key)
+    if entry is None or entry.expires_at <= now:
+        generation = _cache.generation(key)
+        response = render()
+        if response.status_code != 200:
+            return response
+        body = response.body
+        entry = Entry(body, f'"{hashlib.sha256(body).hexdigest()[:20]}"', now, now + PAGE_CACHE_SECONDS, {})
+        _cache.put(key, entry, generation)
+
+    headers = {
+        'ETag': entry.etag,
+        'Last-Modified': formatdate(entry.last_modified, usegmt=True),
+        'Cache-Control': PAGE_CACHE_CONTROL,
+    }
+    if _not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    encoding = compression.choose_encoding(request.headers.get('accept-encoding'))
+    if encoding is None or len(entry.body) < compression.COMPRESS_MIN_BYTES:
+        return HTMLResponse(entry.body, headers=headers)
+    body = entry.encoded.get(encoding)
+    if body is None:
+        # Two racing requests may both compress; either result is fine
+        body = entry.encoded[encoding] = compression.compress(entry.body, encoding)
+    headers.update({'Content-Encoding': encoding, 'Vary': 'Accept-Encoding', 'ETag': f'W/{entry.etag}'})
+    return HTMLResponse(body, headers=headers)
+
+
+def invalidate(*keys):
+    _cache.invalidate(*keys)
+
+
+def clear():
+    _cache.clear()
+
+
+def _changed_pages(session, objects):
+    return {page for obj in objects for page in PAGES_BY_MODEL.get(type(obj), ())}
+
+
+invalidation.track('pages_changed', _changed_pages, lambda pages: invalidate(*pages))
@@ -0,0 +1,91 @@
+"""
+Keyset pagination for the listing pages and admin APIs.
+
+Rows are ordered by (created_at, id), newest first unless ``sort=oldest``.
+Models without created_at are ordered by id alone. A page's cursor is the
+sort key of its last row. The next page is a range scan that starts after
+that key on the created_at index, so it costs the same at page 1 and page
+10,000. Unlike OFFSET, rows inserted between requests never shift a page
+or show up on two pages.
+"""
+import base64
+import json
+from collections import namedtuple
+from datetime import datetime, time
+
+from sqlalchemy import DateTime, select, tuple_
+
+import models
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+SORTS = ('newest', 'oldest')
+
+Page = namedtuple('Page', ['items', 'next_cursor', 'per_page', 'sort'])
+
+# Column the ?type= filter applies to, where it is not called "type"
+TYPE_COLUMNS = {models.Loan: 'loan_type'}
+
+
+def sort_keys(model):
+    if 'created_at' in model.__table__.c:
+        return (model.created_at, model.id)
+    return (model.id,)
+
+
+def encode_cursor(values):
+    raw = json.dumps([value.isoformat() if isinstance(value, datetime) else value for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, keys):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if len(values) != len(keys):
+            raise ValueError
+        return [datetime.fromisoformat(value) if isinstance(key.type, DateTime) else int(value)
+                for key, value in zip(keys, values)]
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor; start again from the first page")
+
+
+def filter_rows(stmt, model, status=None, type=None, member_id=None, date_from=None, date_to=None):
+    """Apply the shared listing filters; each is skipped when not given."""
+    if status:
+        stmt = stmt.where(model.status == status)
+    if type:
+        stmt = stmt.where(getattr(model, TYPE_COLUMNS.get(model, 'type')) == type)
+    if member_id is not None:
+        if model is models.Transaction:
+            member_accounts = select(models.Account.id).where(models.Account.member_id == member_id)
+            stmt = stmt.where(model.account_id.in_(member_accounts))
+        else:
+            stmt = stmt.where(model.member_id == member_id)
+    if date_from:
+        stmt = stmt.where(model.created_at >= datetime.combine(date_from, time.min))
+    if date_to:
+        stmt = stmt.where(model.created_at <= datetime.combine(date_to, time.max))
+    return stmt
+
+
+def keyset(stmt, model, cursor=None, per_page=PAGE_SIZE, sort='newest'):
+    """``stmt`` ordered and limited to the page after ``cursor``, plus one row to tell if another page follows."""
+    if sort not in SORTS:
+        raise ValueError(f"sort must be one of {list(SORTS)}")
+    keys = sort_keys(model)
+    descending = sort == 'newest'
+    if cursor:
+        position, after = tuple_(*keys), tuple_(*decode_cursor(cursor, keys))
+        stmt = stmt.where(position < after if descending else position > after)
+    return stmt.order_by(*(key.desc() if descending else key.asc() for key in keys)).limit(per_page + 1)
+
+
+def paginate(db, stmt, model, cursor=None, per_page=PAGE_SIZE, sort='newest'):
+    """Run ``stmt`` (a select of ``model``) for one page; raises ValueError for a bad sort or cursor."""
+    per_page = min(max(per_page, 1), MAX_PAGE_SIZE)
+    items = db.scalars(keyset(stmt, model, cursor, per_page, sort)).all()
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = encode_cursor([getattr(items[-1], key.key) for key in sort_keys(model)])
+    return Page(items, next_cursor, per_page, sort)
@@ -0,0 +1,191 @@
+"""
+In-memory rate book for loan and FD interest rates.
+
+Rates change only when an admin edits them, but loan and FD applications
+and the rate endpoints read them on every request. book() loads both rate
+tables once into an immutable RateBook and serves it from memory.
+
+Every change to LoanInterestRate or FDInterestRate made through the ORM
+bumps rate_book_version.version in the same transaction (a before_flush
+hook). The process that commits drops its book at once. Other workers
+compare their book with the stored version at most every
+RATE_BOOK_CHECK_SECONDS, which is one primary-key read, and reload when it
+has moved. Core writes to the rate tables must call mark_changed(db).
+
+Each book carries an ETag derived from its contents, so clients can
+revalidate the public rate endpoint and get a 304 instead of the rates.
+
+FD rates are also kept as a matrix: per FD type, a sorted tuple of slab
+tenures in months and the matching rates. fd_rate() finds the slab for a
+tenure with one bisect, so quoting an FD costs no query and no scan. The
+matrix is part of the book and is rebuilt only when the rates change.
+"""
+import bisect
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import inspect, select, update
+
+import invalidation
+import models
+
+RATE_BOOK_CHECK_SECONDS = float(os.getenv('RATE_BOOK_CHECK_SECONDS', 5))
+PUBLIC_CACHE_CONTROL = f"public, max-age={int(os.getenv('RATES_MAX_AGE', 60))}"
+
+# loan_rates: {loan_type: row}; fd_rates: {fd_type: [row, ...]} with month
+# slabs before year slabs, each shortest first. Rows are plain dicts.
+# fd_matrix: {fd_type: FDSlabs}
+RateBook = namedtuple('RateBook', ['version', 'loan_rates', 'fd_rates', 'fd_matrix', 'etag'])
+# Slab tenures in months, ascending, and the rate for each
+FDSlabs = namedtuple('FDSlabs', ['tenures', 'rates'])
+
+_lock = threading.Lock()
+_book = None
+_checked_at = float('-inf')
+
+
+def _row(obj):
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+def stored_version(db):
+    """The rate book version in the database; 0 if the row is missing."""
+    return db.scalar(select(models.RateBookVersion.version).where(models.RateBookVersion.id == 1)) or 0
+
+
+def _load(db):
+    # The version is read before the rates: a change committed in between
+    # gives newer rates under an older version, which the next check reloads
+    version = stored_version(db)
+    loan_rates = {
+        rate.loan_type: _row(rate)
+        for rate in db.scalars(select(models.LoanInterestRate).order_by(models.LoanInterestRate.id))
+    }
+    fd_rates = {}
+    for rate in db.scalars(select(models.FDInterestRate).order_by(
+        models.FDInterestRate.fd_type,
+        models.FDInterestRate.tenure_months.is_(None),
+        models.FDInterestRate.tenure_months,
+        models.FDInterestRate.tenure_years,
+    )):
+        fd_rates.setdefault(rate.fd_type, []).append(_row(rate))
+    digest = hashlib.sha256(json.dumps([loan_rates, fd_rates], sort_keys=True, default=str).encode()).hexdigest()
+    return RateBook(version, loan_rates, fd_rates, fd_matrix(fd_rates), f'"rates-{digest[:16]}"')
+
+
+def fd_matrix(fd_rates):
+    """{fd_type: FDSlabs} from rows grouped as in RateBook.fd_rates."""
+    matrix = {}
+    for fd_type, slabs in fd_rates.items():
+        by_tenure = {}
+        # Year slabs come after month slabs, so a 1-year slab wins over a
+        # 12-month one; the application form offers 12 months and up in years
+        for slab in slabs:
+            months = slab['tenure_months'] or (slab['tenure_years'] or 0) * 12
+            if months > 0:
+                by_tenure[months] = slab['interest_rate']
+        tenures = tuple(sorted(by_tenure))
+        matrix[fd_type] = FDSlabs(tenures, tuple(by_tenure[months] for months in tenures))
+    return matrix
+
+
+def tenure_months(tenure):
+    """Months in a form tenure such as '6m' or '2y'; raises ValueError otherwise."""
+    tenure = (tenure or '').strip().lower()
+    if len(tenure) < 2 or tenure[-1] not in 'my' or not tenure[:-1].isdigit() or int(tenure[:-1]) < 1:
+        raise ValueError(f"Invalid tenure {tenure!r}; expected months like '6m' or years like '2y'")
+    return int(tenure[:-1]) * (12 if tenure[-1] == 'y' else 1)
+
+
+def fd_rate(book, fd_type, months):
+    """Rate of the longest slab not longer than ``months``, or None below the shortest slab or for an unknown type."""
+    slabs = book.fd_matrix.get(fd_type)
+    if slabs is None:
+        return None
+    i = bisect.bisect_right(slabs.tenures, months)
+    return slabs.rates[i - 1] if i else None
+
+
+def maturity_amount(amount, rate, months):
+    """Simple-interest maturity value of ``amount`` at ``rate`` percent a year for ``months``."""
+    return amount * (1 + Decimal(str(rate)) * months / 1200)
+
+
+def book(db):
+    """The current RateBook, reloaded when the stored version has moved."""
+    global _book, _checked_at
+    now = time.monotonic()
+    with _lock:
+        current = _book
+        if current is not None and now - _checked_at < RATE_BOOK_CHECK_SECONDS:
+            return current
+    if current is not None and stored_version(db) == current.version:
+        with _lock:
+            _checked_at = now
+        return current
+    loaded = _load(db)
+    with _lock:
+        if _book is None or _book is current:
+            _book, _checked_at = loaded, now
+    return loaded
+
+
+def invalidate():
+    """Make the next book() call check the stored version."""
+    global _checked_at
+    with _lock:
+        _checked_at = float('-inf')
+
+
+def clear():
+    global _book, _checked_at
+    with _lock:
+        _book, _checked_at = None, float('-inf')
+
+
+def bump_version(connection):
+    """Advance the stored version inside the caller's transaction."""
+    bumped = connection.execute(
+        update(models.RateBookVersion)
+        .where(models.RateBookVersion.id == 1)
+        .values(version=models.RateBookVersion.version + 1, updated_at=datetime.utcnow())
+    )
+    if not bumped.rowcount:
+        connection.execute(models.RateBookVersion.__table__.insert().values(id=1, version=1, updated_at=datetime.utcnow()))
+
+
+def mark_changed(db):
+    """Record that ``db`` changed rates outside the ORM; bumps the version now and invalidates on commit."""
+    bump_version(db.connection())
+    invalidation.mark(db, 'rates_changed', {True})
+
+
+def not_modified(if_none_match, etag):
+    """True if an If-None-Match header value already names ``etag``."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+
+_RATE_MODELS = (models.LoanInterestRate, models.FDInterestRate)
+
+
+def _rates_changed(session, objects):
+    # Once per transaction is enough for other workers to notice; a pending
+    # mark means this transaction has already bumped the version
+    if invalidation.pending(session, 'rates_changed'):
+        return ()
+    if any(isinstance(obj, _RATE_MODELS) for obj in objects):
+        bump_version(session.connection())
+        return {True}
+    return ()
+
+
+invalidation.track('rates_changed', _rates_changed, lambda keys: invalidate())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+"""
+Incrementally maintained counts and totals for the bank reports.
+
+A before_flush hook turns every insert, status or amount change and delete
+of a Loan, Deposit, Share or LoanRepayment into +/- deltas. Those deltas are
+upserted into report_summary in the same transaction as the change, so the
+reports read a handful of rows instead of scanning the product tables.
+Writes that bypass the ORM are not seen; `check` finds that drift and
+`rebuild` recomputes the table from a full GROUP BY:
+
+    python report_summary.py check
+    python report_summary.py rebuild
+"""
+import argparse
+import sys
+from datetime import datetime
+
+from sqlalchemy import delete, event, func, inspect, select, type_coerce
+from sqlalchemy.orm import Session
+
+import models
+from db import SessionLocal, UPSERT_INSERTS
+from money import Money, to_money
+
+# Model -> (product, status attribute or None, amount attribute)
+TRACKED = {
+    models.Loan: [('loan', 'status', 'amount')],
+    models.Deposit: [('deposit', 'status', 'amount')],
+    models.Share: [('share', 'status', 'total_amount')],
+    models.LoanRepayment: [('loan_repayment', None, 'principal_paid'), ('loan_interest', None, 'interest_paid')],
+}
+# Status recorded for products without a status column
+RECEIVED = 'Received'
+
+
+def _value(obj, attr):
+    value = getattr(obj, attr)
+    if value is None:
+        # Column defaults are only applied at INSERT; use them for pending rows
+        default = inspect(obj).mapper.columns[attr].default
+        if default is not None and default.is_scalar:
+            value = default.arg
+    return value
+
+
+def _keys(obj, values):
+    for product, status_attr, amount_attr in TRACKED[type(obj)]:
+        status = values[status_attr] if status_attr else RECEIVED
+        yield (product, status or RECEIVED), to_money(values[amount_attr] or 0)
+
+
+def _attrs(model):
+    return sorted({attr for _, status_attr, amount_attr in TRACKED[model]
+                   for attr in (status_attr, amount_attr) if attr})
+
+
+def _current_values(obj):
+    return {attr: _value(obj, attr) for attr in _attrs(type(obj))}
+
+
+def _stored_values(session, obj):
+    table = type(obj).__table__
+    attrs = _attrs(type(obj))
+    row = session.connection().execute(
+        select(*(table.c[attr] for attr in attrs)).where(table.c.id == obj.id)
+    ).first()
+    return dict(zip(attrs, row)) if row is not None else None
+
+
+def _changed(obj):
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in _attrs(type(obj)))
+
+
+def apply_deltas(connection, deltas):
+    """Add {(product, status): (count, total)} to report_summary."""
+    table = models.ReportSummary.__table__
+    insert = UPSERT_INSERTS[connection.dialect.name]
+    now = datetime.utcnow()
+    for (product, status), (count, total) in sorted(deltas.items()):
+        if not count and not total:
+            continue
+        stmt = insert(table).values(product=product, status=status, count=count, total=total, updated_at=now)
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=['product', 'status'],
+            set_={'count': table.c.count + stmt.excluded.count,
+                  'total': table.c.total + stmt.excluded.total,
+                  'updated_at': now},
+        ))
+
+
+@event.listens_for(Session, 'before_flush')
+def _track_changes(session, flush_context, instances):
+    deltas = {}
+
+    def add(values, obj, sign):
+        for key, amount in _keys(obj, values):
+            count, total = deltas.get(key, (0, 0))
+            deltas[key] = (count + sign, total + sign * amount)
+
+    for obj in session.new:
+        if type(obj) in TRACKED:
+            add(_current_values(obj), obj, 1)
+    for obj in session.dirty:
+        if type(obj) in TRACKED and _changed(obj):
+            stored = _stored_values(session, obj)
+            if stored is not None:
+                add(stored, obj, -1)
+            add(_current_values(obj), obj, 1)
+    for obj in session.deleted:
+        if type(obj) in TRACKED:
+            stored = _stored_values(session, obj)
+            if stored is not None:
+                add(stored, obj, -1)
+    if deltas:
+        apply_deltas(session.connection(), deltas)
+
+
+def recompute(db):
+    """{(product, status): (count, total)} from a full GROUP BY over the product tables."""
+    expected = {}
+    for model, specs in TRACKED.items():
+        for product, status_attr, amount_attr in specs:
+            total = type_coerce(func.coalesce(func.sum(getattr(model, amount_attr)), 0), Money)
+            if status_attr:
+                status = getattr(model, status_attr)
+                rows = db.execute(select(status, func.count(), total).group_by(status)).all()
+            else:
+                rows = [(RECEIVED, *db.execute(select(func.count(), total)).one())]
+            for status, count, amount in rows:
+                if count:
+                    expected[(product, status or RECEIVED)] = (count, amount)
+    return expected
+
+
+def summary(db):
+    """{(product, status): (count, total)} as stored in report_summary."""
+    return {
+        (row.product, row.status): (row.count, row.total)
+        for row in db.scalars(select(models.ReportSummary))
+    }
+
+
+def by_status(db, product):
+    """{status: (count, total)} for one product, from report_summary."""
+    return {
+        row.status: (row.count, row.total)
+        for row in db.scalars(select(models.ReportSummary).where(models.ReportSummary.product == product))
+    }
+
+
+def check(db):
+    """Return a list of differences between report_summary and a full recompute."""
+    stored, expected = summary(db), recompute(db)
+    problems = []
+    for key in sorted(set(stored) | set(expected)):
+        have, want = stored.get(key, (0, 0)), expected.get(key, (0, 0))
+        if have[0] != want[0] or have[1] != want[1]:
+            problems.append(f"{key[0]}/{key[1]}: summary has {have[0]} totalling {have[1]}, tables have {want[0]} totalling {want[1]}")
+    return problems
+
+
+def rebuild(db):
+    db.execute(delete(models.ReportSummary))
+    apply_deltas(db.connection(), recompute(db))
+
+
+def bank_report_figures(db):
+    """Headline counts and totals for the bank reports, read from the summary rows."""
+    figures = summary(db)
+    empty = (0, to_money(0))
+    loans, fds, shares = (figures.get((product, 'Approved'), empty) for product in ('loan', 'deposit', 'share'))
+    return {
+        "total_members": db.query(models.Member).filter_by(is_approved=True).count(),
+        "total_loans": loans[0],
+        "total_fds": fds[0],
+        "total_shares": shares[0],
+        "total_loan_amount": loans[1],
+        "total_fd_amount": fds[1],
+        "total_share_amount": shares[1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["check", "rebuild"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            rebuild(db)
+            db.commit()
+            print(f"Rebuilt {len(summary(db))} report summary rows")
+        else:
+            problems = check(db)
+            for problem in problems:
+                print(problem)
+            print("Report summary OK" if not problems else f"{len(problems)} problems found")
+            if problems:
+                sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Daily transaction volume rollups.
+
+Every Transaction the ledger posts also adds to the count and total of its
+(day, account type, Credit/Debit) bucket in the same database transaction.
+Trend queries then read one row per bucket instead of scanning the
+transaction table. Rebuild buckets from the raw rows after an import or a
+direct SQL change with:
+
+    python rollups.py backfill                                   # everything
+    python rollups.py backfill --from 2026-01-01 --to 2026-03-31
+"""
+import argparse
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import delete, func, select
+
+import models
+from db import SessionLocal, UPSERT_INSERTS
+from money import to_money
+
+UNKNOWN_ACCOUNT_TYPE = 'Unknown'
+GRANULARITIES = ('day', 'month')
+
+
+def add(db, items):
+    """Add (created_at, account_type, txn_type, amount) items to their daily buckets."""
+    buckets = {}
+    for created_at, account_type, txn_type, amount in items:
+        key = (created_at.date(), account_type or UNKNOWN_ACCOUNT_TYPE, txn_type)
+        count, total = buckets.get(key, (0, 0))
+        buckets[key] = (count + 1, total + to_money(amount))
+    if not buckets:
+        return
+    connection = db.connection()
+    table = models.TransactionDailyRollup.__table__
+    insert = UPSERT_INSERTS[connection.dialect.name]
+    for (day, account_type, txn_type), (count, total) in sorted(buckets.items()):
+        stmt = insert(table).values(day=day, account_type=account_type, txn_type=txn_type, count=count, total=total)
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=['day', 'account_type', 'txn_type'],
+            set_={'count': table.c.count + stmt.excluded.count, 'total': table.c.total + stmt.excluded.total},
+        ))
+
+
+def backfill(db, date_from=None, date_to=None):
+    """Recompute the buckets for whole days in [date_from, date_to] from the transaction table."""
+    rollup = models.TransactionDailyRollup
+    txn = models.Transaction
+    day = func.date(txn.created_at)
+    account_type = func.coalesce(models.Account.type, UNKNOWN_ACCOUNT_TYPE)
+    source = (
+        select(day, account_type, txn.type, func.count(), func.sum(txn.amount))
+        .join(models.Account, models.Account.id == txn.account_id)
+        .where(txn.created_at.isnot(None))
+        .group_by(day, account_type, txn.type)
+    )
+    clear = delete(rollup)
+    if date_from:
+        source = source.where(txn.created_at >= datetime.combine(date_from, time.min))
+        clear = clear.where(rollup.day >= date_from)
+    if date_to:
+        source = source.where(txn.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+        clear = clear.where(rollup.day <= date_to)
+    db.execute(clear)
+    return db.execute(
+        rollup.__table__.insert().from_select(['day', 'account_type', 'txn_type', 'count', 'total'], source)
+    ).rowcount
+
+
+def volume(db, date_from, date_to, granularity='day', account_type=None):
+    """Inflow/outflow series over [date_from, date_to], one entry per day or month."""
+    rollup = models.TransactionDailyRollup
+    query = (
+        select(rollup.day, rollup.txn_type, func.sum(rollup.count), func.sum(rollup.total))
+        .where(rollup.day >= date_from, rollup.day <= date_to)
+        .group_by(rollup.day, rollup.txn_type)
+        .order_by(rollup.day)
+    )
+    if account_type:
+        query = query.where(rollup.account_type == account_type)
+
+    series = {}
+    for day, txn_type, count, total in db.execute(query):
+        bucket = day if granularity == 'day' else day.replace(day=1)
+        entry = series.setdefault(bucket, {'credit_count': 0, 'credit_total': 0, 'debit_count': 0, 'debit_total': 0})
+        prefix = 'credit' if txn_type == 'Credit' else 'debit'
+        entry[f'{prefix}_count'] += count
+        entry[f'{prefix}_total'] += total
+    return [
+        {
+            'period': bucket.isoformat() if granularity == 'day' else bucket.strftime('%Y-%m'),
+            'credit_count': entry['credit_count'],
+            'credit_total': float(entry['credit_total']),
+            'debit_count': entry['debit_count'],
+            'debit_total': float(entry['debit_total']),
+            'net': float(entry['credit_total'] - entry['debit_total']),
+        }
+        for bucket, entry in sorted(series.items())
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["backfill"])
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat)
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        written = backfill(db, args.date_from, args.date_to)
+        db.commit()
+        print(f"Wrote {written} daily rollup rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""
+Member search for admin look-ups and typeahead.
+
+Migration 0010 adds two FTS5 indexes over member name, username,
+account_no, mobile and PAN. Triggers on member keep both current:
+
+- member_search matches words and word prefixes. "har gow" finds
+  Harshan Gowda, and "ACC-00" finds account numbers starting that way.
+- member_search_trigram matches a substring of three or more characters
+  anywhere in a value, e.g. the middle digits of a mobile number.
+
+search() tries an exact account number or username first, then prefix
+matches, then substring matches, until it has ``limit`` members. Only the
+first SEARCH_CANDIDATES matches of each kind are ranked by bm25. Prefixes
+of up to six characters are indexed directly; a longer prefix is expanded
+over the words that start with it. On SQLite the indexes need FTS5, which
+standard Python builds include; migration 0010 fails without it.
+
+PostgreSQL has no FTS5. There search() matches each column's lowercased
+value against the prefix, which migration 0010 indexes with
+lower(column) text_pattern_ops; there are no substring matches. Other
+databases run the same query without an index.
+
+A migration that batch-alters the member table recreates it, which drops
+the triggers. Such a migration must create them again. Check and repair
+the index with:
+
+    python search.py check
+    python search.py rebuild
+"""
+import argparse
+import re
+import sys
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.exc import DatabaseError
+
+import models
+from db import SessionLocal
+
+SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+# A common prefix such as "ha" can match a large part of the table, and
+# ranking every match would score all of them (about 15 ms for 5,000 matches).
+# So only the first SEARCH_CANDIDATES matches, in rowid order (oldest member
+# first), are ranked. When a query has more matches than that, a better-ranked
+# member past them is not returned; typing more of the name narrows the
+# matches until it is.
+SEARCH_CANDIDATES = 200
+SEARCH_TABLES = ('member_search', 'member_search_trigram')
+SEARCH_TRIGGERS = ('member_search_insert', 'member_search_delete', 'member_search_update')
+SEARCH_COLUMNS = ('name', 'username', 'account_no', 'mobile', 'pan')
+# The trigram tokenizer cannot match anything shorter
+MIN_SUBSTRING = 3
+
+_WORD = re.compile(r'\w+')
+
+
+def prefix_query(q):
+    """FTS5 query matching every whitespace-separated term of ``q`` as a prefix, e.g. 'ACC-00' -> '"ACC 00"*'."""
+    terms = []
+    for term in q.split():
+        tokens = _WORD.findall(term)
+        if tokens:
+            terms.append('"' + ' '.join(tokens) + '"*')
+    return ' '.join(terms)
+
+
+def substring_query(q):
+    q = q.strip()
+    if len(q) < MIN_SUBSTRING:
+        return None
+    return '"' + q.replace('"', '""') + '"'
+
+
+def _matches(db, table, match, limit):
+    # The inner LIMIT picks the SEARCH_CANDIDATES to rank, before ORDER BY rank
+    return db.execute(
+        text(f"SELECT rowid FROM (SELECT rowid, rank FROM {table} WHERE {table} MATCH :match LIMIT :candidates) "
+             "ORDER BY rank LIMIT :limit"),
+        {'match': match, 'candidates': SEARCH_CANDIDATES, 'limit': limit},
+    ).scalars()
+
+
+def search(db, q, limit=SEARCH_LIMIT):
+    """Up to ``limit`` members matching ``q``, best matches first."""
+    q = (q or '').strip()
+    if not q:
+        return []
+    limit = min(max(limit, 1), MAX_SEARCH_LIMIT)
+    found = []
+
+    def add(member_ids):
+        for member_id in member_ids:
+            if member_id not in found and len(found) < limit:
+                found.append(member_id)
+
+    add(db.scalars(select(models.Member.id).where(or_(models.Member.account_no == q, models.Member.username == q))))
+    exact = bool(found)
+    if db.get_bind().dialect.name == 'sqlite':
+        match = prefix_query(q)
+        if match and len(found) < limit:
+            add(_matches(db, 'member_search', match, limit))
+        # A full account number or username has no useful substring matches,
+        # and its common trigrams ("ACC", "CC-") would be slow to intersect
+        match = substring_query(q)
+        if match and not exact and len(found) < limit:
+            add(_matches(db, 'member_search_trigram', match, limit))
+    elif len(found) < limit:
+        # lower(column) LIKE, rather than ILIKE, is the form the PostgreSQL
+        # indexes from migration 0010 serve
+        pattern = q.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        columns = [func.lower(getattr(models.Member, column)) for column in SEARCH_COLUMNS]
+        add(db.scalars(
+            select(models.Member.id).where(or_(*(column.like(pattern, escape='\\') for column in columns))).limit(limit)
+        ))
+
+    if not found:
+        return []
+    members = {member.id: member for member in db.scalars(select(models.Member).where(models.Member.id.in_(found)))}
+    return [members[member_id] for member_id in found if member_id in members]
+
+
+def check(db):
+    """Return a list of problems with the search index: missing triggers or an index out of step with member."""
+    problems = []
+    triggers = set(db.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).scalars())
+    problems.extend(f"trigger {name} is missing" for name in SEARCH_TRIGGERS if name not in triggers)
+    for table in SEARCH_TABLES:
+        try:
+            # rank = 1 also compares the index with the member table
+            db.execute(text(f"INSERT INTO {table}({table}, rank) VALUES ('integrity-check', 1)"))
+        except DatabaseError as e:
+            problems.append(f"{table}: {e.orig}")
+    return problems
+
+
+def rebuild(db):
+    for table in SEARCH_TABLES:
+        db.execute(text(f"INSERT INTO {table}({table}) VALUES ('rebuild')"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["check", "rebuild"])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            rebuild(db)
+            db.commit()
+            print("Member search index rebuilt")
+        else:
+            problems = check(db)
+            for problem in problems:
+                print(problem)
+            print("Member search index OK" if not problems else f"{len(problems)} problems found")
+            if problems:
+                sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
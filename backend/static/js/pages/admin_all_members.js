@@ -0,0 +1,25 @@
+// Typeahead over /api/admin/members/search; only the latest request's results are shown
+const searchBox = document.getElementById('memberSearch');
+const searchResults = document.getElementById('memberSearchResults');
+let searchTimer = null, searchSeq = 0;
+searchBox.addEventListener('input', () => {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(async () => {
+        const q = searchBox.value.trim();
+        const seq = ++searchSeq;
+        if (!q) { searchResults.hidden = true; return; }
+        const res = await fetch('/api/admin/members/search?q=' + encodeURIComponent(q));
+        const data = await res.json();
+        if (seq !== searchSeq || !data.ok) return;
+        searchResults.replaceChildren(...data.results.map(m => {
+            const li = document.createElement('li');
+            const details = document.createElement('span');
+            li.textContent = m.name + ' ';
+            details.textContent = [m.account_no, m.username, m.mobile].filter(Boolean).join(' · ')
+                + (m.is_approved ? '' : ' (pending)');
+            li.appendChild(details);
+            return li;
+        }));
+        searchResults.hidden = data.results.length === 0;
+    }, 150);
+});
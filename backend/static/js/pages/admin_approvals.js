@@ -0,0 +1,50 @@
+function showTab(tabName) {
+    document.querySelectorAll('.tab-content').forEach(el => el.classList.remove('active'));
+    document.querySelectorAll('.tab-btn').forEach(el => el.classList.remove('active'));
+    document.getElementById(tabName).classList.add('active');
+    event.target.classList.add('active');
+}
+
+function openModal(type, id) {
+    document.getElementById('overlay').classList.add('active');
+    document.getElementById('approvalModal').classList.add('active');
+    document.getElementById('approvalForm').dataset.type = type;
+    document.getElementById('approvalForm').dataset.id = id;
+}
+
+function closeModal() {
+    document.getElementById('overlay').classList.remove('active');
+    document.getElementById('approvalModal').classList.remove('active');
+}
+
+document.getElementById('approvalForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    const type = e.target.dataset.type;
+    const id = e.target.dataset.id;
+    const note = new FormData(e.target).get('office_note');
+
+    let endpoint = '';
+    if(type === 'loan') endpoint = '/admin/approve-loan';
+    else if(type === 'fd') endpoint = '/admin/approve-fd';
+    else if(type === 'share') endpoint = '/admin/approve-share';
+
+    const formData = new FormData();
+    if(type === 'loan') formData.append('loan_id', id);
+    else if(type === 'fd') formData.append('deposit_id', id);
+    else if(type === 'share') formData.append('share_id', id);
+    formData.append('office_note', note);
+
+    const response = await fetch(endpoint, { method: 'POST', body: formData });
+    const data = await response.json();
+
+    if(data.ok) {
+        alert(data.message);
+        closeModal();
+        location.reload();
+    } else {
+        alert('Error: ' + data.error);
+    }
+});
+
+// Note: In production, fetch actual pending applications from API
+// For now, this is a template structure
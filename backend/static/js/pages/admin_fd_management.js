@@ -0,0 +1,365 @@
+let currentFDId = null;
+let currentRateType = null;
+
+// Tab switching
+document.querySelectorAll('.tab-button').forEach(button => {
+    button.addEventListener('click', function() {
+        const tab = this.getAttribute('data-tab');
+        document.querySelectorAll('.tab-button').forEach(b => b.classList.remove('active'));
+        document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+        this.classList.add('active');
+        document.getElementById(tab).classList.add('active');
+
+        if (tab === 'applications') {
+            loadApplications();
+        } else {
+            loadInterestRates();
+        }
+    });
+});
+
+// Load FD Applications, a page at a time; "Load more" appends the next page
+let applicationsCursor = null;
+async function loadApplications(append = false) {
+    try {
+        const url = append && applicationsCursor
+            ? `/admin/fd-applications?cursor=${encodeURIComponent(applicationsCursor)}`
+            : '/admin/fd-applications';
+        const response = await fetch(url);
+        const data = await response.json();
+
+        if (data.ok && (append || data.applications.length > 0)) {
+            renderApplicationsTable(data.applications, append);
+            updateStats(data.summary);
+        } else {
+            document.getElementById('applicationsTable').innerHTML = `
+                <tr>
+                    <td colspan="8" style="text-align: center; padding: 40px;">
+                        <div class="empty-state">
+                            <i class="fas fa-inbox"></i>
+                            <p>No FD applications found</p>
+                        </div>
+                    </td>
+                </tr>
+            `;
+        }
+        applicationsCursor = data.ok ? data.next_cursor : null;
+        document.getElementById('loadMoreApplications').style.display = applicationsCursor ? '' : 'none';
+    } catch (error) {
+        console.error('Error loading applications:', error);
+    }
+}
+
+// Render Applications Table
+function renderApplicationsTable(applications, append = false) {
+    const tbody = document.getElementById('applicationsTable');
+    const rows = applications.map(app => `
+        <tr>
+            <td>${app.member_id}</td>
+            <td>${app.member_name}</td>
+            <td>${app.fd_type}</td>
+            <td>₹${Number(app.amount).toLocaleString('en-IN')}</td>
+            <td>${app.period} Year${app.period > 1 ? 's' : ''}</td>
+            <td>${Number(app.interest_rate).toFixed(2)}%</td>
+            <td><span class="status-badge status-${app.status.toLowerCase()}">${app.status}</span></td>
+            <td>
+                <div class="action-buttons">
+                    <button class="btn btn-view" onclick="viewDetails(${app.id})">
+                        <i class="fas fa-eye"></i> View
+                    </button>
+                    ${app.status === 'Pending' ? `
+                        <button class="btn btn-approve" onclick="approveApplication(${app.id})">
+                            <i class="fas fa-check"></i> Approve
+                        </button>
+                        <button class="btn btn-reject" onclick="openRejectionModal(${app.id})">
+                            <i class="fas fa-times"></i> Reject
+                        </button>
+                    ` : ''}
+                </div>
+            </td>
+        </tr>
+    `).join('');
+    if (append) {
+        tbody.insertAdjacentHTML('beforeend', rows);
+    } else {
+        tbody.innerHTML = rows;
+    }
+}
+
+// Update Stats from the server's per-status counts and totals
+function updateStats(summary) {
+    const count = status => (summary[status] || {}).count || 0;
+    const pending = count('Pending');
+    const approved = count('Approved');
+    const rejected = count('Rejected');
+    const total = Object.values(summary).reduce((sum, s) => sum + s.total, 0);
+
+    document.getElementById('pendingCount').textContent = pending;
+    document.getElementById('approvedCount').textContent = approved;
+    document.getElementById('rejectedCount').textContent = rejected;
+    document.getElementById('totalAmount').textContent = `₹${total.toLocaleString('en-IN', {maximumFractionDigits: 0})}`;
+}
+
+// View Details
+function viewDetails(fdId) {
+    fetch(`/admin/fd/${fdId}/details`)
+        .then(res => res.json())
+        .then(data => {
+            if (data.ok) {
+                const fd = data.fd;
+                document.getElementById('detailsContent').innerHTML = `
+                    <div class="detail-row">
+                        <span class="detail-label">Member ID</span>
+                        <span class="detail-value">${fd.member_id}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">Member Name</span>
+                        <span class="detail-value">${fd.member_name}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">FD Type</span>
+                        <span class="detail-value">${fd.fd_type}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">Amount</span>
+                        <span class="detail-value">₹${Number(fd.amount).toLocaleString('en-IN')}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">Period</span>
+                        <span class="detail-value">${fd.period} Years</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">Interest Rate</span>
+                        <span class="detail-value">${Number(fd.interest_rate).toFixed(2)}%</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">Interest Payment Mode</span>
+                        <span class="detail-value">${fd.interest_payment}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">Maturity Amount</span>
+                        <span class="detail-value">₹${Number(fd.maturity_amount).toLocaleString('en-IN')}</span>
+                    </div>
+                    ${fd.nominee_name ? `
+                        <div class="detail-row">
+                            <span class="detail-label">Nominee</span>
+                            <span class="detail-value">${fd.nominee_name} (${fd.nominee_relationship})</span>
+                        </div>
+                    ` : ''}
+                    <div class="detail-row">
+                        <span class="detail-label">Status</span>
+                        <span class="detail-value"><span class="status-badge status-${fd.status.toLowerCase()}">${fd.status}</span></span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="detail-label">Applied On</span>
+                        <span class="detail-value">${new Date(fd.created_at).toLocaleDateString('en-IN')}</span>
+                    </div>
+                `;
+                openModal('detailsModal');
+            }
+        })
+        .catch(err => console.error('Error:', err));
+}
+
+// Approve Application
+async function approveApplication(fdId) {
+    if (confirm('Are you sure you want to approve this FD application?')) {
+        try {
+            const response = await fetch(`/admin/fd/${fdId}/approve`, {
+                method: 'POST'
+            });
+            const data = await response.json();
+
+            if (data.ok) {
+                alert('FD application approved successfully!');
+                loadApplications();
+            } else {
+                alert('Error approving application: ' + data.error);
+            }
+        } catch (error) {
+            console.error('Error:', error);
+            alert('Error approving application');
+        }
+    }
+}
+
+// Open Rejection Modal
+function openRejectionModal(fdId) {
+    currentFDId = fdId;
+    document.getElementById('rejectionReason').value = '';
+    openModal('rejectionModal');
+}
+
+// Submit Rejection
+async function submitRejection() {
+    const reason = document.getElementById('rejectionReason').value.trim();
+
+    if (!reason) {
+        alert('Please provide a reason for rejection');
+        return;
+    }
+
+    try {
+        const response = await fetch(`/admin/fd/${currentFDId}/reject`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ reason })
+        });
+        const data = await response.json();
+
+        if (data.ok) {
+            alert('FD application rejected successfully!');
+            closeModal('rejectionModal');
+            loadApplications();
+        } else {
+            alert('Error rejecting application: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('Error rejecting application');
+    }
+}
+
+// Load Interest Rates
+async function loadInterestRates() {
+    try {
+        const response = await fetch('/admin/fd-rates');
+        const data = await response.json();
+
+        if (data.ok && data.rates && Object.keys(data.rates).length > 0) {
+            renderRatesTable(data.rates);
+        } else {
+            document.getElementById('ratesTable').innerHTML = `
+                <tr>
+                    <td colspan="4" style="text-align: center; padding: 40px;">
+                        <div class="empty-state">
+                            <i class="fas fa-inbox"></i>
+                            <p>No interest rates configured</p>
+                        </div>
+                    </td>
+                </tr>
+            `;
+        }
+    } catch (error) {
+        console.error('Error loading rates:', error);
+    }
+}
+
+// Render Rates Table
+function renderRatesTable(ratesData) {
+    const tbody = document.getElementById('ratesTable');
+    let rows = '';
+
+    // ratesData is an object with fd_type as keys
+    Object.keys(ratesData).forEach(fdType => {
+        const rates = ratesData[fdType];
+        rates.forEach((rate, index) => {
+            let tenureDisplay = '';
+            if (rate.tenure_months) {
+                tenureDisplay = `${rate.tenure_months} Month${rate.tenure_months > 1 ? 's' : ''}`;
+            } else if (rate.tenure_years) {
+                tenureDisplay = `${rate.tenure_years} Year${rate.tenure_years > 1 ? 's' : ''}`;
+            }
+
+            rows += `
+                <tr data-id="${rate.id}">
+                    ${index === 0 ? `<td rowspan="${rates.length}"><strong>${fdType}</strong></td>` : ''}
+                    <td><strong>${tenureDisplay}</strong></td>
+                    <td><strong>${Number(rate.interest_rate).toFixed(2)}%</strong></td>
+                    <td>${rate.updated_at || 'N/A'}</td>
+                    <td>
+                        <button class="btn btn-edit" onclick="editFDRate(${rate.id}, '${fdType}', ${rate.tenure_months || 0}, ${rate.tenure_years || 0}, ${rate.interest_rate})">
+                            <i class="fas fa-edit"></i> Edit
+                        </button>
+                    </td>
+                </tr>
+            `;
+        });
+    });
+
+    tbody.innerHTML = rows || `
+        <tr>
+            <td colspan="5" class="empty-state">
+                <i class="fas fa-inbox"></i>
+                <p>No FD types configured yet</p>
+            </td>
+        </tr>
+    `;
+}
+
+// Edit FD Rate
+function editFDRate(id, fdType, tenureMonths, tenureYears, rate) {
+    let tenureDisplay = '';
+    if (tenureMonths > 0) {
+        tenureDisplay = tenureMonths + ' Month' + (tenureMonths > 1 ? 's' : '');
+    } else if (tenureYears > 0) {
+        tenureDisplay = tenureYears + ' Year' + (tenureYears > 1 ? 's' : '');
+    }
+
+    document.getElementById('rateId').value = id;
+    document.getElementById('rateType').value = fdType + ' (' + tenureDisplay + ')';
+    document.getElementById('rateValue').value = rate;
+    document.getElementById('editRateModal').classList.add('active');
+}
+
+// Submit rate changes
+function submitFDRate(event) {
+    event.preventDefault();
+    const id = document.getElementById('rateId').value;
+    const rate = parseFloat(document.getElementById('rateValue').value);
+
+    if (rate <= 0 || rate > 100) {
+        showAlert('error', 'Interest rate must be between 0.01% and 100%');
+        return;
+    }
+
+    fetch('/admin/update-fd-rate', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ id, interest_rate: rate })
+    })
+    .then(res => res.json())
+    .then(data => {
+        if (data.ok) {
+            showAlert('success', 'FD interest rate updated successfully');
+            closeModal('editRateModal');
+            loadInterestRates();
+        } else {
+            showAlert('error', data.error || 'Failed to update rate');
+        }
+    })
+    .catch(err => {
+        console.error('Error:', err);
+        showAlert('error', 'Error updating FD interest rate');
+    });
+}
+
+// Modal Functions
+function openModal(modalId) {
+    document.getElementById(modalId).classList.add('active');
+}
+
+function closeModal(modalId) {
+    document.getElementById(modalId).classList.remove('active');
+}
+
+// Show Alert
+function showAlert(type, message) {
+    const alertEl = document.getElementById(type === 'success' ? 'successAlert' : 'errorAlert');
+    const msgEl = document.getElementById(type === 'success' ? 'successMsg' : 'errorMsg');
+    msgEl.textContent = message;
+    alertEl.classList.add('show');
+    setTimeout(() => alertEl.classList.remove('show'), 4000);
+}
+
+// Close modal when clicking outside
+document.querySelectorAll('.modal').forEach(modal => {
+    modal.addEventListener('click', function(e) {
+        if (e.target === this) {
+            this.classList.remove('active');
+        }
+    });
+});
+
+// Load initial data
+loadApplications();
@@ -0,0 +1,148 @@
+// Tab switching
+function switchTab(event, tabName) {
+    const tabs = document.querySelectorAll('.tab-content');
+    const buttons = document.querySelectorAll('.tab-btn');
+
+    tabs.forEach(tab => tab.classList.remove('active'));
+    buttons.forEach(btn => btn.classList.remove('active'));
+
+    document.getElementById(tabName).classList.add('active');
+    event.target.closest('.tab-btn').classList.add('active');
+}
+
+// Modal functions
+function closeModal(modalId) {
+    document.getElementById(modalId).classList.remove('show');
+}
+
+function showAlert(type, message) {
+    const alertEl = document.getElementById(type === 'success' ? 'successAlert' : 'errorAlert');
+    const msgEl = document.getElementById(type === 'success' ? 'successMsg' : 'errorMsg');
+    msgEl.textContent = message;
+    alertEl.classList.add('show');
+    setTimeout(() => alertEl.classList.remove('show'), 4000);
+}
+
+// Edit interest rate
+function editRate(id, type, rate, min, max) {
+    document.getElementById('rateId').value = id;
+    document.getElementById('rateType').value = type.replace('_', ' ').toUpperCase();
+    document.getElementById('rateValue').value = rate;
+    document.getElementById('rateMin').value = min;
+    document.getElementById('rateMax').value = max;
+    document.getElementById('editRateModal').classList.add('show');
+}
+
+// Submit rate changes
+function submitRate(event) {
+    event.preventDefault();
+    const id = document.getElementById('rateId').value;
+    const rate = parseFloat(document.getElementById('rateValue').value);
+    const min = parseFloat(document.getElementById('rateMin').value);
+    const max = parseFloat(document.getElementById('rateMax').value);
+
+    if (rate <= 0 || rate > 25) {
+        showAlert('error', 'Interest rate must be between 1% and 25%');
+        return;
+    }
+
+    if (min >= max) {
+        showAlert('error', 'Minimum amount must be less than maximum amount');
+        return;
+    }
+
+    fetch('/admin/update-loan-rate', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ id, interest_rate: rate, min_amount: min, max_amount: max })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.ok) {
+            showAlert('success', 'Interest rate updated successfully');
+            closeModal('editRateModal');
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            showAlert('error', data.error || 'Error updating rate');
+        }
+    })
+    .catch(err => showAlert('error', 'Network error'));
+}
+
+// Approve loan
+function approveLoan(loanId) {
+    if (!confirm('Approve this loan application?')) return;
+
+    fetch('/admin/loan/approve', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ loan_id: loanId })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.ok) {
+            showAlert('success', 'Loan approved successfully');
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            showAlert('error', data.error || 'Error approving loan');
+        }
+    })
+    .catch(err => showAlert('error', 'Network error'));
+}
+
+// Reject loan
+function rejectLoan(loanId) {
+    const reason = prompt('Enter reason for rejection:');
+    if (!reason) return;
+
+    fetch('/admin/loan/reject', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ loan_id: loanId, reason })
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.ok) {
+            showAlert('success', 'Loan rejected');
+            setTimeout(() => location.reload(), 1500);
+        } else {
+            showAlert('error', data.error || 'Error rejecting loan');
+        }
+    })
+    .catch(err => showAlert('error', 'Network error'));
+}
+
+// View loan details
+function viewLoanDetails(loanId) {
+    fetch(`/admin/loan/${loanId}/details`)
+    .then(r => r.json())
+    .then(data => {
+        if (data.ok) {
+            const loan = data.loan;
+            document.getElementById('loanDetailsContent').innerHTML = `
+                <div class="form-group">
+                    <label>Member</label>
+                    <input type="text" value="${loan.member_name}" disabled style="background: var(--bg-light);">
+                </div>
+                <div class="form-group">
+                    <label>Loan Amount</label>
+                    <input type="text" value="₹${loan.amount.toLocaleString()}" disabled style="background: var(--bg-light);">
+                </div>
+                <div class="form-group">
+                    <label>Interest Rate</label>
+                    <input type="text" value="${loan.interest_rate}%" disabled style="background: var(--bg-light);">
+                </div>
+                <div class="form-group">
+                    <label>Tenure</label>
+                    <input type="text" value="${loan.tenure_months} months" disabled style="background: var(--bg-light);">
+                </div>
+                <div class="form-group">
+                    <label>Status</label>
+                    <input type="text" value="${loan.status}" disabled style="background: var(--bg-light);">
+                </div>
+                <button type="button" class="btn btn-danger" onclick="closeModal('loanDetailsModal')">Close</button>
+            `;
+            document.getElementById('loanDetailsModal').classList.add('show');
+        }
+    });
+}
@@ -0,0 +1,31 @@
+// Add loading state
+document.getElementById('loginForm').addEventListener('submit', function() {
+    const btn = this.querySelector('.login-btn');
+    btn.classList.add('loading');
+    btn.disabled = true;
+    btn.innerHTML = '<i class="fas fa-spinner fa-spin"></i><span>Signing In...</span>';
+});
+
+// Remember me functionality
+document.getElementById('rememberMe').addEventListener('change', function() {
+    if (this.checked) {
+        localStorage.setItem('rememberMe', 'true');
+        localStorage.setItem('username', document.getElementById('username').value);
+    } else {
+        localStorage.removeItem('rememberMe');
+        localStorage.removeItem('username');
+    }
+});
+
+// Load saved username
+if (localStorage.getItem('rememberMe') === 'true') {
+    document.getElementById('rememberMe').checked = true;
+    document.getElementById('username').value = localStorage.getItem('username') || '';
+}
+
+// Focus on password if username is filled
+document.getElementById('username').addEventListener('blur', function() {
+    if (this.value) {
+        document.getElementById('password').focus();
+    }
+});
@@ -0,0 +1,248 @@
+let currentShareId = null;
+
+// Load share applications, a page at a time; "Load more" appends the next page
+let sharesCursor = null;
+async function loadShareApplications(append = false) {
+    try {
+        const url = append && sharesCursor
+            ? `/admin/share-applications?cursor=${encodeURIComponent(sharesCursor)}`
+            : '/admin/share-applications';
+        const response = await fetch(url);
+        const data = await response.json();
+
+        const tbody = document.getElementById('shareApplicationsList');
+        sharesCursor = data.ok ? data.next_cursor : null;
+        document.getElementById('loadMoreShares').style.display = sharesCursor ? '' : 'none';
+
+        if (!data.ok || (!append && data.shares.length === 0)) {
+            tbody.innerHTML = '<tr><td colspan="8" class="empty-message"><i class="fas fa-inbox"></i> No share applications found</td></tr>';
+            return;
+        }
+
+        const rows = data.shares.map(share => {
+            return `
+                <tr>
+                    <td>#${share.id}</td>
+                    <td>${share.member_name}</td>
+                    <td>${share.quantity}</td>
+                    <td>₹${share.amount_per_share.toLocaleString()}</td>
+                    <td>₹${share.total_amount.toLocaleString()}</td>
+                    <td><span class="status-badge status-${share.status.toLowerCase()}">${share.status}</span></td>
+                    <td>${new Date(share.created_at).toLocaleDateString()}</td>
+                    <td>
+                        <button class="btn btn-view" onclick="viewShare(${share.id})">
+                            <i class="fas fa-eye"></i> View
+                        </button>
+                    </td>
+                </tr>
+            `;
+        }).join('');
+        if (append) {
+            tbody.insertAdjacentHTML('beforeend', rows);
+        } else {
+            tbody.innerHTML = rows;
+        }
+
+        // Update stats from the server's per-status counts and totals
+        const approved = data.summary['Approved'] || {count: 0, total: 0};
+        document.getElementById('pendingCount').textContent = (data.summary['Pending'] || {}).count || 0;
+        document.getElementById('approvedCount').textContent = approved.count;
+        document.getElementById('totalValue').textContent = '₹' + approved.total.toLocaleString();
+    } catch (error) {
+        console.error('Error loading share applications:', error);
+        showAlert('Error loading share applications', 'error');
+    }
+}
+
+// View share details
+async function viewShare(shareId) {
+    currentShareId = shareId;
+    try {
+        const response = await fetch(`/admin/share/${shareId}/details`);
+        const share = await response.json();
+
+        document.getElementById('shareDetails').innerHTML = `
+            <div class="detail-row">
+                <span class="detail-label">Share ID:</span>
+                <span class="detail-value">#${share.id}</span>
+            </div>
+            <div class="detail-row">
+                <span class="detail-label">Member:</span>
+                <span class="detail-value">${share.member_name} (#${share.member_id})</span>
+            </div>
+            <div class="detail-row">
+                <span class="detail-label">Email:</span>
+                <span class="detail-value">${share.member_email}</span>
+            </div>
+            <div class="detail-row">
+                <span class="detail-label">Quantity:</span>
+                <span class="detail-value">${share.quantity} shares</span>
+            </div>
+            <div class="detail-row">
+                <span class="detail-label">Amount Per Share:</span>
+                <span class="detail-value">₹${share.amount_per_share.toLocaleString()}</span>
+            </div>
+            <div class="detail-row">
+                <span class="detail-label">Total Amount:</span>
+                <span class="detail-value"><strong>₹${share.total_amount.toLocaleString()}</strong></span>
+            </div>
+            <div class="detail-row">
+                <span class="detail-label">Status:</span>
+                <span class="detail-value"><span class="status-badge status-${share.status.toLowerCase()}">${share.status}</span></span>
+            </div>
+            <div class="detail-row">
+                <span class="detail-label">Applied Date:</span>
+                <span class="detail-value">${new Date(share.created_at).toLocaleString()}</span>
+            </div>
+            ${share.office_note ? `
+                <div class="detail-row">
+                    <span class="detail-label">Office Note:</span>
+                    <span class="detail-value">${share.office_note}</span>
+                </div>
+            ` : ''}
+        `;
+
+        document.getElementById('shareModal').style.display = 'block';
+    } catch (error) {
+        console.error('Error loading share details:', error);
+        showAlert('Error loading share details', 'error');
+    }
+}
+
+// Approve share
+async function approveShare() {
+    if (!currentShareId) return;
+
+    const note = prompt('Enter office note (optional):');
+    if (note === null) return;
+
+    try {
+        const formData = new FormData();
+        formData.append('share_id', currentShareId);
+        formData.append('office_note', note || '');
+
+        const response = await fetch('/admin/approve-share', {
+            method: 'POST',
+            body: formData
+        });
+
+        const data = await response.json();
+
+        if (data.ok) {
+            showAlert('Share application approved successfully', 'success');
+            closeShareModal();
+            loadShareApplications();
+        } else {
+            showAlert(data.error || 'Failed to approve share', 'error');
+        }
+    } catch (error) {
+        console.error('Error approving share:', error);
+        showAlert('Error approving share application', 'error');
+    }
+}
+
+// Reject share
+async function rejectShare() {
+    if (!currentShareId) return;
+
+    const note = prompt('Enter rejection reason:');
+    if (!note) {
+        alert('Rejection reason is required');
+        return;
+    }
+
+    try {
+        const formData = new FormData();
+        formData.append('share_id', currentShareId);
+        formData.append('office_note', note);
+
+        const response = await fetch('/admin/reject-share', {
+            method: 'POST',
+            body: formData
+        });
+
+        const data = await response.json();
+
+        if (data.ok) {
+            showAlert('Share application rejected', 'success');
+            closeShareModal();
+            loadShareApplications();
+        } else {
+            showAlert(data.error || 'Failed to reject share', 'error');
+        }
+    } catch (error) {
+        console.error('Error rejecting share:', error);
+        showAlert('Error rejecting share application', 'error');
+    }
+}
+
+function closeShareModal() {
+    document.getElementById('shareModal').style.display = 'none';
+    currentShareId = null;
+}
+
+// Share pricing form
+document.getElementById('pricingForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const formData = new FormData(e.target);
+
+    try {
+        const response = await fetch('/admin/update-share-price', {
+            method: 'POST',
+            body: formData
+        });
+
+        const data = await response.json();
+
+        if (data.ok) {
+            showAlert('Share price updated successfully', 'success');
+            document.getElementById('currentPrice').textContent = '₹' + parseFloat(formData.get('share_price')).toLocaleString();
+        } else {
+            showAlert(data.error || 'Failed to update share price', 'error');
+        }
+    } catch (error) {
+        console.error('Error updating share price:', error);
+        showAlert('Error updating share price', 'error');
+    }
+});
+
+// Tab switching
+function switchTab(tabName) {
+    document.querySelectorAll('.tab-content').forEach(content => {
+        content.classList.remove('active');
+    });
+    document.querySelectorAll('.tab-button').forEach(btn => {
+        btn.classList.remove('active');
+    });
+
+    document.getElementById(tabName).classList.add('active');
+    event.target.closest('.tab-button').classList.add('active');
+}
+
+function showAlert(message, type) {
+    const alertDiv = document.getElementById('alertMessage');
+    alertDiv.className = `alert alert-${type}`;
+    alertDiv.innerHTML = `<i class="fas fa-${type === 'success' ? 'check-circle' : 'exclamation-circle'}"></i> ${message}`;
+    alertDiv.style.display = 'block';
+
+    setTimeout(() => {
+        alertDiv.style.display = 'none';
+    }, 5000);
+}
+
+// Close modal on outside click
+window.onclick = function(event) {
+    const modal = document.getElementById('shareModal');
+    if (event.target == modal) {
+        closeShareModal();
+    }
+}
+
+// Set today's date as default for effective date
+document.getElementById('effectiveDate').valueAsDate = new Date();
+
+// Load data on page load
+window.addEventListener('load', () => {
+    loadShareApplications();
+});
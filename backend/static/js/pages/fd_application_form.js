@@ -0,0 +1,139 @@
+function goBack() {
+    window.history.back();
+}
+
+// Rate of the longest slab not longer than the tenure, as apply-fd quotes it
+function slabRate(fdType, months) {
+    let rate = null;
+    for (const [tenure, slabRate] of FD_RATES[fdType] || []) {
+        if (tenure > months) break;
+        rate = slabRate;
+    }
+    return rate;
+}
+
+// Months in a tenure option value such as '6m' or '2y'
+function tenureMonths(tenure) {
+    return parseInt(tenure) * (tenure.endsWith('y') ? 12 : 1);
+}
+
+// Disable the tenures below the type's shortest slab, which apply-fd refuses
+function updateTenureOptions(fdType) {
+    const select = document.querySelector('select[name="tenure"]');
+    for (const option of select.options) {
+        if (!option.value) continue;
+        option.disabled = Boolean(fdType) && slabRate(fdType, tenureMonths(option.value)) === null;
+    }
+    if (select.selectedOptions[0] && select.selectedOptions[0].disabled) {
+        select.value = '';
+    }
+}
+
+function updateCalculator() {
+    const amount = parseFloat(document.querySelector('input[name="amount"]').value) || 0;
+    const fdType = document.querySelector('select[name="fd_type"]').value;
+    updateTenureOptions(fdType);
+    const tenure = document.querySelector('select[name="tenure"]').value;
+    const maturityInput = document.querySelector('input[name="maturity_date"]');
+
+    // Update display values
+    document.getElementById('calcAmount').textContent = amount.toLocaleString('en-IN', {maximumFractionDigits: 0});
+
+    // Calculate maturity date
+    if(tenure && amount > 0) {
+        const today = new Date();
+        const months = tenureMonths(tenure);
+
+        const maturityDate = new Date(today);
+        maturityDate.setMonth(maturityDate.getMonth() + months);
+
+        const year = maturityDate.getFullYear();
+        const month = String(maturityDate.getMonth() + 1).padStart(2, '0');
+        const day = String(maturityDate.getDate()).padStart(2, '0');
+
+        maturityInput.value = `${year}-${month}-${day}`;
+
+        // Update tenure display
+        let tenureDisplay = '';
+        if(tenure.endsWith('m')) {
+            tenureDisplay = parseInt(tenure) + ' Months';
+        } else {
+            tenureDisplay = parseInt(tenure) + ' Year' + (parseInt(tenure) > 1 ? 's' : '');
+        }
+        document.getElementById('calcTenure').textContent = tenureDisplay;
+
+        // Calculate interest at the slab rate for this type and tenure
+        const annualRate = slabRate(fdType, months) || 0;
+        const years = months / 12;
+        const interest = (amount * annualRate * years) / 100;
+        const total = amount + interest;
+
+        document.getElementById('calcRate').textContent = annualRate.toFixed(2);
+        document.getElementById('calcInterest').textContent = Math.round(interest).toLocaleString('en-IN', {maximumFractionDigits: 0});
+        document.getElementById('calcTotal').textContent = Math.round(total).toLocaleString('en-IN', {maximumFractionDigits: 0});
+
+        // Show duration breakdown
+        const years_full = Math.floor(months / 12);
+        const remaining_months = months % 12;
+        const days = 0;
+
+        document.getElementById('breakdownYears').textContent = years_full;
+        document.getElementById('breakdownMonths').textContent = remaining_months;
+        document.getElementById('breakdownDays').textContent = days;
+        document.getElementById('durationBreakdown').style.display = 'block';
+    } else {
+        document.getElementById('calcRate').textContent = '0';
+        document.getElementById('calcInterest').textContent = '0';
+        document.getElementById('calcTotal').textContent = '0';
+        document.getElementById('calcTenure').textContent = '-';
+        document.getElementById('durationBreakdown').style.display = 'none';
+    }
+}
+
+function clearCalculator() {
+    document.getElementById('calcAmount').textContent = '0';
+    document.getElementById('calcRate').textContent = '0';
+    document.getElementById('calcTenure').textContent = '-';
+    document.getElementById('calcInterest').textContent = '0';
+    document.getElementById('calcTotal').textContent = '0';
+    document.getElementById('durationBreakdown').style.display = 'none';
+}
+
+document.getElementById('fdForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const formData = new FormData(e.target);
+    const messageDiv = document.getElementById('message');
+    const infoAlert = document.getElementById('infoAlert');
+
+    // Hide info alert
+    infoAlert.style.display = 'none';
+
+    try {
+        // Add loading state
+        messageDiv.innerHTML = '<div class="alert alert-info"><i class="fas fa-spinner loading"></i> Processing your application...</div>';
+
+        const response = await fetch('/member/apply-fd', { 
+            method: 'POST', 
+            body: formData 
+        });
+
+        const data = await response.json();
+
+        if(data.ok) {
+            messageDiv.innerHTML = '<div class="alert alert-success"><i class="fas fa-check-circle"></i> <strong>Success!</strong> Your FD application has been submitted. Redirecting to dashboard...</div>';
+            setTimeout(() => window.location.href = '/member-dashboard', 2500);
+        } else {
+            messageDiv.innerHTML = `<div class="alert alert-error"><i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ${data.error || 'Failed to submit application'}</div>`;
+            infoAlert.style.display = 'block';
+        }
+    } catch(error) {
+        messageDiv.innerHTML = `<div class="alert alert-error"><i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ${error.message}</div>`;
+        infoAlert.style.display = 'block';
+    }
+});
+
+// Initialize calculator on page load
+window.addEventListener('load', () => {
+    updateCalculator();
+});
@@ -0,0 +1,25 @@
+function updateDateTime() {
+    const now = new Date();
+    const options = { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' };
+    document.getElementById('date-display').textContent = now.toLocaleDateString('en-US', options);
+}
+updateDateTime();
+setInterval(updateDateTime, 60000);
+
+// Mobile menu toggle
+const menuToggle = document.getElementById('menuToggle');
+const navContainer = document.getElementById('navContainer');
+
+menuToggle.addEventListener('click', () => {
+    navContainer.classList.toggle('active');
+});
+
+// Close menu when link is clicked
+const navLinks = navContainer.querySelectorAll('a:not(.dropdown > a)');
+navLinks.forEach(link => {
+    link.addEventListener('click', (e) => {
+        if (e.target.tagName === 'A') {
+            navContainer.classList.remove('active');
+        }
+    });
+});
@@ -0,0 +1,200 @@
+// Loan type definitions with default interest rates
+const loanTypes = [
+    {
+        id: 'Personal',
+        name: 'Personal Loan',
+        icon: 'fas fa-user',
+        rate: 12.5,
+        minAmount: 10000,
+        maxAmount: 5000000
+    },
+    {
+        id: 'Education',
+        name: 'Education Loan',
+        icon: 'fas fa-graduation-cap',
+        rate: 9.5,
+        minAmount: 50000,
+        maxAmount: 25000000
+    },
+    {
+        id: 'Home',
+        name: 'Home Loan',
+        icon: 'fas fa-home',
+        rate: 8.5,
+        minAmount: 500000,
+        maxAmount: 50000000
+    },
+    {
+        id: 'Vehicle',
+        name: 'Vehicle Loan',
+        icon: 'fas fa-car',
+        rate: 10.5,
+        minAmount: 50000,
+        maxAmount: 10000000
+    },
+    {
+        id: 'Business',
+        name: 'Business Loan',
+        icon: 'fas fa-briefcase',
+        rate: 11.5,
+        minAmount: 100000,
+        maxAmount: 50000000
+    },
+    {
+        id: 'Emergency',
+        name: 'Emergency Loan',
+        icon: 'fas fa-exclamation-circle',
+        rate: 14.5,
+        minAmount: 10000,
+        maxAmount: 500000
+    }
+];
+
+let selectedLoanType = null;
+
+// Initialize loan type cards
+function initializeLoanTypes() {
+    const container = document.getElementById('loanTypesContainer');
+    container.innerHTML = '';
+
+    loanTypes.forEach(type => {
+        const card = document.createElement('div');
+        card.className = 'loan-type-card';
+        card.innerHTML = `
+            <input type="radio" name="loan_type" value="${type.id}" id="type_${type.id}">
+            <div class="type-content">
+                <div class="type-icon"><i class="${type.icon}"></i></div>
+                <h3>${type.name}</h3>
+                <div class="rate-info">Interest: ${type.rate}% p.a.</div>
+            </div>
+        `;
+
+        card.addEventListener('click', () => {
+            document.getElementById(`type_${type.id}`).checked = true;
+            selectLoanType(type);
+        });
+
+        container.appendChild(card);
+    });
+}
+
+// Select loan type
+function selectLoanType(type) {
+    selectedLoanType = type;
+    document.getElementById('loanTypeInput').value = type.id;
+
+    // Update UI
+    document.querySelectorAll('.loan-type-card').forEach(card => {
+        card.classList.remove('selected');
+    });
+    event.target.closest('.loan-type-card')?.classList.add('selected');
+
+    // Update amount limits
+    const amountInput = document.getElementById('amount');
+    amountInput.min = type.minAmount;
+    amountInput.max = type.maxAmount;
+
+    // Calculate and update loan summary
+    calculateLoan();
+}
+
+// Calculate loan summary
+function calculateLoan() {
+    if (!selectedLoanType) return;
+
+    const amount = parseFloat(document.getElementById('amount').value) || 0;
+    const tenure = parseInt(document.getElementById('tenure_months').value) || 0;
+    const rate = selectedLoanType.rate;
+
+    if (amount > 0 && tenure > 0) {
+        // EMI Calculation: EMI = P * R * (1+R)^n / [(1+R)^n - 1]
+        const monthlyRate = rate / 12 / 100;
+        const n = tenure;
+        const emi = amount * monthlyRate * Math.pow(1 + monthlyRate, n) / (Math.pow(1 + monthlyRate, n) - 1);
+        const totalAmount = emi * n;
+        const totalInterest = totalAmount - amount;
+
+        // Update display
+        document.getElementById('calcAmount').textContent = '₹' + amount.toLocaleString('en-IN');
+        document.getElementById('calcRate').textContent = rate + '%';
+        document.getElementById('calcTenure').textContent = tenure + ' months';
+        document.getElementById('calcInterest').textContent = '₹' + Math.round(totalInterest).toLocaleString('en-IN');
+        document.getElementById('calcTotal').textContent = '₹' + Math.round(totalAmount).toLocaleString('en-IN');
+        document.getElementById('calcEMI').textContent = '₹' + Math.round(emi).toLocaleString('en-IN');
+    }
+}
+
+// Event listeners
+document.getElementById('amount').addEventListener('input', calculateLoan);
+document.getElementById('tenure_months').addEventListener('change', calculateLoan);
+
+// Form submission
+document.getElementById('loanForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+
+    // Validation
+    let isValid = true;
+
+    if (!selectedLoanType) {
+        document.getElementById('loanTypeError').classList.add('show');
+        isValid = false;
+    }
+
+    const amount = parseFloat(document.getElementById('amount').value);
+    if (!amount || amount < 10000 || amount > 50000000) {
+        document.getElementById('amountError').classList.add('show');
+        isValid = false;
+    }
+
+    const tenure = document.getElementById('tenure_months').value;
+    if (!tenure) {
+        document.getElementById('tenureError').classList.add('show');
+        isValid = false;
+    }
+
+    if (!isValid) return;
+
+    // Submit form
+    const formData = new FormData(this);
+
+    try {
+        const submitBtn = document.querySelector('.submit-btn');
+        submitBtn.disabled = true;
+        submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Processing...';
+
+        const response = await fetch('/member/apply-loan', {
+            method: 'POST',
+            body: formData
+        });
+
+        const result = await response.json();
+
+        if (result.ok) {
+            const successMsg = document.getElementById('successMessage');
+            successMsg.style.display = 'flex';
+            document.getElementById('loanForm').style.display = 'none';
+
+            setTimeout(() => {
+                window.location.href = '/member-dashboard';
+            }, 2500);
+        } else {
+            alert(result.error || 'Error submitting application. Please try again.');
+            submitBtn.disabled = false;
+            submitBtn.innerHTML = '<i class="fas fa-paper-plane"></i> Submit Loan Application';
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('Network error. Please check your connection and try again.');
+        const submitBtn = document.querySelector('.submit-btn');
+        submitBtn.disabled = false;
+        submitBtn.innerHTML = '<i class="fas fa-paper-plane"></i> Submit Loan Application';
+    }
+});
+
+// Clear error messages on input
+document.getElementById('amount').addEventListener('focus', () => {
+    document.getElementById('amountError').classList.remove('show');
+});
+
+// Initialize
+initializeLoanTypes();
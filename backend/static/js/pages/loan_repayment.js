@@ -0,0 +1,230 @@
+let loans = [];
+let selectedLoan = null;
+
+document.addEventListener('DOMContentLoaded', () => {
+    loadLoans();
+    setupPaymentTypeListeners();
+});
+
+async function loadLoans() {
+    try {
+        const response = await fetch('/api/member/loans');
+        if (!response.ok) throw new Error('Failed to fetch loans');
+        loans = await response.json();
+        displayLoans();
+    } catch (error) {
+        console.error('Error:', error);
+        showAlert('Failed to load loans', 'error');
+        document.getElementById('loansLoading').style.display = 'none';
+        document.getElementById('noLoans').style.display = 'block';
+    }
+}
+
+function displayLoans() {
+    document.getElementById('loansLoading').style.display = 'none';
+
+    if (loans.length === 0) {
+        document.getElementById('noLoans').style.display = 'block';
+        return;
+    }
+
+    const loansList = document.getElementById('loansList');
+    loansList.innerHTML = '';
+
+    loans.forEach(loan => {
+        const totalDue = loan.amount + (loan.amount * loan.interest_rate / 100);
+        const div = document.createElement('div');
+        div.className = 'loan-item';
+        div.innerHTML = `
+            <div class="loan-item-header">
+                <span class="loan-type">${loan.loan_type} Loan</span>
+                <span class="loan-status">${loan.status}</span>
+            </div>
+            <div class="loan-details">
+                <div class="loan-detail">
+                    <span>Amount:</span>
+                    <strong>₹${loan.amount.toLocaleString()}</strong>
+                </div>
+                <div class="loan-detail">
+                    <span>Rate:</span>
+                    <strong>${loan.interest_rate}% p.a.</strong>
+                </div>
+                <div class="loan-detail">
+                    <span>Tenure:</span>
+                    <strong>${loan.tenure_months} months</strong>
+                </div>
+                <div class="loan-detail">
+                    <span>Total Due:</span>
+                    <strong>₹${totalDue.toLocaleString()}</strong>
+                </div>
+            </div>
+        `;
+        div.onclick = () => selectLoan(loan, div);
+        loansList.appendChild(div);
+    });
+
+    loansList.style.display = 'block';
+}
+
+function selectLoan(loan, element) {
+    document.querySelectorAll('.loan-item').forEach(el => el.classList.remove('selected'));
+    element.classList.add('selected');
+    selectedLoan = loan;
+    updateForm(loan);
+}
+
+function updateForm(loan) {
+    const totalDue = loan.amount + (loan.amount * loan.interest_rate / 100);
+    const totalInterest = loan.amount * loan.interest_rate / 100;
+
+    document.getElementById('loanId').value = loan.id;
+    document.getElementById('summaryAmount').textContent = `₹${loan.amount.toLocaleString()}`;
+    document.getElementById('summaryRate').textContent = `${loan.interest_rate}% p.a.`;
+    document.getElementById('summaryTenure').textContent = `${loan.tenure_months} months`;
+    document.getElementById('summaryInterest').textContent = `₹${totalInterest.toLocaleString()}`;
+    document.getElementById('summaryTotal').textContent = `₹${totalDue.toLocaleString()}`;
+
+    document.getElementById('customMax').textContent = `₹${totalDue.toLocaleString()}`;
+    document.getElementById('customAmount').max = totalDue;
+
+    document.getElementById('paymentMethod').disabled = false;
+    document.getElementById('formPlaceholder').style.display = 'none';
+    document.getElementById('repaymentForm').style.display = 'block';
+
+    document.getElementById('fullPayment').checked = true;
+    updatePaymentSections('full');
+    calculatePayment('full', loan);
+}
+
+function setupPaymentTypeListeners() {
+    document.querySelectorAll('input[name="paymentType"]').forEach(radio => {
+        radio.addEventListener('change', (e) => {
+            document.querySelectorAll('.radio-option').forEach(el => el.classList.remove('selected'));
+            e.target.closest('.radio-option').classList.add('selected');
+            updatePaymentSections(e.target.value);
+            if (selectedLoan) calculatePayment(e.target.value, selectedLoan);
+        });
+    });
+
+    document.getElementById('customAmount').addEventListener('input', () => {
+        if (selectedLoan) calculatePayment('custom', selectedLoan);
+    });
+}
+
+function updatePaymentSections(type) {
+    document.getElementById('fullPaymentSection').classList.remove('active');
+    document.getElementById('customPaymentSection').classList.remove('active');
+    document.getElementById('emiPaymentSection').classList.remove('active');
+
+    if (type === 'full') document.getElementById('fullPaymentSection').classList.add('active');
+    if (type === 'custom') document.getElementById('customPaymentSection').classList.add('active');
+    if (type === 'emi') document.getElementById('emiPaymentSection').classList.add('active');
+}
+
+function calculatePayment(type, loan) {
+    const totalDue = loan.amount + (loan.amount * loan.interest_rate / 100);
+    const totalInterest = loan.amount * loan.interest_rate / 100;
+
+    if (type === 'full') {
+        document.getElementById('fpPrincipal').textContent = `₹${loan.amount.toLocaleString()}`;
+        document.getElementById('fpInterest').textContent = `₹${totalInterest.toLocaleString()}`;
+        document.getElementById('fpTotal').textContent = `₹${totalDue.toLocaleString()}`;
+        document.getElementById('principalAmount').value = loan.amount;
+        document.getElementById('interestAmount').value = totalInterest.toFixed(2);
+    }
+    else if (type === 'custom') {
+        const amount = parseFloat(document.getElementById('customAmount').value) || 0;
+        const error = document.getElementById('customError');
+
+        if (amount > 0 && amount < 1000) {
+            error.textContent = 'Minimum amount is ₹1,000';
+            return;
+        }
+        if (amount > totalDue) {
+            error.textContent = 'Amount exceeds total due';
+            return;
+        }
+
+        error.textContent = '';
+        const remaining = totalDue - amount;
+        document.getElementById('cpAmount').textContent = `₹${amount.toLocaleString()}`;
+        document.getElementById('cpRemaining').textContent = `₹${remaining.toLocaleString()}`;
+
+        const principal = amount * (loan.amount / totalDue);
+        const interest = amount * (totalInterest / totalDue);
+        document.getElementById('principalAmount').value = principal.toFixed(2);
+        document.getElementById('interestAmount').value = interest.toFixed(2);
+    }
+    else if (type === 'emi') {
+        const emiCount = loan.tenure_months;
+        const monthlyEmi = totalDue / emiCount;
+
+        document.getElementById('epMonthly').textContent = `₹${monthlyEmi.toLocaleString()}`;
+        document.getElementById('epCount').textContent = emiCount;
+        document.getElementById('epTotal').textContent = `₹${totalDue.toLocaleString()}`;
+        document.getElementById('epFirst').textContent = `₹${monthlyEmi.toLocaleString()}`;
+
+        document.getElementById('principalAmount').value = (loan.amount / emiCount).toFixed(2);
+        document.getElementById('interestAmount').value = (totalInterest / emiCount).toFixed(2);
+    }
+}
+
+document.getElementById('repaymentForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    if (!selectedLoan) {
+        showAlert('Please select a loan', 'error');
+        return;
+    }
+
+    const paymentMethod = document.getElementById('paymentMethod').value;
+    if (!paymentMethod) {
+        showAlert('Please select a payment method', 'error');
+        return;
+    }
+
+    const btn = e.target.querySelector('button');
+    btn.disabled = true;
+    btn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Processing...';
+
+    try {
+        const formData = new FormData();
+        formData.append('loan_id', selectedLoan.id);
+        formData.append('principal', document.getElementById('principalAmount').value);
+        formData.append('interest', document.getElementById('interestAmount').value);
+        formData.append('payment_method', paymentMethod);
+
+        const response = await fetch('/member/repay-loan', {
+            method: 'POST',
+            body: formData
+        });
+
+        const data = await response.json();
+
+        if (data.ok) {
+            showAlert('✓ Repayment recorded successfully!', 'success');
+            setTimeout(() => window.location.href = '/member-dashboard', 2000);
+        } else {
+            showAlert(data.error || 'Error recording repayment', 'error');
+            btn.disabled = false;
+            btn.innerHTML = '<i class="fas fa-check-circle"></i> Record Repayment';
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        showAlert('Network error. Please try again.', 'error');
+        btn.disabled = false;
+        btn.innerHTML = '<i class="fas fa-check-circle"></i> Record Repayment';
+    }
+});
+
+function showAlert(message, type) {
+    const container = document.getElementById('alertContainer');
+    const alert = document.createElement('div');
+    alert.className = `alert alert-${type}`;
+    alert.innerHTML = `
+        <i class="fas fa-${type === 'success' ? 'check-circle' : 'exclamation-circle'}"></i>
+        <span>${message}</span>
+    `;
+    container.appendChild(alert);
+    setTimeout(() => alert.remove(), 5000);
+}
@@ -0,0 +1,223 @@
+function openDepositModal() {
+    document.getElementById('depositModal').style.display = 'block';
+}
+
+function closeDepositModal() {
+    document.getElementById('depositModal').style.display = 'none';
+    document.getElementById('depositForm').reset();
+    document.getElementById('depositMessage').style.display = 'none';
+}
+
+// Close modal on outside click
+window.onclick = function(event) {
+    const depositModal = document.getElementById('depositModal');
+    const withdrawModal = document.getElementById('withdrawModal');
+    if (event.target == depositModal) {
+        closeDepositModal();
+    }
+    if (event.target == withdrawModal) {
+        closeWithdrawModal();
+    }
+}
+
+// Handle deposit form submission
+document.getElementById('depositForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const formData = new FormData(e.target);
+    const messageDiv = document.getElementById('depositMessage');
+
+    try {
+        messageDiv.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Processing deposit...';
+        messageDiv.style.display = 'block';
+        messageDiv.style.background = '#cfe2ff';
+        messageDiv.style.color = '#084298';
+
+        const response = await fetch('/member/deposit', {
+            method: 'POST',
+            body: formData
+        });
+
+        const data = await response.json();
+
+        if (data.ok) {
+            const depositAmount = parseFloat(formData.get('amount'));
+            const newBalance = depositAmount;
+
+            messageDiv.innerHTML = `
+                <div style="text-align: center;">
+                    <i class="fas fa-check-circle" style="font-size: 2rem; color: #27ae60; display: block; margin-bottom: 0.5rem;"></i>
+                    <strong style="font-size: 1.1rem; display: block; margin-bottom: 0.5rem;">Success!</strong>
+                    <p style="margin-bottom: 1rem; font-size: 0.95rem;">Deposit of <strong>₹${depositAmount.toFixed(2)}</strong> processed successfully.</p>
+                    <div style="background: #f0f8f4; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem; border-left: 4px solid #27ae60;">
+                        <p style="font-size: 0.85rem; margin: 0 0 0.3rem 0; color: #666;">Updated Balance</p>
+                        <p style="font-size: 1.8rem; font-weight: 700; margin: 0; color: #27ae60;">₹${newBalance.toFixed(2)}</p>
+                    </div>
+                    <p style="font-size: 0.9rem; color: #666;">Redirecting to dashboard...</p>
+                </div>
+            `;
+            messageDiv.style.background = '#d4edda';
+            messageDiv.style.color = '#155724';
+            messageDiv.style.padding = '1.5rem';
+            messageDiv.style.textAlign = 'center';
+            setTimeout(() => {
+                window.location.reload();
+            }, 3000);
+        } else {
+            messageDiv.innerHTML = '<i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ' + (data.error || 'Failed to process deposit');
+            messageDiv.style.background = '#f8d7da';
+            messageDiv.style.color = '#721c24';
+        }
+    } catch (error) {
+        messageDiv.innerHTML = '<i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ' + error.message;
+        messageDiv.style.background = '#f8d7da';
+        messageDiv.style.color = '#721c24';
+    }
+});
+
+function showInsufficientBalanceNotification() {
+    const notification = document.createElement('div');
+    notification.style.cssText = `
+        position: fixed;
+        top: 50%;
+        left: 50%;
+        transform: translate(-50%, -50%);
+        z-index: 2000;
+        background: white;
+        border-radius: 1rem;
+        padding: 2rem;
+        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
+        max-width: 450px;
+        width: 90%;
+        animation: slideUp 0.4s ease-out;
+        border-left: 5px solid #e74c3c;
+    `;
+
+    const currentBalance = ACCOUNT_BALANCE;
+
+    notification.innerHTML = `
+        <div style="text-align: center;">
+            <div style="font-size: 3.5rem; margin-bottom: 1rem; color: #e74c3c; animation: pulse 1s infinite;">
+                <i class="fas fa-wallet"></i>
+            </div>
+            <h2 style="color: #2c3e50; font-size: 1.3rem; margin-bottom: 0.5rem; font-weight: 700;">
+                Insufficient Balance
+            </h2>
+            <p style="color: #7f8c8d; font-size: 0.95rem; margin-bottom: 1.5rem; line-height: 1.6;">
+                Your current balance is <strong style="color: #e74c3c; font-size: 1.1rem;">₹${currentBalance.toFixed(2)}</strong>. 
+                You need funds in your account to withdraw.
+            </p>
+
+            <div style="background: #f8f9fa; padding: 1rem; border-radius: 0.7rem; margin-bottom: 1.5rem;">
+                <p style="color: #666; font-size: 0.85rem; margin: 0 0 0.5rem 0;">Current Account Balance</p>
+                <p style="font-size: 1.8rem; font-weight: 700; color: #27ae60; margin: 0;">
+                    ₹${currentBalance.toFixed(2)}
+                </p>
+            </div>
+
+            <div style="display: flex; gap: 1rem;">
+                <button onclick="this.parentElement.parentElement.parentElement.remove(); openDepositModal();" 
+                        style="flex: 1; background: linear-gradient(135deg, #27ae60 0%, #229954 100%); color: white; 
+                                padding: 0.9rem; border: none; border-radius: 0.5rem; cursor: pointer; font-weight: 600; 
+                                font-size: 0.95rem; transition: all 0.3s; box-shadow: 0 4px 12px rgba(39, 174, 96, 0.3);">
+                    <i class="fas fa-plus-circle"></i> Make a Deposit
+                </button>
+                <button onclick="this.parentElement.parentElement.parentElement.remove();" 
+                        style="flex: 1; background: #e0e0e0; color: #333; padding: 0.9rem; border: none; 
+                                border-radius: 0.5rem; cursor: pointer; font-weight: 600; font-size: 0.95rem; 
+                                transition: all 0.3s;">
+                    <i class="fas fa-times"></i> Close
+                </button>
+            </div>
+        </div>
+    `;
+
+    // Create overlay
+    const overlay = document.createElement('div');
+    overlay.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background: rgba(0, 0, 0, 0.5);
+        z-index: 1999;
+        animation: fadeIn 0.3s ease-out;
+    `;
+    overlay.onclick = () => {
+        overlay.remove();
+        notification.remove();
+    };
+
+    document.body.appendChild(overlay);
+    document.body.appendChild(notification);
+}
+
+function openWithdrawModal() {
+    if (ACCOUNT_BALANCE <= 0) {
+        showInsufficientBalanceNotification();
+        return;
+    }
+    document.getElementById('withdrawModal').style.display = 'block';
+}
+
+function closeWithdrawModal() {
+    document.getElementById('withdrawModal').style.display = 'none';
+    document.getElementById('withdrawForm').reset();
+    document.getElementById('withdrawMessage').style.display = 'none';
+}
+
+// Handle withdraw form submission
+document.getElementById('withdrawForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const formData = new FormData(e.target);
+    const messageDiv = document.getElementById('withdrawMessage');
+    const withdrawAmount = parseFloat(formData.get('amount'));
+    const currentBalance = ACCOUNT_BALANCE;
+    const newBalance = currentBalance - withdrawAmount;
+
+    try {
+        messageDiv.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Processing withdrawal...';
+        messageDiv.style.display = 'block';
+        messageDiv.style.background = '#cfe2ff';
+        messageDiv.style.color = '#084298';
+
+        const response = await fetch('/member/withdraw', {
+            method: 'POST',
+            body: formData
+        });
+
+        const data = await response.json();
+
+        if (data.ok) {
+            messageDiv.innerHTML = `
+                <div style="text-align: center;">
+                    <i class="fas fa-check-circle" style="font-size: 2rem; color: #27ae60; display: block; margin-bottom: 0.5rem;"></i>
+                    <strong style="font-size: 1.1rem; display: block; margin-bottom: 0.5rem;">Success!</strong>
+                    <p style="margin-bottom: 1rem; font-size: 0.95rem;">Withdrawal of <strong>₹${withdrawAmount.toFixed(2)}</strong> processed successfully.</p>
+                    <div style="background: #f0f8f4; padding: 1rem; border-radius: 0.5rem; margin-bottom: 1rem; border-left: 4px solid #27ae60;">
+                        <p style="font-size: 0.85rem; margin: 0 0 0.3rem 0; color: #666;">Updated Balance</p>
+                        <p style="font-size: 1.8rem; font-weight: 700; margin: 0; color: #27ae60;">₹${newBalance.toFixed(2)}</p>
+                    </div>
+                    <p style="font-size: 0.9rem; color: #666;">Redirecting to dashboard...</p>
+                </div>
+            `;
+            messageDiv.style.background = '#d4edda';
+            messageDiv.style.color = '#155724';
+            messageDiv.style.padding = '1.5rem';
+            messageDiv.style.textAlign = 'center';
+            setTimeout(() => {
+                window.location.reload();
+            }, 3000);
+        } else {
+            messageDiv.innerHTML = '<i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ' + (data.error || 'Failed to process withdrawal');
+            messageDiv.style.background = '#f8d7da';
+            messageDiv.style.color = '#721c24';
+        }
+    } catch (error) {
+        messageDiv.innerHTML = '<i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ' + error.message;
+        messageDiv.style.background = '#f8d7da';
+        messageDiv.style.color = '#721c24';
+    }
+});
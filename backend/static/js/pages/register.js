@@ -0,0 +1,90 @@
+// Show inline error message function
+function showFieldError(fieldId, show = true) {
+    const errorElement = document.getElementById(fieldId + '-error');
+    if (errorElement) {
+        if (show) {
+            errorElement.classList.add('show');
+            setTimeout(() => {
+                errorElement.classList.remove('show');
+            }, 2000);
+        } else {
+            errorElement.classList.remove('show');
+        }
+    }
+}
+
+// Auto-fill application date with today's date and set DOB max date
+document.addEventListener('DOMContentLoaded', function() {
+    const today = new Date();
+    const year = today.getFullYear();
+    const month = String(today.getMonth() + 1).padStart(2, '0');
+    const day = String(today.getDate()).padStart(2, '0');
+    const dateString = `${year}-${month}-${day}`;
+
+    // Set application date
+    document.getElementById('app_date').value = dateString;
+
+    // Set max date for DOB to today (no future dates)
+    document.getElementById('dob').max = dateString;
+});
+
+// Allow only numbers for mobile number (exactly 10 digits)
+document.getElementById('mobile').addEventListener('input', function(e) {
+    const oldValue = e.target.value;
+    const newValue = oldValue.replace(/[^0-9]/g, '').slice(0, 10);
+
+    if (oldValue !== newValue && oldValue.length > 0) {
+        showFieldError('mobile');
+    }
+
+    e.target.value = newValue;
+});
+
+// Allow only numbers for Aadhaar (exactly 12 digits)
+document.getElementById('aadhaar').addEventListener('input', function(e) {
+    const oldValue = e.target.value;
+    const newValue = oldValue.replace(/[^0-9]/g, '').slice(0, 12);
+
+    if (oldValue !== newValue && oldValue.length > 0) {
+        showFieldError('aadhaar');
+    }
+
+    e.target.value = newValue;
+});
+
+// Auto-uppercase PAN input and enforce format
+document.getElementById('pan').addEventListener('input', function(e) {
+    const oldValue = e.target.value;
+    const upperValue = oldValue.toUpperCase();
+    let validValue = '';
+
+    // Build valid PAN character by character
+    for (let i = 0; i < Math.min(upperValue.length, 10); i++) {
+        const char = upperValue[i];
+
+        if (i < 5) {
+            // First 5 positions: only letters (A-Z)
+            if (/[A-Z]/.test(char)) {
+                validValue += char;
+            } else {
+                showFieldError('pan');
+            }
+        } else if (i < 9) {
+            // Positions 6-9: only digits (0-9)
+            if (/[0-9]/.test(char)) {
+                validValue += char;
+            } else {
+                showFieldError('pan');
+            }
+        } else {
+            // Position 10: only letter (A-Z)
+            if (/[A-Z]/.test(char)) {
+                validValue += char;
+            } else {
+                showFieldError('pan');
+            }
+        }
+    }
+
+    e.target.value = validValue;
+});
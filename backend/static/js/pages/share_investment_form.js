@@ -0,0 +1,48 @@
+function goBack() {
+    window.history.back();
+}
+
+function calculateTotal() {
+    const quantity = parseFloat(document.querySelector('input[name="quantity"]').value) || 0;
+    const amountPerShare = parseFloat(document.querySelector('input[name="amount_per_share"]').value) || 0;
+    const total = quantity * amountPerShare;
+    document.getElementById('totalAmount').value = total;
+}
+
+document.getElementById('shareForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const formData = new FormData(e.target);
+    const messageDiv = document.getElementById('message');
+    const infoAlert = document.getElementById('infoAlert');
+
+    // Hide info alert
+    infoAlert.style.display = 'none';
+
+    try {
+        messageDiv.innerHTML = '<div class="alert alert-info"><i class="fas fa-spinner fa-spin"></i> Processing your application...</div>';
+
+        const response = await fetch('/member/invest-shares', { 
+            method: 'POST', 
+            body: formData 
+        });
+
+        const data = await response.json();
+
+        if(data.ok) {
+            messageDiv.innerHTML = '<div class="alert alert-success"><i class="fas fa-check-circle"></i> <strong>Success!</strong> Your share investment application has been submitted. Redirecting to dashboard...</div>';
+            setTimeout(() => window.location.href = '/member-dashboard', 2500);
+        } else {
+            messageDiv.innerHTML = `<div class="alert alert-error"><i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ${data.error || 'Failed to submit application'}</div>`;
+            infoAlert.style.display = 'block';
+        }
+    } catch(error) {
+        messageDiv.innerHTML = `<div class="alert alert-error"><i class="fas fa-exclamation-circle"></i> <strong>Error:</strong> ${error.message}</div>`;
+        infoAlert.style.display = 'block';
+    }
+});
+
+// Initialize total on page load
+window.addEventListener('load', () => {
+    calculateTotal();
+});
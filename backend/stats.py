@@ -0,0 +1,76 @@
+"""
+Counters for the admin dashboards.
+
+counts() runs one grouped aggregate per table: members GROUP BY
+is_approved, and loans, deposits and shares GROUP BY status. Every status
+count comes from a single indexed pass, so no page has to load rows or run
+one COUNT per status. The result is cached for STATS_CACHE_SECONDS. A
+session that inserts, updates or deletes a member, loan, deposit or share
+drops the cache when it commits, so an admin sees their own approvals at
+once.
+"""
+import os
+import time
+
+from sqlalchemy import func, select
+
+import invalidation
+import models
+
+STATS_CACHE_SECONDS = float(os.getenv('STATS_CACHE_SECONDS', 30))
+
+# Counter name -> model counted GROUP BY status
+PRODUCTS = {
+    'loans': models.Loan,
+    'deposits': models.Deposit,
+    'shares': models.Share,
+}
+STATUSES = ('Pending', 'Approved', 'Rejected')
+
+_cache = invalidation.GenerationCache()  # one entry, under None: (expires_at, counts)
+
+
+def _by_status(db, model):
+    by_status = dict.fromkeys(STATUSES, 0)
+    for status, count in db.execute(select(model.status, func.count()).group_by(model.status)):
+        by_status[status or 'Pending'] = by_status.get(status or 'Pending', 0) + count
+    by_status['total'] = sum(by_status.values())
+    return by_status
+
+
+def _query(db):
+    approval = dict(db.execute(
+        select(models.Member.is_approved, func.count()).group_by(models.Member.is_approved)
+    ).all())
+    members = {
+        'total': sum(approval.values()),
+        'approved': approval.get(True, 0),
+        'pending': approval.get(False, 0),
+    }
+    return {'members': members, **{name: _by_status(db, model) for name, model in PRODUCTS.items()}}
+
+
+def counts(db):
+    """{'members': {'total', 'approved', 'pending'}, 'loans'/'deposits'/'shares': {status: count, 'total'}}."""
+    now = time.monotonic()
+    cached = _cache.get(None)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    generation = _cache.generation(None)
+    result = _query(db)
+    _cache.put(None, (now + STATS_CACHE_SECONDS, result), generation)
+    return result
+
+
+def invalidate():
+    _cache.invalidate(None)
+
+
+_COUNTED = (models.Member, *PRODUCTS.values())
+
+
+def _counters_changed(session, objects):
+    return {None} if any(isinstance(obj, _COUNTED) for obj in objects) else ()
+
+
+invalidation.track('stats_changed', _counters_changed, lambda keys: invalidate())
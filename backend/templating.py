@@ -0,0 +1,60 @@
+"""
+Jinja environment for the HTML pages.
+
+Compiling a template (parse, then generate and compile Python code) costs
+far more than rendering it. Compiled bytecode is therefore kept in
+TEMPLATE_CACHE_DIR. A new worker, or one restarted after a deploy, loads the
+bytecode instead of recompiling. Entries are keyed by template name and
+checked against the source's modification time, so an edited template is
+recompiled. precompile() loads every template at startup, so no request
+pays the compile cost.
+
+With TEMPLATE_AUTO_RELOAD=true (the default, for development) every render
+stats the template file to pick up edits. Production should set it to
+false: templates then stay in memory once loaded.
+"""
+import os
+
+import jinja2
+
+import assets
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+TEMPLATE_CACHE_DIR = os.getenv(
+    'TEMPLATE_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'instance', 'template_cache')
+)
+TEMPLATE_AUTO_RELOAD = os.getenv('TEMPLATE_AUTO_RELOAD', 'true').lower() == 'true'
+
+
+def strftime_filter(dt, format_string):
+    if dt:
+        return dt.strftime(format_string)
+    return ''
+
+
+def build_environment(cache_dir=TEMPLATE_CACHE_DIR, auto_reload=TEMPLATE_AUTO_RELOAD):
+    """The pages' environment, with a bytecode cache in ``cache_dir`` (none if it is None)."""
+    bytecode_cache = None
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(cache_dir)
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        auto_reload=auto_reload,
+        bytecode_cache=bytecode_cache,
+        # Keep every template once loaded; the default (400) would also do
+        # today, but a miss recompiles or reloads bytecode
+        cache_size=-1,
+    )
+    env.globals['asset_url'] = assets.asset_url
+    env.filters['strftime'] = strftime_filter
+    return env
+
+
+def precompile(env):
+    """Load (and so compile or read the bytecode of) every template; returns how many."""
+    names = env.list_templates(extensions=['html'])
+    for name in names:
+        env.get_template(name)
+    return len(names)